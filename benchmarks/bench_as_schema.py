@@ -0,0 +1,119 @@
+"""Benchmark converting many records to dataclasses.
+
+Compares the previous ``as_schema`` body (``dataclasses.fields`` on
+every call, top-level fields only) with the plan-cached conversion
+behind ``as_schema``, per record and through ``as_schema_many``. Both
+per-record variants are called as plain functions, without the
+``obj._`` proxy. The nested case also converts a sub-record per item,
+which the previous version left as an RNS node.
+
+Run: python benchmarks/bench_as_schema.py [n_records] [repeat]
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import sys
+import time
+from typing import List, Optional
+
+from recursivenamespace import RNS, schema
+
+
+@dataclasses.dataclass
+class Limits:
+    rps: int
+    burst: int
+
+
+@dataclasses.dataclass
+class Flat:
+    id: int
+    name: str
+    email: str
+    active: bool
+    score: float
+
+
+@dataclasses.dataclass
+class Nested:
+    id: int
+    name: str
+    limits: Limits
+    tags: List[str]
+    parent: Optional[Limits] = None
+
+
+def previous_as_schema(rns_ins: RNS, schema_cls: type, **kwargs):
+    for field in dataclasses.fields(schema_cls):
+        kwargs[field.name] = rns_ins[field.name]
+    return schema_cls(**kwargs)
+
+
+def convert_each(convert, records: list, cls: type) -> list:
+    return [convert(r, cls) for r in records]
+
+
+def timed(label: str, func, n: int, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<22} {n / elapsed / 1e3:9.0f} k records/s")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    flat = [
+        RNS(
+            {
+                "id": i,
+                "name": f"u{i}",
+                "email": f"u{i}@x",
+                "active": True,
+                "score": 0.5,
+            }
+        )
+        for i in range(n)
+    ]
+    nested = [
+        RNS(
+            {
+                "id": i,
+                "name": f"u{i}",
+                "limits": {"rps": i, "burst": 1},
+                "tags": ["a"],
+                "parent": None,
+            }
+        )
+        for i in range(n)
+    ]
+    for label, records, cls in (
+        ("flat", flat, Flat),
+        ("nested", nested, Nested),
+    ):
+        print(f"{label} ({n} records):")
+        timed(
+            "previous as_schema",
+            functools.partial(convert_each, previous_as_schema, records, cls),
+            n,
+            repeat,
+        )
+        timed(
+            "as_schema",
+            functools.partial(convert_each, schema.to_dataclass, records, cls),
+            n,
+            repeat,
+        )
+        timed(
+            "as_schema_many",
+            functools.partial(RNS.as_schema_many, records, cls),
+            n,
+            repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
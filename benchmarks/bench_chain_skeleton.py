@@ -0,0 +1,76 @@
+"""Benchmark @rns.rns(use_chain_key=True) with compiled skeletons.
+
+The decorated functions follow examples/advanced/09_decorator_usage.py:
+a config builder returning ``KV_Pair`` chain keys, and a listing with
+array keys. The previous decorator body ran ``val_set`` for every pair
+on every call. The decorator now compiles the repeated key sequence
+into a skeleton and only fills in the values.
+
+Run: python benchmarks/bench_chain_skeleton.py [n_calls] [repeat]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from recursivenamespace import RNS, rns
+from recursivenamespace.utils import KV_Pair
+
+
+def build_config(port: int) -> list:
+    return [
+        KV_Pair("app.name", "MyApp"),
+        KV_Pair("app.version", "1.0"),
+        KV_Pair("app.debug", False),
+        KV_Pair("db.host", "localhost"),
+        KV_Pair("db.port", port),
+        KV_Pair("db.pool.size", 10),
+        KV_Pair("db.pool.timeout", 1.5),
+        KV_Pair("cache.ttl", 300),
+    ]
+
+
+def build_listing(port: int) -> list:
+    pairs = []
+    for i in range(4):
+        pairs.append(KV_Pair("servers[].#.host", f"s{i}"))
+        pairs.append(KV_Pair(f"servers[].{i}.port", port + i))
+    pairs.append(KV_Pair("tags[].#", "web"))
+    return pairs
+
+
+def previous_decorator(func):
+    def create_rns(*args):
+        ret = RNS(None, [], False)
+        for key, value in func(*args):
+            ret._.val_set(key, value)
+        return ret
+
+    return create_rns
+
+
+def timed(label: str, func, n: int, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for i in range(n):
+            func(i)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<22} {n / elapsed / 1e3:9.1f} k calls/s")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    for func in (build_config, build_listing):
+        previous = previous_decorator(func)
+        current = rns.rns(use_chain_key=True)(func)
+        for i in range(3):
+            assert current(i) == previous(i)
+        print(f"{func.__name__} ({n} calls):")
+        timed("val_set per pair", previous, n, repeat)
+        timed("compiled skeleton", current, n, repeat)
+
+
+if __name__ == "__main__":
+    main()
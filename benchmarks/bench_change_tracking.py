@@ -0,0 +1,53 @@
+"""Benchmark the overhead of change tracking on writes.
+
+Run: python benchmarks/bench_change_tracking.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from recursivenamespace import RNS
+
+
+def build_config() -> RNS:
+    return RNS(
+        {
+            "app": {"name": "test", "version": "1.0"},
+            "db": {"host": "localhost", "pool": {"size": 5, "timeout": 30}},
+            "features": ["a", "b", "c"],
+        }
+    )
+
+
+def bench_writes(ns: RNS, n: int) -> dict:
+    return {
+        "setitem": timeit.timeit(lambda: ns.__setitem__("x", 1), number=n),
+        "val_set (3-deep)": timeit.timeit(
+            lambda: ns._.val_set("db.pool.size", 10), number=n
+        ),
+        "val_set array": timeit.timeit(
+            lambda: ns._.val_set("features[].0", "z"), number=n
+        ),
+    }
+
+
+def main() -> None:
+    n = 50_000
+    print(f"Benchmarking with {n:,} iterations each\n")
+
+    baseline = bench_writes(build_config(), n)
+
+    tracked = build_config()
+    tracked._.track_changes()
+    with_tracking = bench_writes(tracked, n)
+
+    print(f"{'operation':25s}  {'off':>10s}  {'on':>10s}  overhead")
+    for name, off in baseline.items():
+        on = with_tracking[name]
+        print(f"{name:25s}  {off:9.4f}s  {on:9.4f}s  {on / off - 1:+.0%}")
+    print(f"\nJournal after run: {tracked._.checkpoint()}")
+
+
+if __name__ == "__main__":
+    main()
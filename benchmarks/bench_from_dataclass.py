@@ -0,0 +1,82 @@
+"""Benchmark building RNS trees from dataclass instances.
+
+Compares ``RNS(dataclasses.asdict(obj))``, the previous decorator path,
+which deep-copies the instance into dicts and then walks them again,
+with ``RNS.from_dataclass``, which reads the fields into nodes in one
+pass.
+
+Run: python benchmarks/bench_from_dataclass.py [n_records] [repeat]
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+import time
+from typing import List
+
+from recursivenamespace import RNS
+
+
+@dataclasses.dataclass
+class Limits:
+    rps: int
+    burst: int
+
+
+@dataclasses.dataclass
+class Line:
+    sku: str
+    qty: int
+    price: float
+
+
+@dataclasses.dataclass
+class Order:
+    id: int
+    customer: str
+    limits: Limits
+    tags: List[str]
+    lines: List[Line]
+
+
+def make_order(i: int) -> Order:
+    return Order(
+        id=i,
+        customer=f"c{i}",
+        limits=Limits(i, 10),
+        tags=["a", "b"],
+        lines=[Line(f"s{j}", j, 1.5) for j in range(3)],
+    )
+
+
+def timed(label: str, func, n: int, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<22} {n / elapsed / 1e3:9.1f} k records/s")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    orders = [make_order(i) for i in range(n)]
+    assert RNS.from_dataclass(orders[0]) == RNS(dataclasses.asdict(orders[0]))
+    print(f"{n} orders:")
+    timed(
+        "RNS(asdict(obj))",
+        lambda: [RNS(dataclasses.asdict(o)) for o in orders],
+        n,
+        repeat,
+    )
+    timed(
+        "from_dataclass",
+        lambda: [RNS.from_dataclass(o) for o in orders],
+        n,
+        repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark building a tree from prefixed environment variables.
+
+Compares one ``val_set`` per variable (each parsing its own chain key)
+with ``RNS.from_env``, which scans the mapping once and builds the
+nodes in the same pass.
+
+Run: python benchmarks/bench_from_env.py [n_vars] [repeat]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from recursivenamespace import RNS
+
+
+def make_environ(n: int) -> dict:
+    environ = {f"PATH_{i}": "/usr/bin" for i in range(50)}
+    for i in range(n):
+        section, field = divmod(i, 4)
+        environ[f"APP__SVC{section}__POOL__F{field}"] = str(i)
+    return environ
+
+
+def via_val_set(environ: dict) -> RNS:
+    cfg = RNS()
+    for name, value in environ.items():
+        if name.startswith("APP__"):
+            key = name[5:].lower().replace("__", ".")
+            cfg._.val_set(key, int(value) if value.isdigit() else value)
+    return cfg
+
+
+def timed(label: str, func, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    per_call = (time.perf_counter() - start) / repeat
+    print(f"  {label:<20} {per_call * 1e3:9.3f} ms/call")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    environ = make_environ(n)
+    expected = via_val_set(environ)._.to_dict()
+    assert RNS.from_env(environ=environ)._.to_dict() == expected
+    print(f"{n} APP__ variables:")
+    timed("val_set per variable", lambda: via_val_set(environ), repeat)
+    timed("from_env", lambda: RNS.from_env(environ=environ), repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark single-pass JSON decoding in ``RNS.from_json``.
+
+Compares the old two-pass route (``json.loads`` to a dict tree, then
+``RNS(data)`` walking it again) with ``RNS.from_json``, which builds
+nodes inside the decoder through ``object_pairs_hook``. Reports best
+wall time and peak traced memory on a synthetic document.
+
+Run: python benchmarks/bench_json_decode.py [n_records]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+
+from recursivenamespace import RNS
+
+
+def make_document(n: int) -> str:
+    return json.dumps(
+        {
+            "records": [
+                {
+                    "id": i,
+                    "name": f"record-{i}",
+                    "tags": ["a", "b"],
+                    "owner": {"id": i % 97, "team": {"name": "core"}},
+                }
+                for i in range(n)
+            ],
+            "meta": {"count": n},
+        }
+    )
+
+
+def two_pass(text: str) -> RNS:
+    return RNS(json.loads(text))
+
+
+def best_time(func, text: str, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func, text: str) -> float:
+    tracemalloc.start()
+    result = func(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 2**20
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    text = make_document(n)
+    print(f"document: {len(text) / 2**20:.1f} MiB, {n:,} records")
+    base_t, base_m = best_time(two_pass, text), peak_memory(two_pass, text)
+    fast_t = best_time(RNS.from_json, text)
+    fast_m = peak_memory(RNS.from_json, text)
+    print(f"  two-pass json.loads + RNS()  {base_t:7.3f} s  {base_m:8.1f} MiB")
+    print(f"  RNS.from_json (single pass)  {fast_t:7.3f} s  {fast_m:8.1f} MiB")
+    print(
+        f"  time -{(1 - fast_t / base_t) * 100:.0f}%,"
+        f" peak memory -{(1 - fast_m / base_m) * 100:.0f}%"
+    )
+
+
+if __name__ == "__main__":
+    main()
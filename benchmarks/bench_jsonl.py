@@ -0,0 +1,73 @@
+"""Benchmark JSON Lines throughput in records per second.
+
+Writes N synthetic event records with ``RNS.write_jsonl`` and reads them
+back with ``RNS.iter_jsonl`` (whole records and with ``select=``),
+next to the hand-written ``for line in f: RNS.from_json(line)`` loop.
+
+Run: python benchmarks/bench_jsonl.py [n_records]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from recursivenamespace import RNS
+
+
+def make_records(n: int) -> list:
+    return [
+        RNS(
+            {
+                "seq": i,
+                "type": "click",
+                "user": {"id": i % 1000, "name": f"user-{i % 1000}"},
+                "context": {"ip": "10.0.0.1", "tags": ["a", "b", "c"]},
+            }
+        )
+        for i in range(n)
+    ]
+
+
+def report(label: str, n: int, elapsed: float) -> None:
+    print(f"  {label:<32} {n / elapsed:12,.0f} records/s")
+
+
+def naive_read(path: Path) -> int:
+    count = 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            RNS.from_json(line)
+            count += 1
+    return count
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    records = make_records(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "events.jsonl"
+
+        start = time.perf_counter()
+        RNS.write_jsonl(records, path)
+        report("write_jsonl", n, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        naive_read(path)
+        report("loop over RNS.from_json", n, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in RNS.iter_jsonl(path):
+            pass
+        report("iter_jsonl", n, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in RNS.iter_jsonl(path, select=["user.id"]):
+            pass
+        report("iter_jsonl(select=['user.id'])", n, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
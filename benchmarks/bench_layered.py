@@ -0,0 +1,82 @@
+"""Benchmark a four-layer config stack: lookups and single-layer changes.
+
+Compares today's pattern (deep-copy the defaults, ``val_set`` every
+flattened key of each higher layer, ``val_get`` on the result, and
+redo it all on every change) with ``RNS.layered``, which answers
+lookups from its cache and re-merges only the written path.
+
+Run: python benchmarks/bench_layered.py [n_sections] [repeat]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from recursivenamespace import RNS
+
+
+def make_layers(n: int) -> list:
+    defaults = RNS(
+        {
+            f"s{i}": {"enabled": False, "limits": {"rps": 100, "burst": 10}}
+            for i in range(n)
+        }
+    )
+    site = RNS({f"s{i}": {"enabled": True} for i in range(0, n, 2)})
+    env = RNS({f"s{i}": {"limits": {"rps": 500}} for i in range(0, n, 5)})
+    cli = RNS({"s0": {"limits": {"burst": 1}}})
+    return [defaults, site, env, cli]
+
+
+def merge_by_copy(layers: list) -> RNS:
+    merged = layers[0]._.deepcopy()
+    for layer in layers[1:]:
+        for key, value in layer._.to_dict(flatten_sep=".").items():
+            merged._.val_set(key, value)
+    return merged
+
+
+def timed(label: str, func, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    per_call = (time.perf_counter() - start) / repeat
+    print(f"  {label:<34} {per_call * 1e6:11.2f} us/call")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    layers = make_layers(n)
+    keys = [f"s{i}.limits.rps" for i in range(0, n, 7)]
+
+    merged = merge_by_copy(layers)
+    stack = RNS.layered(layers)
+
+    print(f"{len(keys)} lookups:")
+    timed(
+        "val_get on copied merge",
+        lambda: [merged._.val_get(k) for k in keys],
+        repeat,
+    )
+    stack.val_get(keys[0])
+    timed(
+        "LayeredRNS.val_get (cached)",
+        lambda: [stack.val_get(k) for k in keys],
+        repeat,
+    )
+
+    counter = iter(range(10**9))
+    print("one env value changes:")
+    timed("full re-merge", lambda: merge_by_copy(layers), repeat)
+    timed(
+        "LayeredRNS (incremental)",
+        lambda: layers[2]._.val_set("s5.limits.rps", next(counter)),
+        repeat * 50,
+    )
+    assert stack.val_get("s5.limits.rps") == layers[2].s5.limits.rps
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark repeated loads of one unchanged config file.
+
+Compares plain ``load_toml`` / ``load_json`` (parse every time) with
+``cached=True`` (one stat plus a copy of the cached tree) and
+``cached=True, frozen=True`` (one stat, the shared tree itself).
+
+Run: python benchmarks/bench_load_cache.py [n_sections] [repeat]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+from recursivenamespace import RNS, load_cache
+
+
+def make_tree(n: int) -> RNS:
+    return RNS(
+        {
+            "app": {"name": "svc", "debug": False},
+            "sections": {
+                f"s{i}": {
+                    "enabled": i % 2 == 0,
+                    "hosts": [f"10.0.0.{j}" for j in range(4)],
+                    "limits": {"rps": 100 + i, "burst": 10},
+                }
+                for i in range(n)
+            },
+        }
+    )
+
+
+def timed(label: str, func, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    per_call = (time.perf_counter() - start) / repeat
+    print(f"  {label:<28} {per_call * 1e3:9.3f} ms/call")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    tree = make_tree(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix, save, load in (
+            (".toml", tree._.save_toml, RNS.load_toml),
+            (".json", tree._.save_json, RNS.load_json),
+        ):
+            path = Path(tmp) / f"settings{suffix}"
+            save(path)
+            load_cache.clear()
+            print(f"{path.name}: {path.stat().st_size / 1024:.0f} KiB")
+            timed("uncached", partial(load, path), repeat)
+            timed("cached (copy)", partial(load, path, cached=True), repeat)
+            timed(
+                "cached (frozen)",
+                partial(load, path, cached=True, frozen=True),
+                repeat,
+            )
+            print(f"  {load_cache.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark load_many scaling on a synthetic per-tenant corpus.
+
+Writes N small JSON configs to a temporary directory, then compares a
+sequential ``RNS.load_json`` loop against ``RNS.load_many`` with the
+thread and process executors at increasing worker counts (up to the
+CPU count).
+
+Run: python benchmarks/bench_load_many.py [n_files]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from recursivenamespace import RNS
+
+
+def write_corpus(root: Path, n: int) -> list:
+    paths = []
+    for i in range(n):
+        data = {
+            "tenant": {"id": i, "name": f"tenant-{i}", "active": i % 2 == 0},
+            "limits": {"rps": 100 + i, "burst": 10, "quota_mb": 512},
+            "features": [f"feature_{j}" for j in range(10)],
+            "endpoints": [
+                {"name": f"ep{j}", "url": f"https://t{i}.example/{j}"}
+                for j in range(5)
+            ],
+        }
+        path = root / f"tenant_{i:05d}.json"
+        path.write_text(json.dumps(data))
+        paths.append(path)
+    return paths
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def sequential(paths: list) -> None:
+    for p in paths:
+        RNS.load_json(p)
+
+
+def worker_counts() -> list:
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(Path(tmp), n)
+        print(f"Corpus: {n:,} files, {os.cpu_count()} CPU(s)\n")
+
+        base = timed(sequential, paths)
+        print(
+            f"{'sequential load_json':28s}  {base:7.3f}s  {n / base:9,.0f} files/s"
+        )
+
+        for executor in ("thread", "process"):
+            for workers in worker_counts():
+                t = timed(
+                    RNS.load_many, paths, workers=workers, executor=executor
+                )
+                label = f"load_many {executor} x{workers}"
+                print(
+                    f"{label:28s}  {t:7.3f}s  {n / t:9,.0f} files/s"
+                    f"  speedup {base / t:4.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
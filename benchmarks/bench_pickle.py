@@ -0,0 +1,69 @@
+"""Benchmark pickling an RNS tree, as done for multiprocessing transfer.
+
+Compares the compact ``__reduce__`` (shared tree config plus user data)
+against the previous ``SimpleNamespace`` form, which wrote every node's
+full ``__dict__`` including its protected-key set.
+
+Run: python benchmarks/bench_pickle.py [n_services]
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import time
+
+from recursivenamespace import RNS
+from recursivenamespace.main import recursivenamespace
+
+
+def make_tree(n: int) -> RNS:
+    return RNS(
+        {
+            "services": {
+                f"svc{i}": {
+                    "port": 8000 + i,
+                    "hosts": [f"10.0.{i % 250}.{j}" for j in range(4)],
+                    "limits": {"rps": 100, "burst": 10, "enabled": True},
+                }
+                for i in range(n)
+            }
+        }
+    )
+
+
+def legacy_reduce(self):
+    return (self.__class__, (), dict(self.__dict__))
+
+
+def measure(label: str, tree: RNS, repeat: int = 3) -> None:
+    best_dump = best_load = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+        best_dump = min(best_dump, time.perf_counter() - start)
+        start = time.perf_counter()
+        pickle.loads(payload)
+        best_load = min(best_load, time.perf_counter() - start)
+    print(
+        f"  {label:<10} size {len(payload) / 2**20:7.2f} MiB"
+        f"  dumps {best_dump:7.3f} s  loads {best_load:7.3f} s"
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    tree = make_tree(n)
+    print(f"tree: {n} services, {2 * n + 2} nodes")
+
+    compact = recursivenamespace.__reduce__
+    recursivenamespace.__reduce__ = legacy_reduce  # type: ignore[method-assign]
+    try:
+        measure("legacy", tree)
+    finally:
+        recursivenamespace.__reduce__ = compact  # type: ignore[method-assign]
+    measure("compact", tree)
+
+
+if __name__ == "__main__":
+    main()
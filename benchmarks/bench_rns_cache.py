@@ -0,0 +1,51 @@
+"""Benchmark the @rns.rns() decorator with and without ``cache=N``.
+
+A config provider is called repeatedly with a few distinct arguments.
+Without the cache, every call builds a new tree. With ``cache=N``, a
+hit returns the shared frozen tree, or a cheap clone of it with
+``freeze=False``.
+
+Run: python benchmarks/bench_rns_cache.py [n_calls] [repeat]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from recursivenamespace import rns
+
+
+def settings(env: str) -> dict:
+    return {
+        "env": env,
+        "db": {"host": f"db.{env}", "port": 5432, "pool": {"size": 10}},
+        "features": {f"flag{i}": i % 2 == 0 for i in range(20)},
+        "servers": [{"host": f"s{i}.{env}", "weight": i} for i in range(5)],
+    }
+
+
+def timed(label: str, func, n: int, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for i in range(n):
+            func(("dev", "staging", "prod")[i % 3])
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<22} {n / elapsed / 1e3:9.1f} k calls/s")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    plain = rns.rns()(settings)
+    frozen = rns.rns(cache=16)(settings)
+    copied = rns.rns(cache=16, freeze=False)(settings)
+    assert plain("dev") == copied("dev") == frozen("dev")._.deepcopy()
+    print(f"{n} calls:")
+    timed("no cache", plain, n, repeat)
+    timed("cache, frozen", frozen, n, repeat)
+    timed("cache, freeze=False", copied, n, repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark projection pushdown: ``load_json(select=...)``.
+
+Writes a synthetic JSON export (default ~500 MB) of the shape
+``{"meta": {...}, "data": {"users": [...], "events": [...]}}`` and
+compares loading it whole against loading two chain keys with
+``select=``, reporting time and peak RSS (each case runs in its own
+process; Unix only). Loading a file this size whole needs several GB
+of RAM; pass a smaller size to try it on a laptop.
+
+Run: python benchmarks/bench_select.py [size_mb]
+"""
+
+from __future__ import annotations
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from recursivenamespace import RNS
+
+SELECT = ["meta.request_id", "data.users[].*.id"]
+
+
+def write_fixture(path: Path, size_mb: int) -> None:
+    """~20% of the bytes are users (one field selected each), the rest
+    are events that ``SELECT`` never touches."""
+    target = size_mb * 1024 * 1024
+    user = {"id": 0, "name": "user", "email": "user@example.com"}
+    event = {
+        "type": "click",
+        "payload": {"bio": "x" * 200, "tags": list(range(20))},
+        "context": {"ip": "10.0.0.1", "ua": "Mozilla/5.0", "ok": True},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"meta": {"request_id": "req-1", "host": "h"}, ')
+        f.write('"data": {"users": [')
+        written, i = 0, 0
+        while written < target // 5:
+            user["id"] = i
+            chunk = ("," if i else "") + json.dumps(user)
+            f.write(chunk)
+            written += len(chunk)
+            i += 1
+        f.write('], "events": [')
+        i = 0
+        while written < target:
+            event["seq"] = i
+            chunk = ("," if i else "") + json.dumps(event)
+            f.write(chunk)
+            written += len(chunk)
+            i += 1
+        f.write("]}}")
+
+
+def run_one(mode: str, path: str) -> None:
+    """Child process: load once, print elapsed seconds and peak RSS."""
+    start = time.perf_counter()
+    if mode == "whole":
+        RNS.load_json(path)
+    elif mode == "stream":
+        RNS.load_json_stream(path)
+    else:
+        RNS.load_json(path, select=SELECT)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{elapsed} {peak_kb}")
+
+
+def measure(label: str, mode: str, path: Path) -> None:
+    # A fresh interpreter per case so peak RSS is not shared.
+    out = subprocess.run(
+        [sys.executable, __file__, "--run", mode, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    elapsed, peak_kb = float(out[0]), int(out[1])
+    print(f"  {label:<28} {elapsed:8.2f} s  peak RSS {peak_kb / 1024:8.1f} MiB")
+
+
+def main() -> None:
+    if sys.argv[1:2] == ["--run"]:
+        run_one(sys.argv[2], sys.argv[3])
+        return
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.json"
+        write_fixture(path, size_mb)
+        print(f"fixture: {path.stat().st_size / 2**20:.0f} MiB")
+        print(f"select:  {SELECT}")
+        measure("load_json (whole file)", "whole", path)
+        measure("load_json_stream (whole)", "stream", path)
+        measure("load_json(select=...)", "select", path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark SharedRNS read throughput under a concurrent writer.
+
+Run: python benchmarks/bench_shared_rns.py
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from recursivenamespace import RNS, SharedRNS
+
+
+def build_config() -> RNS:
+    return RNS(
+        {
+            "app": {"name": "test", "version": "1.0"},
+            "db": {"host": "localhost", "pool": {"size": 5, "timeout": 30}},
+        }
+    )
+
+
+def bench_readers(n_threads: int, duration: float = 1.0) -> tuple:
+    shared = SharedRNS(build_config())
+    stop = threading.Event()
+    reads = [0] * n_threads
+    writes = [0]
+
+    def reader(idx: int) -> None:
+        count = 0
+        while not stop.is_set():
+            shared.val_get("db.pool.size")
+            count += 1
+        reads[idx] = count
+
+    def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            i += 1
+            with shared.write() as cfg:
+                cfg._.val_set("db.pool.size", i)
+                cfg._.val_set("db.pool.timeout", i)
+            time.sleep(0.001)
+        writes[0] = i
+
+    threads = [
+        threading.Thread(target=reader, args=(i,)) for i in range(n_threads)
+    ]
+    threads.append(threading.Thread(target=writer))
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(reads) / duration, writes[0] / duration
+
+
+def bench_unlocked_baseline(n: int = 200_000) -> float:
+    ns = build_config()
+    start = time.perf_counter()
+    for _ in range(n):
+        ns._.val_get("db.pool.size")
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    print(
+        f"Unlocked val_get, 1 thread: {bench_unlocked_baseline():,.0f} ops/s\n"
+    )
+    print(f"{'readers':>8s}  {'reads/s':>12s}  {'writes/s':>10s}")
+    for n_threads in (1, 4, 16):
+        reads, writes = bench_readers(n_threads)
+        print(f"{n_threads:8d}  {reads:12,.0f}  {writes:10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
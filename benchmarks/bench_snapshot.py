@@ -0,0 +1,72 @@
+"""Benchmark binary snapshots against JSON for a large tree.
+
+Times ``save_json`` / ``load_json`` against ``save_snapshot`` /
+``open_snapshot``, then the cost of reading a few chain keys from the
+opened snapshot versus materializing it completely.
+
+Run: python benchmarks/bench_snapshot.py [n_services]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from recursivenamespace import RNS
+
+
+def make_tree(n: int) -> RNS:
+    return RNS(
+        {
+            "services": {
+                f"svc{i}": {
+                    "port": 8000 + i,
+                    "weight": i / n,
+                    "hosts": [f"10.0.{i % 250}.{j}" for j in range(4)],
+                    "limits": {"rps": 100, "burst": 10, "enabled": True},
+                }
+                for i in range(n)
+            }
+        }
+    )
+
+
+def timed(label: str, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"  {label:<34} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    tree = make_tree(n)
+    last = f"services.svc{n - 1}"
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "tree.json"
+        snap_path = Path(tmp) / "tree.snap"
+
+        timed("save_json", tree._.save_json, json_path)
+        timed("save_snapshot", tree._.save_snapshot, snap_path)
+        print(
+            f"  sizes: json {json_path.stat().st_size / 2**20:.1f} MiB,"
+            f" snapshot {snap_path.stat().st_size / 2**20:.1f} MiB"
+        )
+        timed("load_json", RNS.load_json, json_path)
+        snap = timed("open_snapshot", RNS.open_snapshot, snap_path)
+        timed(
+            "snapshot: read 3 chain keys",
+            lambda: [
+                snap.val_get(f"{last}.port"),
+                snap.val_get(f"{last}.hosts[].0"),
+                snap.val_get("services.svc0.limits.rps"),
+            ],
+        )
+        timed("snapshot: to_dict (everything)", snap.to_dict)
+        snap.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark the TOML writer on a large generated config.
+
+Times ``to_toml`` (whole document as one string) and ``save_toml``
+(streamed to the file in chunks), reports the peak memory each one
+allocates, and checks that ``load_toml`` reads the file back to the
+same data. The config mixes plain tables, arrays of tables, inline
+tables inside mixed arrays, quoted keys and date-times.
+
+Run: python benchmarks/bench_toml.py [n_services]
+"""
+
+from __future__ import annotations
+
+import datetime
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from recursivenamespace import RNS
+
+
+def make_tree(n: int) -> RNS:
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return RNS(
+        {
+            "services": {
+                f"svc{i}": {
+                    "port": 8000 + i,
+                    "deployed": start + datetime.timedelta(minutes=i),
+                    "hosts": [f"10.0.{i % 250}.{j}" for j in range(4)],
+                    "limits": {"rps": 100, "burst": 10, "enabled": True},
+                    "routes": [
+                        {"path": f"/v{j}", "weight": j / 4} for j in range(3)
+                    ],
+                    "probes": [{"http": "/health"}, 30],
+                    "labels": {"team name": f"t{i % 7}"},
+                }
+                for i in range(n)
+            }
+        },
+        use_raw_key=True,
+    )
+
+
+def measure(label: str, func, *args):
+    # Timed and traced separately: tracemalloc slows the writer down.
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {label:<12} {elapsed:8.3f} s  peak {peak / 2**20:8.1f} MiB")
+    return result
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    tree = make_tree(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "config.toml"
+        text = measure("to_toml", tree._.to_toml)
+        measure("save_toml", tree._.save_toml, path)
+        print(f"  output: {len(text) / 2**20:.1f} MiB, {n} services")
+        start = time.perf_counter()
+        loaded = RNS.load_toml(path, use_raw_key=True)
+        print(f"  load_toml    {time.perf_counter() - start:8.3f} s")
+        assert loaded._.to_dict() == tree._.to_dict()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark validating API responses against a declared shape.
+
+Compares a naive recursive validator, which re-reads the dict spec on
+every call and builds each chain key eagerly, with a
+``RNS.compile_schema`` validator. The spec is compiled once, and paths
+are only rendered for errors. Both walk the same RNS trees and collect
+all errors. Coercion is off so that repeated runs see the same data.
+
+Run: python benchmarks/bench_validate.py [n_records] [repeat]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import types
+from typing import Any, Dict
+
+from recursivenamespace import RNS
+
+SPEC = {
+    "id": int,
+    "user": {"name": str, "email?": (str, type(None)), "age": int},
+    "tags": [str],
+    "scores": [float],
+    "address?": {"city": str, "zip": str},
+    "lines": [{"sku": str, "qty": int, "price": float}],
+}
+
+
+def naive_validate(value: Any, spec: Any, path: str, errors: Dict) -> None:
+    if isinstance(spec, dict):
+        if isinstance(value, types.SimpleNamespace):
+            value = vars(value)
+        if not isinstance(value, dict):
+            errors[path] = "expected a table"
+            return
+        for key, sub in spec.items():
+            optional = key.endswith("?")
+            key = key.rstrip("?")
+            child = f"{path}.{key}" if path else key
+            if key not in value:
+                if not optional:
+                    errors[child] = "required key missing"
+                continue
+            naive_validate(value[key], sub, child, errors)
+    elif isinstance(spec, list):
+        if not isinstance(value, list):
+            errors[path] = "expected a list"
+            return
+        for i, item in enumerate(value):
+            naive_validate(item, spec[0], f"{path}[].{i}", errors)
+    elif not isinstance(value, spec) or (
+        spec in (int, float) and isinstance(value, bool)
+    ):
+        errors[path] = f"expected {spec}"
+
+
+def make_record(i: int) -> RNS:
+    return RNS(
+        {
+            "id": i,
+            "user": {"name": f"u{i}", "email": None, "age": 30},
+            "tags": ["a", "b", "c"],
+            "scores": [0.5, 0.25],
+            "address": {"city": "x", "zip": "01234"},
+            "lines": [
+                {"sku": f"s{j}", "qty": j, "price": 1.5} for j in range(3)
+            ],
+        }
+    )
+
+
+def timed(label: str, func, n: int, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<22} {n / elapsed / 1e3:9.1f} k records/s")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    records = [make_record(i) for i in range(n)]
+    records[0].user.age = "thirty"
+    check = RNS.compile_schema(SPEC, coerce=False)
+
+    def run_naive() -> None:
+        for record in records:
+            naive_validate(record, SPEC, "", {})
+
+    def run_compiled() -> None:
+        for record in records:
+            check.errors(record)
+
+    naive_errors: Dict[str, str] = {}
+    naive_validate(records[0], SPEC, "", naive_errors)
+    assert naive_errors.keys() == check.errors(records[0]).keys()
+    print(f"{n} records:")
+    timed("naive recursive", run_naive, n, repeat)
+    timed("compiled", run_compiled, n, repeat)
+
+
+if __name__ == "__main__":
+    main()
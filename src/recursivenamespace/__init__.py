@@ -4,7 +4,19 @@ from .main import recursivenamespace
 from .main import recursivenamespace as RecursiveNamespace
 from .main import recursivenamespace as RNS
 from . import main as rns
-from .errors import GetChainKeyError, SerializationError, SetChainKeyError
+from .cache import LoaderCache, MemoCache, load_cache
+from .concurrency import SharedRNS
+from .layered import LayeredRNS
+from .schema import SchemaValidator
+from .watch import FileWatcher
+from .errors import (
+    BulkSerializationError,
+    ChangeTrackingError,
+    GetChainKeyError,
+    SchemaError,
+    SerializationError,
+    SetChainKeyError,
+)
 
 from importlib.metadata import version as _get_version
 
@@ -16,7 +28,17 @@ __all__ = [
     "RecursiveNamespace",
     "RNS",
     "rns",
+    "SharedRNS",
+    "LayeredRNS",
+    "SchemaValidator",
+    "FileWatcher",
+    "LoaderCache",
+    "MemoCache",
+    "load_cache",
+    "BulkSerializationError",
+    "ChangeTrackingError",
     "GetChainKeyError",
+    "SchemaError",
     "SerializationError",
     "SetChainKeyError",
     "__version__",
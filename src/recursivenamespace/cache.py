@@ -0,0 +1,224 @@
+"""Process-wide cache for trees loaded from files.
+
+Entries are keyed by absolute path plus a loader variant (format,
+class, options) and are valid while the file's
+``(st_mtime_ns, st_size, st_ino)`` stamp is unchanged, so a lookup
+costs one ``os.stat``. The least recently used entry is evicted once
+``maxsize`` is exceeded.
+
+``MemoCache`` is the same LRU keyed by call arguments instead, with
+entries expiring after ``ttl`` seconds; ``@rns.rns(cache=N)`` uses it.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+
+__all__ = [
+    "CacheInfo",
+    "LoaderCache",
+    "MemoCache",
+    "file_stamp",
+    "load_cache",
+]
+
+Stamp = Tuple[int, int, int]
+
+
+def file_stamp(filepath: Union[str, Path]) -> Stamp:
+    """``(st_mtime_ns, st_size, st_ino)``: changes whenever the file does."""
+    st = os.stat(filepath)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class LoaderCache:
+    """Thread-safe LRU cache of loaded files, validated by ``os.stat``.
+
+    ``maxsize=None`` means unbounded and ``0`` disables storing (every
+    lookup is a miss). Two threads missing on the same file may both
+    load it; the later result is kept.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Tuple[str, Hashable], Tuple[Stamp, Any]]
+        self._entries = OrderedDict()
+        self._maxsize = _check_maxsize(maxsize)
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f"LoaderCache({self.cache_info()})"
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: Optional[int]) -> None:
+        with self._lock:
+            self._maxsize = _check_maxsize(maxsize)
+            self._evict()
+
+    def get(
+        self,
+        filepath: Union[str, Path],
+        variant: Hashable,
+        load: Callable[[], T],
+    ) -> T:
+        """Return the cached value for ``filepath``, or ``load()`` it.
+
+        The file is stat'ed before loading, so a write that races with
+        the load leaves a stale stamp and is picked up next time.
+        """
+        path = os.path.abspath(filepath)
+        try:
+            stamp = file_stamp(path)
+        except FileNotFoundError:
+            self.invalidate(path)
+            raise
+        key = (path, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                value: T = entry[1]
+                return value
+            self._misses += 1
+        value = load()
+        with self._lock:
+            if self._maxsize != 0:
+                self._entries[key] = (stamp, value)
+                self._entries.move_to_end(key)
+                self._evict()
+        return value
+
+    def invalidate(self, filepath: Union[str, Path]) -> int:
+        """Drop every entry for ``filepath``; return how many were dropped."""
+        path = os.path.abspath(filepath)
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == path]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def _evict(self) -> None:
+        if self._maxsize is None:
+            return
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class MemoCache:
+    """Thread-safe LRU cache of computed values with an optional TTL.
+
+    An entry is valid for ``ttl`` seconds after it was stored (forever
+    when ``ttl`` is None); ``maxsize`` works as in ``LoaderCache``. Two
+    threads missing on the same key may both compute it; the later
+    result is kept.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be > 0 or None, got {ttl}")
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]]
+        self._entries = OrderedDict()
+        self._maxsize = _check_maxsize(maxsize)
+        self._ttl = ttl
+        self._clock = clock
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f"MemoCache({self.cache_info()})"
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    def get(self, key: Hashable, load: Callable[[], T]) -> T:
+        """Return the live cached value for ``key``, or ``load()`` it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._ttl is None or self._clock() - entry[0] < self._ttl:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    value: T = entry[1]
+                    return value
+                del self._entries[key]
+            self._misses += 1
+        value = load()
+        with self._lock:
+            if self._maxsize != 0:
+                self._entries[key] = (self._clock(), value)
+                self._entries.move_to_end(key)
+                if self._maxsize is not None:
+                    while len(self._entries) > self._maxsize:
+                        self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Statistics; ``currsize`` may count expired, unvisited entries."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+
+def _check_maxsize(maxsize: Optional[int]) -> Optional[int]:
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f"maxsize must be >= 0 or None, got {maxsize}")
+    return maxsize
+
+
+# Shared by ``RNS.load_json`` / ``RNS.load_toml`` when ``cached=True``.
+load_cache = LoaderCache()
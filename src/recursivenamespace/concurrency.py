@@ -0,0 +1,205 @@
+"""Thread-safe access to a shared RecursiveNamespaceV2 tree."""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .main import _StaticImpl, recursivenamespace
+
+T = TypeVar("T")
+
+__all__ = ["RWLock", "SharedRNS"]
+
+
+class RWLock:
+    """Writer-preferring readers-writer lock.
+
+    Any number of readers may hold the lock together; a writer holds it
+    alone. Once a writer is waiting, new readers queue behind it so a
+    steady stream of reads cannot starve a refresh. Both locks are
+    reentrant per thread: a thread already reading re-enters without
+    queueing behind a waiting writer, and the thread holding the write
+    lock may re-enter it and take read locks. A reader cannot upgrade
+    to the write lock; ``acquire_write`` raises ``RuntimeError``.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._reader_depths: Dict[int, int] = {}
+        self._writers_waiting = 0
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+
+    def acquire_read(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            depth = self._reader_depths.get(me)
+            if depth is not None:
+                self._reader_depths[me] = depth + 1
+                return
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._reader_depths[me] = 1
+            self._readers += 1
+
+    def release_read(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth -= 1
+                return
+            depth = self._reader_depths[me] - 1
+            if depth:
+                self._reader_depths[me] = depth
+                return
+            del self._reader_depths[me]
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if me in self._reader_depths:
+                # Waiting would deadlock on our own read lock.
+                raise RuntimeError("cannot upgrade a read lock to write")
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        with self._cond:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("release_write() by a non-owner thread")
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def read_locked(self) -> Generator[None, None, None]:
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextlib.contextmanager
+    def write_locked(self) -> Generator[None, None, None]:
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class SharedRNS:
+    """Guard one RNS tree shared between threads with an ``RWLock``.
+
+    Reads and writes made through the wrapper are serialized against
+    each other, so a reader never observes half of an ``update``. Use
+    ``read()`` to make several reads against one consistent state and
+    ``write()`` to group several writes into one exclusive section.
+    Access that bypasses the wrapper (holding on to ``read()``'s
+    yielded tree after the block, or writing to the wrapped object
+    directly) is not protected.
+
+    Example::
+
+        shared = SharedRNS(RNS({"db": {"host": "a", "port": 1}}))
+
+        # background refresher
+        with shared.write() as cfg:
+            cfg._.val_set("db.host", "b")
+            cfg._.val_set("db.port", 2)
+
+        # worker
+        with shared.read() as cfg:
+            host, port = cfg.db.host, cfg.db.port
+    """
+
+    __slots__ = ("_data", "_lock")
+
+    def __init__(
+        self,
+        data: Union[Dict[str, Any], recursivenamespace, None] = None,
+    ) -> None:
+        if not isinstance(data, recursivenamespace):
+            data = recursivenamespace(data)
+        self._data = data
+        self._lock = RWLock()
+
+    def __repr__(self) -> str:
+        with self._lock.read_locked():
+            return f"SharedRNS({self._data!r})"
+
+    @contextlib.contextmanager
+    def read(self) -> Generator[recursivenamespace, None, None]:
+        """Yield the tree with the read lock held. Do not mutate it."""
+        with self._lock.read_locked():
+            yield self._data
+
+    @contextlib.contextmanager
+    def write(self) -> Generator[recursivenamespace, None, None]:
+        """Yield the tree with the write lock held.
+
+        Combine with ``cfg._.transaction()`` to also roll back on error.
+        """
+        with self._lock.write_locked():
+            yield self._data
+
+    def val_get(self, key: str) -> Any:
+        with self._lock.read_locked():
+            return _StaticImpl.val_get(self._data, key)
+
+    def get_or_else(self, key: str, or_else: Optional[T] = None) -> Any:
+        with self._lock.read_locked():
+            return _StaticImpl.get_or_else(self._data, key, or_else)
+
+    def val_get_many(self, keys: List[str]) -> List[Any]:
+        """Read several chain-keys from one consistent state."""
+        with self._lock.read_locked():
+            return [_StaticImpl.val_get(self._data, k) for k in keys]
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock.read_locked():
+            return _StaticImpl.to_dict(self._data)
+
+    def snapshot(self) -> recursivenamespace:
+        """Deep copy of the current state, safe to use without the lock."""
+        with self._lock.read_locked():
+            return _StaticImpl.deepcopy(self._data)
+
+    def val_set(self, key: str, value: Any) -> None:
+        with self._lock.write_locked():
+            _StaticImpl.val_set(self._data, key, value)
+
+    def update(self, data: Union[Dict[str, Any], recursivenamespace]) -> None:
+        with self._lock.write_locked():
+            _StaticImpl.update(self._data, data)
+
+    def pop(self, key: str, default: Optional[T] = None) -> Any:
+        with self._lock.write_locked():
+            return _StaticImpl.pop(self._data, key, default)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Dict, Optional
 
 
 class SetChainKeyError(KeyError):
@@ -25,3 +25,51 @@ class SerializationError(Exception):
     """Raised when serialization or deserialization fails."""
 
     pass
+
+
+class BulkSerializationError(SerializationError):
+    """Raised by the ``*_many`` helpers once every file was attempted.
+
+    ``errors`` maps each failed path to its exception; ``loaded`` holds
+    the results of the paths that succeeded (empty for saves).
+    """
+
+    def __init__(
+        self,
+        errors: Dict[str, BaseException],
+        loaded: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.errors = errors
+        self.loaded: Dict[str, Any] = {} if loaded is None else loaded
+        first = next(iter(errors.items()), ("", ""))
+        super().__init__(
+            f"{len(errors)} file(s) failed; first: {first[0]}: {first[1]}"
+        )
+
+    def __reduce__(self) -> Any:
+        # ``args`` only holds the message; rebuild from the mappings.
+        return type(self), (self.errors, self.loaded)
+
+
+class ChangeTrackingError(RuntimeError):
+    """Raised when reading the change journal of an untracked tree."""
+
+    pass
+
+
+class SchemaError(ValueError):
+    """Raised by ``SchemaValidator.validate`` with every problem found.
+
+    ``errors`` maps each offending chain key (``""`` for the root) to
+    its message.
+    """
+
+    def __init__(self, errors: Dict[str, str]) -> None:
+        self.errors = errors
+        lines = [f"{path or '<root>'}: {msg}" for path, msg in errors.items()]
+        super().__init__(
+            f"{len(errors)} schema error(s):\n  " + "\n  ".join(lines)
+        )
+
+    def __reduce__(self) -> Any:
+        return type(self), (self.errors,)
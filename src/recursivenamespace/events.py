@@ -0,0 +1,410 @@
+"""Mutation events for RecursiveNamespaceV2 trees.
+
+A tree opts in to change observation by attaching a ``MutationHub`` to
+its nodes (see ``obj._.track_changes()``). Every bound node forwards the
+writes made through attribute and item assignment, ``val_set``,
+``update``, ``pop``, ``overlay`` and array assignment to the hub as
+``Mutation`` records.
+Trees without a hub pay a single ``is None`` check per write.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from . import utils
+
+
+class _Missing:
+    """Sentinel for "no value" on either side of a mutation."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+MISSING: Any = _Missing()
+
+
+class Mutation(NamedTuple):
+    """A single write observed on a bound tree.
+
+    ``path`` is the chain-key of the written entry relative to the hub
+    root (``db.pool.size``, ``servers[].0``). ``container`` is the RNS
+    node or list that was written, ``key`` the attribute name or list
+    index inside it. ``old`` / ``new`` are ``MISSING`` for inserts and
+    removals respectively.
+    """
+
+    path: str
+    container: Any
+    key: Union[str, int]
+    old: Any
+    new: Any
+
+
+def child_path(prefix: str, key: str) -> str:
+    """Join a (possibly empty) chain-key prefix with one escaped key."""
+    key = utils.escape_key(key)
+    return f"{prefix}{utils.KEY_SEP_CHAR}{key}" if prefix else key
+
+
+def item_path(list_path: str, index: int) -> str:
+    """Chain-key of ``index`` inside the list stored at ``list_path``."""
+    return f"{list_path}{utils.KEY_ARRAY}{utils.KEY_SEP_CHAR}{index}"
+
+
+def is_descendant_path(ancestor: str, path: str) -> bool:
+    """Whether ``path`` lies strictly below the chain-key ``ancestor``."""
+    if not ancestor:
+        return bool(path)
+    return path.startswith(
+        (f"{ancestor}{utils.KEY_SEP_CHAR}", f"{ancestor}{utils.KEY_ARRAY}")
+    )
+
+
+class Binding(NamedTuple):
+    """Per-node link to the tree's hub and the node's chain-key path."""
+
+    hub: MutationHub
+    path: str
+
+
+class ChangeJournal:
+    """Ordered set of chain-key paths written since the last checkpoint."""
+
+    __slots__ = ("_paths",)
+
+    def __init__(self) -> None:
+        self._paths: Dict[str, None] = {}
+
+    def __call__(self, mutation: Mutation) -> None:
+        self._paths[mutation.path] = None
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def paths(self) -> List[str]:
+        return list(self._paths)
+
+    def reset(self) -> List[str]:
+        paths = list(self._paths)
+        self._paths.clear()
+        return paths
+
+
+WILDCARD = "*"
+
+Subscriber = Callable[[List[Mutation]], None]
+
+
+class _TrieNode:
+    __slots__ = ("children", "subscribers")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.subscribers: List[Subscriber] = []
+
+
+class SubscriptionTrie:
+    """Chain-key pattern subscriptions stored as a prefix trie.
+
+    A pattern is a chain-key whose segments may be ``*`` (any single
+    segment). A subscriber is notified when a write lands on or below a
+    matching path, and when an ancestor of a matching path is replaced
+    or removed. Matching walks one trie level per path segment, so the
+    cost of a write is O(depth) regardless of how many patterns are
+    registered elsewhere in the trie.
+
+    While the hub is inside a batch, matches are buffered and each
+    subscriber receives all of its mutations in one call on flush.
+    """
+
+    __slots__ = ("_hub", "_pending", "_root")
+
+    def __init__(self, hub: "MutationHub") -> None:
+        self._hub = hub
+        self._root = _TrieNode()
+        self._pending: Dict[int, Tuple[Subscriber, List[Mutation]]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._root.children or self._root.subscribers)
+
+    def subscribe(self, pattern: str, callback: Subscriber) -> None:
+        node = self._root
+        for seg in _pattern_segments(pattern):
+            node = node.children.setdefault(seg, _TrieNode())
+        if callback not in node.subscribers:
+            node.subscribers.append(callback)
+
+    def unsubscribe(self, pattern: str, callback: Subscriber) -> None:
+        trail = [self._root]
+        for seg in _pattern_segments(pattern):
+            child = trail[-1].children.get(seg)
+            if child is None:
+                return
+            trail.append(child)
+        if callback in trail[-1].subscribers:
+            trail[-1].subscribers.remove(callback)
+        # Prune now-empty branches so matching never walks dead nodes.
+        segs = _pattern_segments(pattern)
+        for depth in range(len(segs), 0, -1):
+            node = trail[depth]
+            if node.subscribers or node.children:
+                break
+            del trail[depth - 1].children[segs[depth - 1]]
+
+    def match(self, path: str) -> List[Subscriber]:
+        """Subscribers whose pattern covers ``path`` (see class doc)."""
+        found: List[Subscriber] = list(self._root.subscribers)
+        frontier = [self._root]
+        for seg in utils.split_key(path):
+            step = []
+            for node in frontier:
+                for child in (
+                    node.children.get(seg),
+                    node.children.get(WILDCARD),
+                ):
+                    if child is not None:
+                        found.extend(child.subscribers)
+                        step.append(child)
+            frontier = step
+            if not frontier:
+                return found
+        # ``path`` is an ancestor of deeper patterns: its subtree changed.
+        stack = [c for node in frontier for c in node.children.values()]
+        while stack:
+            node = stack.pop()
+            found.extend(node.subscribers)
+            stack.extend(node.children.values())
+        return found
+
+    def __call__(self, mutation: Mutation) -> None:
+        subscribers = self.match(mutation.path)
+        if not subscribers:
+            return
+        # One callback may sit under several matching patterns.
+        unique = {id(cb): cb for cb in subscribers}
+        if self._hub.batch_depth:
+            for key, callback in unique.items():
+                entry = self._pending.setdefault(key, (callback, []))
+                entry[1].append(mutation)
+            return
+        for callback in unique.values():
+            callback([mutation])
+
+    def flush(self) -> None:
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for callback, mutations in pending:
+            callback(mutations)
+
+
+def _pattern_segments(pattern: str) -> List[str]:
+    return [] if pattern == "" else utils.split_key(pattern)
+
+
+Replayer = Callable[[Mutation, Any], None]
+
+
+class History:
+    """Bounded undo/redo stacks of inverse operations.
+
+    Each step is the list of mutations made by one write, or by one
+    ``batch()`` (so a whole ``update()`` undoes in one go). Steps keep
+    references to the replaced values rather than snapshots, so undo
+    and redo cost O(changed nodes) and memory is bounded by
+    ``max_depth`` steps, not by the size of the tree.
+    """
+
+    __slots__ = (
+        "_hub",
+        "_on_close",
+        "_open",
+        "_redo",
+        "_replay",
+        "_replaying",
+        "_undo",
+    )
+
+    def __init__(
+        self,
+        hub: "MutationHub",
+        replay: Replayer,
+        max_depth: int,
+        on_close: Callable[[], None],
+    ) -> None:
+        if max_depth < 1:
+            raise ValueError(f"max_depth must be >= 1, got {max_depth}")
+        self._hub = hub
+        self._replay = replay
+        self._on_close = on_close
+        self._undo: Deque[List[Mutation]] = deque(maxlen=max_depth)
+        self._redo: List[List[Mutation]] = []
+        self._open: Optional[List[Mutation]] = None
+        self._replaying = False
+
+    @property
+    def max_depth(self) -> int:
+        assert self._undo.maxlen is not None
+        return self._undo.maxlen
+
+    @max_depth.setter
+    def max_depth(self, value: int) -> None:
+        if value < 1:
+            raise ValueError(f"max_depth must be >= 1, got {value}")
+        self._undo = deque(self._undo, maxlen=value)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def __call__(self, mutation: Mutation) -> None:
+        if self._replaying:
+            return
+        if self._open is None:
+            self._open = []
+        self._open.append(mutation)
+        if not self._hub.batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._open:
+            self._undo.append(self._open)
+            self._redo.clear()
+        self._open = None
+
+    def undo(self) -> bool:
+        """Revert the latest step; return False if there is none."""
+        if not self._undo:
+            return False
+        step = self._undo.pop()
+        self._run((m, m.old) for m in reversed(step))
+        self._redo.append(step)
+        return True
+
+    def redo(self) -> bool:
+        """Re-apply the latest undone step; return False if there is none."""
+        if not self._redo:
+            return False
+        step = self._redo.pop()
+        self._run((m, m.new) for m in step)
+        self._undo.append(step)
+        return True
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._open = None
+
+    def close(self) -> None:
+        """Stop recording and release the tree's hub if unused."""
+        self.clear()
+        self._hub.remove_listener(self)
+        if self._hub.history is self:
+            self._hub.history = None
+        self._on_close()
+
+    def _run(self, ops: Iterable[Tuple[Mutation, Any]]) -> None:
+        self._replaying = True
+        try:
+            with self._hub.batch():
+                for mutation, value in ops:
+                    self._replay(mutation, value)
+        finally:
+            self._replaying = False
+
+
+class Transaction:
+    """Undo log of the writes made inside ``obj._.transaction()``.
+
+    While a transaction is open the hub routes every mutation here
+    instead of to its listeners. Commit re-emits the log once inside a
+    batch; rollback replays it backwards without notifying anyone, so
+    observers only ever see committed state.
+    """
+
+    __slots__ = ("log",)
+
+    def __init__(self) -> None:
+        self.log: List[Mutation] = []
+
+
+class MutationHub:
+    """Dispatch ``Mutation`` records from a bound tree to its listeners.
+
+    One hub is shared by every node of a tree. Features that observe the
+    tree (change journal, subscriptions, history) register themselves as
+    listeners; the hub itself holds no per-feature state beyond a direct
+    reference for the ones reachable through ``obj._``.
+
+    Listeners that buffer work (``SubscriptionTrie``) expose ``flush()``,
+    which the hub calls when the outermost ``batch()`` exits.
+    """
+
+    __slots__ = (
+        "batch_depth",
+        "history",
+        "journal",
+        "listeners",
+        "subscriptions",
+        "transaction",
+    )
+
+    def __init__(self) -> None:
+        self.listeners: List[Callable[[Mutation], None]] = []
+        self.journal: Optional[ChangeJournal] = None
+        self.subscriptions: Optional[SubscriptionTrie] = None
+        self.history: Optional[History] = None
+        self.transaction: Optional[Transaction] = None
+        self.batch_depth = 0
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth:
+                for listener in list(self.listeners):
+                    flush = getattr(listener, "flush", None)
+                    if flush is not None:
+                        flush()
+
+    def emit(self, mutation: Mutation) -> None:
+        if self.transaction is not None:
+            self.transaction.log.append(mutation)
+            return
+        for listener in self.listeners:
+            listener(mutation)
+
+    def add_listener(self, listener: Callable[[Mutation], None]) -> None:
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Mutation], None]) -> None:
+        if listener in self.listeners:
+            self.listeners.remove(listener)
@@ -0,0 +1,285 @@
+"""Resolve reads through a stack of configuration layers."""
+
+from __future__ import annotations
+
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from . import events, utils
+from .main import (
+    _SHARED_LEAF_TYPES_,
+    _apply_diff_,
+    _clone_tree_,
+    _freeze_tree_,
+    _freeze_value_,
+    _FrozenMixin,
+    _new_node_,
+    _node_config_,
+    _StaticImpl,
+    _thawed_class_,
+    recursivenamespace,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+T = TypeVar("T")
+
+__all__ = ["LayeredRNS"]
+
+_Path = Tuple[str, ...]
+_Layer = Union[Dict[str, Any], recursivenamespace]
+
+
+class LayeredRNS:
+    """Read-only merge of ``layers``, later layers overriding earlier.
+
+    Nodes present in several layers merge key by key; any other value
+    (lists included) is taken whole from the highest layer defining
+    it, and masks whatever the layers below hold under that key. The
+    merged tree is built once and kept frozen in ``merged``;
+    ``val_get`` answers repeated chain keys from a lookup cache.
+
+    Writes to a layer (directly, through ``update_layer``, or by a
+    ``FileWatcher`` that owns it) are observed through
+    ``subscribe``: only the written paths are re-merged, and only the
+    cached lookups on or below them are dropped. Untouched merged
+    subtrees keep their identity. ``close()`` stops observing.
+    Built by ``RNS.layered``.
+    """
+
+    def __init__(self, layers: Sequence[_Layer]) -> None:
+        if not layers:
+            raise ValueError("layered() needs at least one layer")
+        self._layers: List[recursivenamespace] = [
+            layer
+            if isinstance(layer, recursivenamespace)
+            else recursivenamespace(layer)
+            for layer in layers
+        ]
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Any] = {}
+        # First path segment -> {cached chain key: its node path}.
+        self._index: Dict[str, Dict[str, _Path]] = {}
+        self._prefixes: List[Optional[str]] = []
+        top = self._layers[-1]
+        config = _node_config_(_thawed_class_(type(top)), top)
+        self.merged = _freeze_tree_(_new_node_(top._key_, config))
+        self._rebuild()
+        for layer in self._layers:
+            self._prefixes.append(self._observe(layer))
+
+    def __repr__(self) -> str:
+        return f"LayeredRNS({len(self._layers)} layers, {self.merged!r})"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def layers(self) -> Tuple[recursivenamespace, ...]:
+        return tuple(self._layers)
+
+    def val_get(self, key: str) -> Any:
+        """``merged._.val_get(key)``, cached until a layer changes it."""
+        value = self._cache.get(key, events.MISSING)
+        if value is not events.MISSING:
+            return value
+        with self._lock:
+            value = _StaticImpl.val_get(self.merged, key)
+            path = self._path_of(key)
+            self._cache[key] = value
+            self._index.setdefault(path[0], {})[key] = path
+        return value
+
+    def get_or_else(self, key: str, or_else: Optional[T] = None) -> Any:
+        try:
+            return self.val_get(key)
+        except (LookupError, ValueError, TypeError, AttributeError):
+            return or_else
+
+    def to_dict(self) -> Dict[str, Any]:
+        return _StaticImpl.to_dict(self.merged)
+
+    def update_layer(self, index: int, data: _Layer) -> List[str]:
+        """Make layer ``index`` equal ``data``, writing only what differs.
+
+        Returns the changed chain keys (relative to the layer); the
+        merged tree follows through the layer's subscription.
+        """
+        if not isinstance(data, recursivenamespace):
+            data = recursivenamespace(data)
+        return _apply_diff_(self._layers[index], data)
+
+    def close(self) -> None:
+        """Stop following writes to the layers."""
+        for layer, prefix in zip(self._layers, self._prefixes):
+            if prefix is not None:
+                _StaticImpl.unsubscribe(layer, "", self._on_mutations)
+        self._prefixes = [None] * len(self._layers)
+
+    # ── Merging ───────────────────────────────────────────────────
+
+    def _observe(self, layer: recursivenamespace) -> Optional[str]:
+        """Subscribe to ``layer``; return the hub path it sits at."""
+        if isinstance(layer, _FrozenMixin):  # cannot change, or be bound
+            return None
+        _StaticImpl.subscribe(layer, "", self._on_mutations)
+        assert layer._binding_ is not None
+        return layer._binding_.path
+
+    def _on_mutations(self, mutations: List[events.Mutation]) -> None:
+        with self._lock:
+            for mutation in mutations:
+                path = self._layer_path(mutation.path)
+                if path is None:
+                    continue
+                if path:
+                    self._remerge(path)
+                else:
+                    self._rebuild()
+
+    def _layer_path(self, hub_path: str) -> Optional[_Path]:
+        """Node path of ``hub_path`` relative to the layer it hit."""
+        for prefix in self._prefixes:
+            if prefix is None:
+                continue
+            if not prefix:
+                return self._path_of(hub_path)
+            if hub_path == prefix:
+                return ()
+            if hub_path.startswith(prefix + utils.KEY_SEP_CHAR):
+                return self._path_of(hub_path[len(prefix) + 1 :])
+        return None
+
+    def _path_of(self, key: str) -> _Path:
+        """Node keys along ``key``, cut at the first list segment.
+
+        Lists are merged whole, so a write inside one (or a lookup
+        through one) is filed under the key holding the list.
+        """
+        path = []
+        for seg in utils.split_key(key):
+            seg = utils.unescape_key(seg)
+            if seg.endswith(utils.KEY_ARRAY):
+                path.append(self.merged._re_(seg[:-2]))
+                break
+            path.append(self.merged._re_(seg))
+        return tuple(path)
+
+    def _rebuild(self) -> None:
+        """Re-merge every top-level key, keeping ``merged`` itself."""
+        keys = dict.fromkeys(_StaticImpl.keys(self.merged))
+        for layer in self._layers:
+            keys.update(dict.fromkeys(_StaticImpl.keys(layer)))
+        for key in keys:
+            self._remerge((key,))
+
+    def _remerge(self, path: _Path) -> None:
+        """Recompute the merged value at ``path`` and drop stale lookups."""
+        node = self.merged
+        for depth, key in enumerate(path[:-1]):
+            child = node.__dict__.get(key, events.MISSING)
+            if not isinstance(child, recursivenamespace):
+                # Masked or new in the merge: re-merge from here.
+                path = path[: depth + 1]
+                break
+            node = child
+        key = path[-1]
+        values = self._values_at(path)
+        # ``merged`` is frozen for callers; write its storage directly.
+        if values:
+            node.__dict__[key] = _merge_values_(values, key)
+        else:
+            node.__dict__.pop(key, None)
+        self._invalidate(path)
+
+    def _values_at(self, path: _Path) -> List[Any]:
+        """Values visible at ``path``, from the highest layer down.
+
+        Stops at the first value that is not a node, which masks the
+        layers below it.
+        """
+        found: List[Any] = []
+        for layer in reversed(self._layers):
+            value: Any = layer
+            for key in path:
+                if not isinstance(value, recursivenamespace):
+                    return found
+                value = value.__dict__.get(key, events.MISSING)
+                if value is events.MISSING:
+                    break
+            else:
+                found.append(value)
+                if not isinstance(value, recursivenamespace):
+                    return found
+        return found
+
+    def _invalidate(self, path: _Path) -> None:
+        bucket = self._index.get(path[0])
+        if not bucket:
+            return
+        depth = len(path)
+        for key, key_path in list(bucket.items()):
+            if key_path[:depth] == path:
+                del bucket[key]
+                self._cache.pop(key, None)
+
+
+def _merge_values_(values: List[Any], key: str) -> Any:
+    """Merge ``values`` (highest layer first) into a new frozen value.
+
+    Iterative, so deep trees do not hit the recursion limit. Leaves
+    other than immutable scalars are copied, so the merged tree never
+    shares a list or node with a layer.
+    """
+    if not isinstance(values[0], recursivenamespace):
+        nodes: List[Any] = []
+        leaf = _freeze_value_(_copy_leaf_(values[0]), nodes)
+        for node in nodes:
+            _freeze_tree_(node)
+        return leaf
+    root = _new_merged_node_(values[0], key)
+    stack = [(root, values)]
+    while stack:
+        node, vals = stack.pop()
+        depth = 1
+        while depth < len(vals) and isinstance(vals[depth], recursivenamespace):
+            depth += 1
+        # Key order follows the lowest layer that defines each key.
+        children: Dict[str, List[Any]] = {}
+        for layer_node in reversed(vals[:depth]):
+            for k, v in _StaticImpl.items(layer_node):
+                children.setdefault(k, []).append(v)
+        attrs = node.__dict__
+        for k, child_vals in children.items():
+            child_vals.reverse()
+            top = child_vals[0]
+            if isinstance(top, recursivenamespace):
+                child = attrs[k] = _new_merged_node_(top, k)
+                stack.append((child, child_vals))
+            else:
+                attrs[k] = _copy_leaf_(top)
+    return _freeze_tree_(root)
+
+
+def _new_merged_node_(like: recursivenamespace, key: str) -> Any:
+    return _new_node_(key, _node_config_(_thawed_class_(type(like)), like))
+
+
+def _copy_leaf_(value: Any) -> Any:
+    if type(value) in _SHARED_LEAF_TYPES_:
+        return value
+    return _clone_tree_(value)
@@ -3,25 +3,45 @@
 # %%
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import contextvars
+import copyreg
 import dataclasses
+import datetime
+import enum
 import functools
+import io
 import json
 import logging
+import operator
+import os
 import re
+import struct
 import sys
+import threading
 import warnings
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
-from types import SimpleNamespace
+from types import MappingProxyType, ModuleType, SimpleNamespace
 from typing import (
+    IO,
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Generator,
+    Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
     TypeVar,
     Union,
 )
@@ -35,15 +55,35 @@ except ImportError:
     except ImportError:
         tomllib = None
 
-from . import utils
-from .errors import GetChainKeyError, SerializationError, SetChainKeyError
+from . import (
+    cache,
+    events,
+    schema,
+    snapshot,
+    streaming,
+    toml_writer,
+    utils,
+)
+from .cache import MemoCache
+from .errors import (
+    BulkSerializationError,
+    ChangeTrackingError,
+    GetChainKeyError,
+    SerializationError,
+    SetChainKeyError,
+)
+
+if TYPE_CHECKING:
+    from .layered import LayeredRNS
+    from .watch import FileWatcher
 
 T = TypeVar("T")
 
-_KEY_NORMALIZE_RE = re.compile(r"[.\-\s]")
+_KEY_NORMALIZE_RE = utils.KEY_NORMALIZE_RE
 
 __all__ = [
     "recursivenamespace",
+    "BulkSerializationError",
     "GetChainKeyError",
     "SerializationError",
     "SetChainKeyError",
@@ -85,6 +125,16 @@ def _deprecated(func: Callable[..., Any]) -> Callable[..., Any]:
 
 
 class recursivenamespace(SimpleNamespace):
+    # ``_binding_`` lives in a slot rather than ``__dict__`` so it never
+    # shows up as data, in equality, in copies or in pickles. It links
+    # the node to its tree's ``events.MutationHub`` when observed.
+    __slots__ = ("_binding_",)
+    _binding_: Optional[events.Binding]
+    # Per-node settings, stored in ``__dict__`` by ``__init__``.
+    _key_: str
+    _use__raw_key_: bool
+    _supported__types_: List[type]
+    _protected__keys_: set[str]
     __HASH__ = "#"
     _logger_ = logging.getLogger(__name__)
     # ``_`` is bound to a data descriptor after the class is defined,
@@ -102,16 +152,18 @@ class recursivenamespace(SimpleNamespace):
         if accepted_iter_types is None:
             accepted_iter_types = []
 
-        self._key_ = ""
-        self._use__raw_key_ = use_raw_key
-        self._supported__types_ = list(
+        # Internal attributes are written directly: ``__setattr__``
+        # would only pass them through.
+        object.__setattr__(self, "_binding_", None)
+        attrs = self.__dict__
+        attrs["_key_"] = ""
+        attrs["_use__raw_key_"] = use_raw_key
+        attrs["_supported__types_"] = list(
             dict.fromkeys([list, tuple, set] + accepted_iter_types)
         )
 
-        self._protected__keys_: set[str] = set()  # init attr in __dict__
-        self._protected__keys_ = (
-            set(self.__dict__.keys()) | _HARD_PROTECTED_CLASS_ATTRS
-        )
+        attrs["_protected__keys_"] = set()  # init attr in __dict__
+        attrs["_protected__keys_"] = set(attrs) | _HARD_PROTECTED_CLASS_ATTRS
 
         if isinstance(data, dict):
             kwargs.update(data)
@@ -137,12 +189,16 @@ class recursivenamespace(SimpleNamespace):
             return recursivenamespace(val, accepted_iter_types, use_raw_key)
         elif isinstance(val, str):
             return val
-        elif hasattr(val, "__iter__") and type(val) in self._supported__types_:
+        elif (
+            hasattr(val, "__iter__")
+            and _THAWED_TYPES_.get(type(val), type(val))
+            in self._supported__types_
+        ):
             lst = [
                 self._process_(v, accepted_iter_types, use_raw_key) for v in val
             ]
             try:
-                return type(val)(lst)
+                return _THAWED_TYPES_.get(type(val), type(val))(lst)
             except Exception as e:
                 print(
                     f"Failed to make iterable object of type {type(val)}",
@@ -158,9 +214,38 @@ class recursivenamespace(SimpleNamespace):
 
     def _remove_protected_key_(self, key: str) -> None:  # NOSONAR
         """Use with be-careful!"""
-        self._protected__keys_.remove(key)
+        # Rebind rather than mutate: copies and JSON-decoded nodes share
+        # one protected-key set.
+        if key not in self._protected__keys_:
+            raise KeyError(key)
+        self._protected__keys_ = self._protected__keys_ - {key}
         self.__dict__.pop(key)
 
+    def _notify_(self, key: str, old: Any, new: Any) -> None:
+        """Report a write on ``key`` to the bound hub (caller checked)."""
+        binding = self._binding_
+        assert binding is not None
+        path = events.child_path(binding.path, key)
+        if old is not events.MISSING:
+            _bind_tree_(old, None, path)
+        if new is not events.MISSING:
+            _bind_tree_(new, binding.hub, path)
+        binding.hub.emit(events.Mutation(path, self, key, old, new))
+
+    def _notify_item_(
+        self, key: str, target: List[Any], index: int, old: Any, new: Any
+    ) -> None:
+        """Report a write on ``target[index]`` stored under ``key``."""
+        binding = self._binding_
+        assert binding is not None
+        if index < 0:
+            index += len(target)
+        path = events.item_path(events.child_path(binding.path, key), index)
+        if old is not events.MISSING:
+            _bind_tree_(old, None, path)
+        _bind_tree_(new, binding.hub, path)
+        binding.hub.emit(events.Mutation(path, target, index, old, new))
+
     # ── Dunders ───────────────────────────────────────────────────
 
     def __eq__(self, other: object) -> bool:
@@ -184,6 +269,20 @@ class recursivenamespace(SimpleNamespace):
     def __len__(self) -> int:
         return sum(1 for k in self.__dict__ if k not in self._protected__keys_)
 
+    def __setattr__(self, key: str, value: Any) -> None:
+        # ``obj.key = value`` on an observed node is reported like
+        # ``obj[key] = value``; internal attributes never are.
+        if (
+            key in _UNOBSERVED_ATTRS_
+            or self._binding_ is None
+            or key in self._protected__keys_
+        ):
+            object.__setattr__(self, key, value)
+            return
+        old = self.__dict__.get(key, events.MISSING)
+        object.__setattr__(self, key, value)
+        self._notify_(key, old, value)
+
     def __delattr__(self, key: str) -> None:
         key = self._re_(key)
         if key in self._protected__keys_:
@@ -192,7 +291,11 @@ class recursivenamespace(SimpleNamespace):
                 if key == "_"
                 else f"The key '{key}' is protected."
             )
-        del self.__dict__[key]
+        if self._binding_ is None:
+            del self.__dict__[key]
+            return
+        old = self.__dict__.pop(key)
+        self._notify_(key, old, events.MISSING)
 
     def __setitem__(self, key: str, value: Any) -> None:
         key = self._re_(key)
@@ -209,6 +312,10 @@ class recursivenamespace(SimpleNamespace):
                 FutureWarning,
                 stacklevel=2,
             )
+        if self._binding_ is None:
+            # Skip ``__setattr__``: this is the construction path.
+            object.__setattr__(self, key, value)
+            return
         setattr(self, key, value)
 
     def __getitem__(self, key: str) -> Any:
@@ -228,17 +335,37 @@ class recursivenamespace(SimpleNamespace):
     def __copy__(self) -> "recursivenamespace":
         cls = self.__class__
         result = cls.__new__(cls)
+        result._binding_ = None
         result.__dict__.update(self.__dict__)
         return result
 
     def __deepcopy__(self, memo: Dict[int, Any]) -> "recursivenamespace":
         cls = self.__class__
         result = cls.__new__(cls)
+        result._binding_ = None
         memo[id(self)] = result
         for k, v in self.__dict__.items():
             setattr(result, k, deepcopy(v, memo))
         return result
 
+    def __reduce__(self) -> Any:
+        return _rns_reduce_(self, self.__class__)
+
+    def __setstate__(self, state: Any) -> None:
+        # ``_rns_reduce_`` state: ``(key, (use_raw_key, types), data)``,
+        # or the full ``__dict__`` for nodes with edited protected keys.
+        self._binding_ = None
+        attrs = self.__dict__
+        if type(state) is tuple:
+            key, (use_raw_key, types), data = state
+            attrs["_key_"] = key
+            attrs["_use__raw_key_"] = use_raw_key
+            attrs["_supported__types_"] = list(types)
+            attrs["_protected__keys_"] = _NODE_PROTECTED_KEYS_
+            attrs.update(data)
+        else:
+            attrs.update(state)
+
     def __iter__(self) -> Iterator[str]:
         if sys._getframe(1).f_code.co_name == "dict":
             return iter(_StaticImpl.to_dict(self))
@@ -255,12 +382,13 @@ class recursivenamespace(SimpleNamespace):
                 elements.append(val)
             elif (
                 hasattr(val, "__iter__")
-                and type(val) in self._supported__types_
+                and _THAWED_TYPES_.get(type(val), type(val))
+                in self._supported__types_
             ):
                 elements.append(self._iter_to_dict_(val))
             else:
                 elements.append(val)
-        return type(iterable)(elements)
+        return _THAWED_TYPES_.get(type(iterable), type(iterable))(elements)
 
     def _chain_set_array_(self, key: str, subs: List[str], value: Any) -> None:
         target = self._get_or_create_list_target_(key)
@@ -271,7 +399,7 @@ class recursivenamespace(SimpleNamespace):
             )
         head, *rest = subs
         if head == self.__HASH__:
-            self._array_append_(target, rest, value)
+            self._array_append_(key, target, rest, value)
         else:
             self._array_set_at_(target, key, int(head), rest, value)
 
@@ -291,16 +419,17 @@ class recursivenamespace(SimpleNamespace):
         return target
 
     def _array_append_(
-        self, target: List[Any], sub_keys: List[str], value: Any
+        self, key: str, target: List[Any], sub_keys: List[str], value: Any
     ) -> None:
-        if not sub_keys:
-            target.append(value)
-            return
-        new_item = recursivenamespace(
-            None, self._supported__types_, self._use__raw_key_
-        )
-        _StaticImpl.val_set(new_item, utils.join_key(sub_keys), value)
-        target.append(new_item)
+        if sub_keys:
+            new_item = recursivenamespace(
+                None, self._supported__types_, self._use__raw_key_
+            )
+            _StaticImpl.val_set(new_item, utils.join_key(sub_keys), value)
+            value = new_item
+        target.append(value)
+        if self._binding_ is not None:
+            self._notify_item_(key, target, -1, events.MISSING, value)
 
     def _array_set_at_(
         self,
@@ -311,7 +440,12 @@ class recursivenamespace(SimpleNamespace):
         value: Any,
     ) -> None:
         if not sub_keys:
+            if self._binding_ is None:
+                target[index] = value
+                return
+            old = target[index]
             target[index] = value
+            self._notify_item_(key, target, index, old, value)
             return
         child = target[index]
         sub_key = utils.join_key(sub_keys)
@@ -323,12 +457,17 @@ class recursivenamespace(SimpleNamespace):
     def _chain_set_value_(self, key: str, subs: List[str], value: Any) -> None:
         # See note in ``_get_or_create_list_target_``: ``hasattr`` would
         # find class-level deprecated method shims and skip auto-vivify.
+        sub_key = utils.join_key(subs)
         if key not in self:
-            self[key] = recursivenamespace(
+            # Fill the new branch before attaching it, so an observed
+            # tree reports the whole auto-vivified path as one write.
+            child = recursivenamespace(
                 None, self._supported__types_, self._use__raw_key_
             )
+            _StaticImpl.val_set(child, sub_key, value)
+            self[key] = child
+            return
         target = self[key]
-        sub_key = utils.join_key(subs)
         if isinstance(target, recursivenamespace):
             _StaticImpl.val_set(target, sub_key, value)
         else:
@@ -380,60 +519,6 @@ class recursivenamespace(SimpleNamespace):
         else:
             raise GetChainKeyError(target, key, sub_key)
 
-    @staticmethod
-    def _toml_escape_str_(s: str) -> str:
-        return s.replace("\\", "\\\\").replace('"', '\\"')
-
-    @staticmethod
-    def _toml_format_scalar_(value: Any) -> str:
-        """Render a primitive TOML value (caller already handled None)."""
-        if isinstance(value, bool):
-            return str(value).lower()
-        if isinstance(value, str):
-            return f'"{recursivenamespace._toml_escape_str_(value)}"'
-        return str(value)
-
-    @staticmethod
-    def _toml_format_array_(key: str, value: Any) -> str:
-        """Render ``key = [v1, v2, ...]`` or a comment if not serializable."""
-        if not all(isinstance(v, (str, int, float, bool)) for v in value):
-            return f"# {key} = [complex array - not serialized]"
-        parts = [recursivenamespace._toml_format_scalar_(v) for v in value]
-        return f"{key} = [{', '.join(parts)}]"
-
-    @staticmethod
-    def _toml_format_line_(key: str, value: Any) -> Optional[str]:
-        """Render a single ``key = value`` line, or None to skip the entry."""
-        if value is None:
-            return None
-        if isinstance(value, (str, int, float, bool)):
-            return f"{key} = {recursivenamespace._toml_format_scalar_(value)}"
-        if isinstance(value, (list, tuple)):
-            return recursivenamespace._toml_format_array_(key, value)
-        return f"# {key} = [type {type(value).__name__} not supported]"
-
-    @staticmethod
-    def _dict_to_toml_(data: Dict[str, Any], prefix: str = "") -> str:
-        """Convert dict to TOML format."""
-        lines: List[str] = []
-        tables: List[tuple[str, Dict[str, Any]]] = []
-
-        for key, value in data.items():
-            full_key = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                tables.append((full_key, value))
-                continue
-            line = recursivenamespace._toml_format_line_(key, value)
-            if line is not None:
-                lines.append(line)
-
-        for table_key, table_value in tables:
-            lines.append("")
-            lines.append(f"[{table_key}]")
-            lines.append(recursivenamespace._dict_to_toml_(table_value, ""))
-
-        return "\n".join(lines)
-
     # ── Classmethod factories (kept on the class, no deprecation) ─
 
     @classmethod
@@ -444,6 +529,14 @@ class recursivenamespace(SimpleNamespace):
         use_raw_key: bool = False,
     ) -> "recursivenamespace":
         try:
+            if _fast_decode_ok_(cls, accepted_iter_types, use_raw_key):
+                # Single pass: nodes are built while decoding.
+                data = json.loads(json_str, object_pairs_hook=_rns_from_pairs_)
+                if not isinstance(data, recursivenamespace):
+                    raise SerializationError(
+                        f"JSON must represent a dict, got {type(data)}"
+                    )
+                return data
             data = json.loads(json_str)
             if not isinstance(data, dict):
                 raise SerializationError(
@@ -461,7 +554,50 @@ class recursivenamespace(SimpleNamespace):
         filepath: Union[str, Path],
         accepted_iter_types: Optional[List[type]] = None,
         use_raw_key: bool = False,
+        select: Optional[Iterable[str]] = None,
+        cached: bool = False,
+        frozen: bool = False,
     ) -> "recursivenamespace":
+        """Load a JSON file whose top level is an object.
+
+        ``select`` lists chain keys to keep (e.g. ``"meta.request_id"``,
+        ``"data.users[].*.id"``); the file is then streamed and every
+        other subtree is skipped without being built.
+
+        ``cached=True`` goes through the process-wide ``load_cache``: an
+        unchanged file is not parsed again. ``frozen=True`` returns a
+        read-only tree (with ``cached``, the one shared cached tree);
+        otherwise cache hits return a fresh mutable copy.
+        """
+        if cached or frozen:
+            if select is not None:
+                select = [select] if isinstance(select, str) else list(select)
+            return _cached_load_(
+                functools.partial(
+                    cls.load_json,
+                    filepath,
+                    accepted_iter_types,
+                    use_raw_key,
+                    select,
+                ),
+                filepath,
+                (
+                    "json",
+                    cls,
+                    tuple(accepted_iter_types or ()),
+                    use_raw_key,
+                    None if select is None else tuple(select),
+                ),
+                cached,
+                frozen,
+            )
+        if select is not None:
+            return cls.load_json_stream(
+                filepath,
+                accepted_iter_types=accepted_iter_types,
+                use_raw_key=use_raw_key,
+                select=select,
+            )
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 return cls.from_json(f.read(), accepted_iter_types, use_raw_key)
@@ -470,6 +606,70 @@ class recursivenamespace(SimpleNamespace):
         except Exception as e:
             raise SerializationError(f"Failed to load JSON file: {e}")
 
+    @classmethod
+    def load_json_stream(
+        cls,
+        fp: Union[str, Path, IO[Any]],
+        chunk_size: int = streaming.DEFAULT_CHUNK_SIZE,
+        accepted_iter_types: Optional[List[type]] = None,
+        use_raw_key: bool = False,
+        select: Optional[Iterable[str]] = None,
+    ) -> "recursivenamespace":
+        """Like ``load_json`` but reads ``fp`` ``chunk_size`` at a time.
+
+        ``fp`` is a path or a text/binary file object. Nodes are built
+        as each JSON object closes, so the full text and an interim
+        dict tree are never held; peak memory is about the final tree.
+        ``select`` projects the result as in ``load_json``.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        if isinstance(select, str):
+            select = [select]
+        if isinstance(fp, (str, Path)):
+            with open(fp, "rb") as f:
+                return cls.load_json_stream(
+                    f, chunk_size, accepted_iter_types, use_raw_key, select
+                )
+        match_key = _match_key_(use_raw_key)
+        selection = None
+        if select is not None:
+            selection = streaming.compile_selection(select, match_key)
+        try:
+            node: recursivenamespace = streaming.parse_json_stream(
+                fp,
+                lambda d: cls(d, accepted_iter_types, use_raw_key),
+                chunk_size,
+                # Same as ``_process_``: objects inside arrays are built
+                # with the default options.
+                make_item_node=recursivenamespace,
+                select=selection,
+                match_key=match_key,
+            )
+            return node
+        except SerializationError:
+            raise
+        except json.JSONDecodeError as e:
+            raise SerializationError(f"Invalid JSON: {e}")
+        # Read errors, undecodable bytes, protected or unusable keys.
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            raise SerializationError(f"Failed to load JSON file: {e}")
+
+    @classmethod
+    def open_snapshot(
+        cls, filepath: Union[str, Path]
+    ) -> "snapshot.SnapshotNode":
+        """Memory-map a file written by ``obj._.save_snapshot``.
+
+        Returns a read-only ``SnapshotNode`` view of the root. Opening
+        reads only the header; each node is decoded when first accessed.
+        ``to_dict()`` / ``to_rns()`` materialize it; ``close()`` (or a
+        ``with`` block) unmaps the file.
+        """
+        return snapshot.open_snapshot(
+            filepath, lambda data, raw: cls(data, use_raw_key=raw)
+        )
+
     @classmethod
     def from_toml(
         cls,
@@ -494,7 +694,20 @@ class recursivenamespace(SimpleNamespace):
         filepath: Union[str, Path],
         accepted_iter_types: Optional[List[type]] = None,
         use_raw_key: bool = False,
+        cached: bool = False,
+        frozen: bool = False,
     ) -> "recursivenamespace":
+        """Load a TOML file; ``cached`` and ``frozen`` as in ``load_json``."""
+        if cached or frozen:
+            return _cached_load_(
+                functools.partial(
+                    cls.load_toml, filepath, accepted_iter_types, use_raw_key
+                ),
+                filepath,
+                ("toml", cls, tuple(accepted_iter_types or ()), use_raw_key),
+                cached,
+                frozen,
+            )
         if tomllib is None:
             raise ImportError(
                 "TOML support requires Python 3.11+ or 'tomli' package. "
@@ -509,6 +722,374 @@ class recursivenamespace(SimpleNamespace):
         except Exception as e:
             raise SerializationError(f"Failed to load TOML file: {e}")
 
+    @classmethod
+    def from_env(
+        cls,
+        prefix: str = "APP__",
+        sep: str = "__",
+        coerce: bool = True,
+        environ: Optional[Mapping[str, str]] = None,
+        lowercase: bool = True,
+        accepted_iter_types: Optional[List[type]] = None,
+        use_raw_key: bool = False,
+    ) -> "recursivenamespace":
+        """Build a tree from the ``prefix``-ed environment variables.
+
+        ``APP__DB__POOL__SIZE=10`` becomes ``db.pool.size``; a segment
+        ending in ``[]`` holds a list indexed by the next segment
+        (``APP__SERVERS[]__0__HOST``). ``os.environ`` (or ``environ``)
+        is scanned once and the tree is built in the same pass.
+        ``coerce`` turns ``true``/``false`` (any case), integers and
+        decimals into bool, int and float; integers with a leading zero
+        stay strings. Raises ``ValueError`` for an empty segment, a
+        non-integer list index, list indices with a gap, a key that is
+        both a value and a table, or a protected key (``APP___KEY_``).
+        """
+        tree = _env_tree_(
+            os.environ if environ is None else environ,
+            prefix,
+            sep,
+            coerce,
+            lowercase,
+        )
+        try:
+            if _fast_decode_ok_(cls, accepted_iter_types, use_raw_key):
+                result: recursivenamespace = _env_value_(tree, _rns_from_pairs_)
+                return result
+            return cls(
+                _env_value_(tree, dict), accepted_iter_types, use_raw_key
+            )
+        except KeyError as e:  # protected key
+            raise ValueError(f"{prefix}*: {e.args[0]}") from None
+
+    @classmethod
+    def from_dataclass(
+        cls,
+        obj: Any,
+        accepted_iter_types: Optional[List[type]] = None,
+        use_raw_key: bool = False,
+    ) -> "recursivenamespace":
+        """Build a tree straight from a dataclass instance's fields.
+
+        Gives what ``cls(dataclasses.asdict(obj), ...)`` would, without
+        the intermediate dicts: fields are read into nodes in one pass,
+        and leaf values are shared rather than deep-copied. Nested
+        values follow ``asdict``: dataclasses and dicts become nodes,
+        namedtuples stay namedtuples, other objects stay as they are.
+        The field list is cached per class. ``obj`` itself may also be
+        a namedtuple or a plain object, read through its ``_fields`` or
+        ``__dict__``; anything else raises ``TypeError``.
+        """
+        record = _record_pairs_(obj)
+        if record is None:
+            raise TypeError(
+                "from_dataclass() needs a dataclass, namedtuple or object "
+                f"with a __dict__, not {type(obj).__name__}"
+            )
+        types = tuple(
+            dict.fromkeys([list, tuple, set] + list(accepted_iter_types or ()))
+        )
+        config = (recursivenamespace, use_raw_key, types)
+        root: recursivenamespace = _new_node_("", (cls, use_raw_key, types))
+        _ingest_fill_(root, record[0], record[1], config)
+        return root
+
+    @classmethod
+    async def aload_json(
+        cls,
+        filepath: Union[str, Path],
+        accepted_iter_types: Optional[List[type]] = None,
+        use_raw_key: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> "recursivenamespace":
+        """Async ``load_json``: read and parse in ``executor``.
+
+        ``executor=None`` uses the running loop's default thread pool.
+        """
+        return await _run_off_loop_(
+            executor, cls.load_json, filepath, accepted_iter_types, use_raw_key
+        )
+
+    @classmethod
+    async def aload_toml(
+        cls,
+        filepath: Union[str, Path],
+        accepted_iter_types: Optional[List[type]] = None,
+        use_raw_key: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> "recursivenamespace":
+        """Async ``load_toml``: read and parse in ``executor``."""
+        return await _run_off_loop_(
+            executor, cls.load_toml, filepath, accepted_iter_types, use_raw_key
+        )
+
+    @classmethod
+    async def aload_many(
+        cls,
+        filepaths: Iterable[Union[str, Path]],
+        limit: int = 8,
+        accepted_iter_types: Optional[List[type]] = None,
+        use_raw_key: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, "recursivenamespace"]:
+        """Load JSON/TOML files concurrently, at most ``limit`` at a time.
+
+        The loader is picked from each file's suffix (``.toml`` or
+        JSON otherwise). Returns ``{str(path): RNS}`` in input order.
+        Every file is attempted; failures are raised together as a
+        ``BulkSerializationError`` carrying the successful results.
+        Cancellation and other ``BaseException``s that are not
+        ``Exception``s are not collected: the first one is re-raised.
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be >= 1, got {limit}")
+        semaphore = asyncio.Semaphore(limit)
+
+        async def load_one(path: Union[str, Path]) -> "recursivenamespace":
+            loader = cls.load_toml if _is_toml_(path) else cls.load_json
+            async with semaphore:
+                return await _run_off_loop_(
+                    executor, loader, path, accepted_iter_types, use_raw_key
+                )
+
+        paths = list(filepaths)
+        results = await asyncio.gather(
+            *(load_one(p) for p in paths), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, Exception
+            ):
+                raise result
+        return _collect_bulk_(
+            (str(p), r, r if isinstance(r, BaseException) else None)
+            for p, r in zip(paths, results)
+        )
+
+    @classmethod
+    def load_many(
+        cls,
+        filepaths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None,
+        executor: Union[str, Executor] = "process",
+        accepted_iter_types: Optional[List[type]] = None,
+        use_raw_key: bool = False,
+    ) -> Dict[str, "recursivenamespace"]:
+        """Load many JSON/TOML files in parallel.
+
+        ``executor`` is ``"process"`` (parsing is CPU-bound, so this is
+        the one that scales with cores), ``"thread"``, or an existing
+        ``concurrent.futures.Executor``. ``workers`` defaults to the CPU
+        count. Returns ``{str(path): RNS}`` in input order. Every file
+        is attempted; failures are raised together afterwards as a
+        ``BulkSerializationError`` whose ``loaded`` holds the rest.
+        """
+        paths = [str(p) for p in filepaths]
+        jobs = [(cls, p, accepted_iter_types, use_raw_key) for p in paths]
+        return _collect_bulk_(_map_bulk_(_load_one_, jobs, workers, executor))
+
+    @classmethod
+    def save_many(
+        cls,
+        targets: Dict[Union[str, Path], "recursivenamespace"],
+        workers: Optional[int] = None,
+        executor: Union[str, Executor] = "thread",
+    ) -> None:
+        """Save ``{path: RNS}`` in parallel (``save_toml`` for ``.toml``,
+        ``save_json`` otherwise).
+
+        Writing is mostly I/O, so ``executor`` defaults to ``"thread"``.
+        Every file is attempted; failures are raised together afterwards
+        as a ``BulkSerializationError``.
+        """
+        jobs = [(str(p), ns) for p, ns in targets.items()]
+        _collect_bulk_(_map_bulk_(_save_one_, jobs, workers, executor))
+
+    @classmethod
+    def watch(
+        cls,
+        filepath: Union[str, Path],
+        interval: Optional[float] = 1.0,
+        on_change: Optional[Callable[[List[str]], None]] = None,
+        accepted_iter_types: Optional[List[type]] = None,
+        use_raw_key: bool = False,
+    ) -> "FileWatcher":
+        """Load a JSON/TOML file and keep the result in sync with it.
+
+        Returns a ``FileWatcher`` whose ``tree`` is updated in place
+        when the file changes: a daemon thread checks its ``os.stat``
+        stamp every ``interval`` seconds (``None``: call ``poll()``
+        yourself), and only entries that differ are rewritten, so
+        untouched subtrees keep their identity. ``on_change`` receives
+        the changed chain keys. ``stop()`` (or a ``with`` block) ends
+        the polling.
+        """
+        # Imported here: watch -> concurrency -> main.
+        from .watch import FileWatcher
+
+        loader = cls.load_toml if _is_toml_(filepath) else cls.load_json
+        return FileWatcher(
+            filepath,
+            functools.partial(
+                loader, filepath, accepted_iter_types, use_raw_key
+            ),
+            _apply_diff_,
+            interval,
+            on_change,
+        )
+
+    @classmethod
+    def layered(
+        cls,
+        layers: Sequence[Union[Dict[str, Any], "recursivenamespace"]],
+    ) -> "LayeredRNS":
+        """Merge ``layers`` (lowest priority first) into one read view.
+
+        ``RNS.layered([defaults, site, env, cli])`` returns a
+        ``LayeredRNS``: nodes merge key by key, other values come from
+        the highest layer that defines them. ``val_get`` is served from
+        a lookup cache; when a layer is written, only the written paths
+        are re-merged and only the lookups under them are dropped.
+        """
+        # Imported here: layered imports main.
+        from .layered import LayeredRNS
+
+        return LayeredRNS(layers)
+
+    @classmethod
+    def as_schema_many(
+        cls,
+        rns_list: Iterable["recursivenamespace"],
+        schema_cls: Type[T],
+        /,
+        **kwargs: Any,
+    ) -> List[T]:
+        """``obj._.as_schema(schema_cls, **kwargs)`` for every node.
+
+        The cached plan is looked up once for the whole batch.
+        """
+        return schema.to_dataclass_many(rns_list, schema_cls, **kwargs)
+
+    @classmethod
+    def compile_schema(
+        cls, spec: Any, coerce: bool = True
+    ) -> schema.SchemaValidator:
+        """Compile ``spec`` (a dataclass or dict DSL) into a validator.
+
+        The returned ``SchemaValidator`` checks an RNS tree or a dict in
+        one pass, coercing scalars in place when ``coerce`` is set:
+        ``check(data)`` raises ``SchemaError`` listing every problem by
+        chain key, ``check.errors(data)`` returns them. Compile once and
+        reuse it; see ``schema.SchemaValidator`` for the DSL.
+        """
+        return schema.SchemaValidator(spec, coerce)
+
+    @classmethod
+    def iter_jsonl(
+        cls,
+        source: Union[str, Path, IO[Any]],
+        skip_errors: bool = False,
+        select: Optional[Iterable[str]] = None,
+        accepted_iter_types: Optional[List[type]] = None,
+        use_raw_key: bool = False,
+    ) -> Iterator["recursivenamespace"]:
+        """Yield one RNS per line of a JSON Lines (NDJSON) file.
+
+        ``source`` is a path or a text/binary file object. Lines are
+        read one at a time, so memory stays flat however long the file.
+        Blank lines are ignored. A line that is not a JSON object, or
+        whose record cannot be built (e.g. it sets a protected key),
+        raises ``SerializationError`` naming the line number, or is
+        logged and skipped with ``skip_errors=True``. ``select`` projects each
+        record as in ``load_json``.
+        """
+        if isinstance(source, (str, Path)):
+            with open(source, "rb") as f:
+                yield from cls.iter_jsonl(
+                    f, skip_errors, select, accepted_iter_types, use_raw_key
+                )
+            return
+        if isinstance(select, str):
+            select = [select]
+        match_key = _match_key_(use_raw_key)
+        selection = None
+        if select is not None:
+            selection = streaming.compile_selection(select, match_key)
+        hook = None
+        if selection is None and _fast_decode_ok_(
+            cls, accepted_iter_types, use_raw_key
+        ):
+            hook = _rns_from_pairs_
+        for lineno, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line, object_pairs_hook=hook)
+                if not isinstance(data, (dict, recursivenamespace)):
+                    raise TypeError(f"expected an object, got {type(data)}")
+                # The decoder hook may already have built the node.
+                if not isinstance(data, recursivenamespace):
+                    if selection is not None:
+                        data = streaming.project(data, selection, match_key)
+                    data = cls(data, accepted_iter_types, use_raw_key)
+            except (ValueError, KeyError, TypeError) as e:
+                if not skip_errors:
+                    raise SerializationError(
+                        f"Invalid JSON Lines record on line {lineno}: {e}"
+                    ) from e
+                cls._logger_.warning(
+                    "Skipping invalid JSON Lines record on line %d: %s",
+                    lineno,
+                    e,
+                )
+                continue
+            yield data
+
+    @classmethod
+    def write_jsonl(
+        cls,
+        records: Iterable[Union[Dict[str, Any], "recursivenamespace"]],
+        target: Union[str, Path, IO[str]],
+        batch_size: int = 1000,
+        ensure_ascii: bool = True,
+    ) -> int:
+        """Write each record as one compact JSON line; return the count.
+
+        ``target`` is a path (parent directories are created) or a text
+        file object. Records are encoded one by one but written
+        ``batch_size`` lines per ``write`` call.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if isinstance(target, (str, Path)):
+            path = Path(target)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                return cls.write_jsonl(records, f, batch_size, ensure_ascii)
+        encode = json.JSONEncoder(
+            ensure_ascii=ensure_ascii, separators=(",", ":")
+        ).encode
+        batch: List[str] = []
+        count = 0
+        for record in records:
+            if isinstance(record, recursivenamespace):
+                record = _StaticImpl.to_dict(record)
+            try:
+                batch.append(encode(record))
+            except (TypeError, ValueError) as e:
+                raise SerializationError(
+                    f"Failed to serialize JSON Lines record {count}: {e}"
+                )
+            count += 1
+            if len(batch) == batch_size:
+                batch.append("")
+                target.write("\n".join(batch))
+                batch.clear()
+        if batch:
+            batch.append("")
+            target.write("\n".join(batch))
+        return count
+
     # ── Public-method shims (warn + delegate to _StaticImpl) ──────
 
     @_deprecated
@@ -652,8 +1233,9 @@ class _StaticImpl:
             raise TypeError(
                 f"Failed to update with data of type {type(data)}"
             ) from e
-        for key, val in _StaticImpl.items(data):
-            rns_ins[key] = val
+        with _mutation_batch_(rns_ins):
+            for key, val in _StaticImpl.items(data):
+                rns_ins[key] = val
 
     @staticmethod
     def copy(rns_ins: "recursivenamespace") -> "recursivenamespace":
@@ -675,7 +1257,7 @@ class _StaticImpl:
             raise KeyError(f"The key '{key}' is protected.")
         if key in rns_ins.__dict__:
             val = rns_ins.__dict__[key]
-            del rns_ins.__dict__[key]
+            delattr(rns_ins, key)
             return val
         return default
 
@@ -716,7 +1298,9 @@ class _StaticImpl:
             elif isinstance(v, dict):
                 pairs.append((k, v))
             elif (
-                hasattr(v, "__iter__") and type(v) in rns_ins._supported__types_
+                hasattr(v, "__iter__")
+                and _THAWED_TYPES_.get(type(v), type(v))
+                in rns_ins._supported__types_
             ):
                 pairs.append((k, rns_ins._iter_to_dict_(v)))
             else:
@@ -783,13 +1367,15 @@ class _StaticImpl:
         /,
         **kwargs: Any,
     ) -> T:
-        if not dataclasses.is_dataclass(schema_cls):
-            raise TypeError("The 'schema_cls' must be a DataClass type.")
-        fields = dataclasses.fields(schema_cls)
-        for field in fields:
-            name = field.name
-            kwargs[name] = rns_ins[name]
-        return schema_cls(**kwargs)
+        """Build the dataclass ``schema_cls`` from this node's data.
+
+        Nested nodes become nested dataclasses, following the resolved
+        type hints (also inside ``Optional``, ``List``, ``Tuple`` and
+        ``Dict`` fields). The per-class plan is built once and cached.
+        Fields missing from the node come from ``kwargs``, then from
+        their defaults.
+        """
+        return schema.to_dataclass(rns_ins, schema_cls, **kwargs)
 
     @staticmethod
     @contextlib.contextmanager
@@ -808,21 +1394,78 @@ class _StaticImpl:
         originals: Dict[str, Any] = {}
         added_keys: List[str] = []
 
-        for key, value in overrides.items():
-            nk = rns_ins._re_(key)
-            if nk in rns_ins.__dict__ and nk not in rns_ins._protected__keys_:
-                originals[nk] = rns_ins.__dict__[nk]
-            else:
-                added_keys.append(nk)
-            rns_ins[key] = value
+        with _mutation_batch_(rns_ins):
+            for key, value in overrides.items():
+                nk = rns_ins._re_(key)
+                if (
+                    nk in rns_ins.__dict__
+                    and nk not in rns_ins._protected__keys_
+                ):
+                    originals[nk] = rns_ins.__dict__[nk]
+                else:
+                    added_keys.append(nk)
+                rns_ins[key] = value
 
         try:
             yield rns_ins
         finally:
-            for k, v in originals.items():
-                rns_ins.__dict__[k] = v
-            for k in added_keys:
-                rns_ins.__dict__.pop(k, None)
+            with _mutation_batch_(rns_ins):
+                for k, v in originals.items():
+                    old = rns_ins.__dict__.get(k, events.MISSING)
+                    rns_ins.__dict__[k] = v
+                    if rns_ins._binding_ is not None:
+                        rns_ins._notify_(k, old, v)
+                for k in added_keys:
+                    old = rns_ins.__dict__.pop(k, events.MISSING)
+                    if (
+                        rns_ins._binding_ is not None
+                        and old is not events.MISSING
+                    ):
+                        rns_ins._notify_(k, old, events.MISSING)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def scoped_overlay(
+        rns_ins: "recursivenamespace", overrides: Dict[str, Any]
+    ) -> Generator["recursivenamespace", None, None]:
+        """Apply *overrides* for the current context only.
+
+        Unlike ``overlay``, the shared tree is not written: overrides
+        live in a ``contextvars.ContextVar``, so they are visible only to
+        the current thread / asyncio task, and to tasks it spawns, while
+        the block is open. A spawned task that outlives the block reads
+        the base tree from then on. Keys may be chain-keys
+        (``"db.pool.size"``). Attribute access, ``[]``, ``in``,
+        ``val_get`` and ``get_or_else`` see the overrides; ``items``,
+        ``to_dict`` and the serializers see the shared base tree.
+
+        Entering costs O(number of overrides). Each overridden node is
+        switched to a read-hook subclass while any block (in any
+        thread) targets it, so ``type(node)`` changes for every thread
+        during that time; ``isinstance`` checks, copies and pickles are
+        unaffected. Nodes that are not overridden in any open block
+        keep their class and read at full speed.
+        """
+        current = _SCOPED_OVERRIDES_.get()
+        layered = dict(current)
+        nodes: List["recursivenamespace"] = []
+        for chain_key, value in overrides.items():
+            node, key = _scoped_target_(rns_ins, chain_key)
+            entry = layered.get(id(node))
+            if entry is None or entry is current.get(id(node)):
+                entry = (node, dict(entry[1]) if entry else {})
+                layered[id(node)] = entry
+                nodes.append(node)
+            entry[1][key] = value
+        _scoped_acquire_(nodes)
+        try:
+            token = _SCOPED_OVERRIDES_.set(layered)
+            try:
+                yield rns_ins
+            finally:
+                _SCOPED_OVERRIDES_.reset(token)
+        finally:
+            _scoped_release_(nodes)
 
     @staticmethod
     def to_json(
@@ -848,58 +1491,1075 @@ class _StaticImpl:
         rns_ins: "recursivenamespace",
         filepath: Union[str, Path],
         indent: Optional[int] = 2,
+        stream: bool = False,
         **kwargs: Any,
     ) -> None:
+        """Write the tree to ``filepath`` as JSON, like ``to_json``.
+
+        The document is encoded in one ``json.dumps`` call, which uses
+        the C encoder. ``stream=True`` writes through ``dump_json``
+        instead: about half as fast, but without the ``to_dict`` copy
+        and the complete string, for trees too large to hold twice.
+        """
         try:
             filepath = Path(filepath)
             filepath.parent.mkdir(parents=True, exist_ok=True)
             with open(filepath, "w", encoding="utf-8") as f:
-                f.write(_StaticImpl.to_json(rns_ins, indent=indent, **kwargs))
+                if stream:
+                    _StaticImpl.dump_json(rns_ins, f, indent=indent, **kwargs)
+                else:
+                    f.write(
+                        _StaticImpl.to_json(rns_ins, indent=indent, **kwargs)
+                    )
         except Exception as e:
             raise SerializationError(f"Failed to save JSON file: {e}")
 
+    @staticmethod
+    def dump_json(
+        rns_ins: "recursivenamespace",
+        fp: IO[Any],
+        indent: Optional[int] = 2,
+        chunk_size: int = 64 * 1024,
+        sort_keys: bool = False,
+        ensure_ascii: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """Encode to ``fp`` incrementally; output matches ``to_json``.
+
+        Nodes are encoded one level at a time straight from the tree
+        (``JSONEncoder.iterencode``), with no ``to_dict`` copy and no
+        complete string; output is written in ``chunk_size`` pieces.
+        ``fp`` may be a text or binary (UTF-8) file object.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        fallback = kwargs.pop("default", None)
+
+        def default(o: Any) -> Any:
+            if isinstance(o, recursivenamespace):
+                return dict(_StaticImpl.items(o))
+            if fallback is not None:
+                return fallback(o)
+            raise TypeError(
+                f"Object of type {type(o).__name__} is not JSON serializable"
+            )
+
+        encoder = json.JSONEncoder(
+            indent=indent,
+            sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii,
+            default=default,
+            **kwargs,
+        )
+        try:
+            _write_chunked_(fp, encoder.iterencode(rns_ins), chunk_size)
+        except (TypeError, ValueError) as e:
+            raise SerializationError(f"Failed to serialize to JSON: {e}")
+
+    @staticmethod
+    def save_snapshot(
+        rns_ins: "recursivenamespace", filepath: Union[str, Path]
+    ) -> None:
+        """Write a binary snapshot for ``RNS.open_snapshot``.
+
+        Supports the values ``to_dict`` produces from JSON/TOML-like
+        data (None, bool, int, float, str, bytes, nodes, dicts, lists,
+        tuples, sets); anything else raises ``SerializationError``.
+        """
+        flags = snapshot.FLAG_RAW_KEY if rns_ins._use__raw_key_ else 0
+        try:
+            filepath = Path(filepath)
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(filepath, "wb") as f:
+                snapshot.write_snapshot(f, rns_ins, _snapshot_items_, flags)
+        # Write errors, unencodable text, or lengths past the 32-bit
+        # fields (``struct.error``).
+        except (OSError, ValueError, struct.error) as e:
+            raise SerializationError(f"Failed to save snapshot: {e}")
+
     @staticmethod
     def to_toml(rns_ins: "recursivenamespace") -> str:
+        buf = io.StringIO()
+        _StaticImpl.dump_toml(rns_ins, buf)
+        return buf.getvalue()
+
+    @staticmethod
+    def dump_toml(
+        rns_ins: "recursivenamespace",
+        fp: IO[Any],
+        chunk_size: int = 64 * 1024,
+    ) -> None:
+        """Write TOML to ``fp`` incrementally; output matches ``to_toml``.
+
+        The tree is walked iteratively (no ``to_dict`` copy) and lines
+        are written in ``chunk_size`` pieces. Lists of tables become
+        ``[[arrays.of.tables]]``, tables inside other arrays become
+        inline tables, and date-times are written natively. ``None``
+        table values are omitted (TOML has no null); values TOML cannot
+        hold are written as comments. ``fp`` may be text or binary.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        lines = toml_writer.iter_toml(
+            rns_ins, recursivenamespace, _StaticImpl.items
+        )
         try:
-            return recursivenamespace._dict_to_toml_(
-                _StaticImpl.to_dict(rns_ins)
-            )
-        except Exception as e:
+            _write_chunked_(fp, lines, chunk_size)
+        except (TypeError, ValueError) as e:
             raise SerializationError(f"Failed to serialize to TOML: {e}")
 
     @staticmethod
     def save_toml(
-        rns_ins: "recursivenamespace", filepath: Union[str, Path]
+        rns_ins: "recursivenamespace",
+        filepath: Union[str, Path],
+        chunk_size: int = 64 * 1024,
     ) -> None:
         try:
             filepath = Path(filepath)
             filepath.parent.mkdir(parents=True, exist_ok=True)
             with open(filepath, "w", encoding="utf-8") as f:
-                f.write(_StaticImpl.to_toml(rns_ins))
+                _StaticImpl.dump_toml(rns_ins, f, chunk_size)
         except Exception as e:
             raise SerializationError(f"Failed to save TOML file: {e}")
 
+    @staticmethod
+    async def asave_json(
+        rns_ins: "recursivenamespace",
+        filepath: Union[str, Path],
+        indent: Optional[int] = 2,
+        executor: Optional[Executor] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Async ``save_json``: serialize and write in ``executor``."""
+        await _run_off_loop_(
+            executor,
+            functools.partial(_StaticImpl.save_json, indent=indent, **kwargs),
+            rns_ins,
+            filepath,
+        )
 
-# ──────────────────────────────────────────────────────────────────
-# Bound proxy + descriptor for ``obj._``
-# ──────────────────────────────────────────────────────────────────
+    @staticmethod
+    async def asave_toml(
+        rns_ins: "recursivenamespace",
+        filepath: Union[str, Path],
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Async ``save_toml``: serialize and write in ``executor``."""
+        await _run_off_loop_(executor, _StaticImpl.save_toml, rns_ins, filepath)
 
+    @staticmethod
+    def track_changes(
+        rns_ins: "recursivenamespace", enable: bool = True
+    ) -> None:
+        """Start (or stop) recording the chain-keys written on this tree.
+
+        Writes made through ``__setitem__``, ``val_set``, ``update``,
+        ``pop``, ``overlay`` and ``del`` are journaled until the next
+        ``checkpoint()``. Paths are relative to the node the tree's hub
+        was created on. Plain attribute assignment (``obj.a = 1``) is
+        journaled too; in-place list methods (``obj.l.append(x)``) are
+        not.
+        """
+        hub = _hub_for_(rns_ins, create=enable)
+        if hub is None:
+            return
+        if enable:
+            if hub.journal is None:
+                hub.journal = events.ChangeJournal()
+                hub.add_listener(hub.journal)
+            return
+        if hub.journal is not None:
+            hub.remove_listener(hub.journal)
+            hub.journal = None
+        _release_hub_(rns_ins, hub)
 
-class _BoundProxy:
-    """Curries the owner into ``_StaticImpl`` calls so ``obj._.to_dict()``
-    works as a normal bound-method call."""
+    @staticmethod
+    def changes(rns_ins: "recursivenamespace") -> List[str]:
+        """Chain-keys written since tracking started or the last checkpoint."""
+        return _journal_for_(rns_ins).paths()
 
-    __slots__ = ("_owner",)
+    @staticmethod
+    def checkpoint(rns_ins: "recursivenamespace") -> List[str]:
+        """Return ``changes()`` and start a fresh journal."""
+        return _journal_for_(rns_ins).reset()
 
-    def __init__(self, owner: "recursivenamespace") -> None:
-        object.__setattr__(self, "_owner", owner)
+    @staticmethod
+    def subscribe(
+        rns_ins: "recursivenamespace",
+        pattern: str,
+        callback: Callable[[List[events.Mutation]], None],
+    ) -> None:
+        """Call ``callback(mutations)`` when a path matching ``pattern``
+        changes.
+
+        ``pattern`` is a chain-key relative to ``rns_ins`` whose segments
+        may be ``*`` (e.g. ``"db.pool.*"``). Writes on or below a match,
+        and replacement of an ancestor, both notify. Inside ``batch()``
+        (and for each ``update`` / ``overlay`` call) the matching
+        mutations are coalesced into a single call per subscriber.
+        """
+        hub = _hub_for_(rns_ins, create=True)
+        assert hub is not None
+        if hub.subscriptions is None:
+            hub.subscriptions = events.SubscriptionTrie(hub)
+            hub.add_listener(hub.subscriptions)
+        hub.subscriptions.subscribe(_hub_pattern_(rns_ins, pattern), callback)
 
-    def __getattr__(self, name: str) -> Any:
-        if name.startswith("_"):
-            raise AttributeError(name)
-        attr = getattr(_StaticImpl, name, None)
-        if attr is None or not callable(attr):
-            raise AttributeError(name)
+    @staticmethod
+    def unsubscribe(
+        rns_ins: "recursivenamespace",
+        pattern: str,
+        callback: Callable[[List[events.Mutation]], None],
+    ) -> None:
+        """Remove a ``subscribe(pattern, callback)`` registration."""
+        hub = _hub_for_(rns_ins, create=False)
+        if hub is None or hub.subscriptions is None:
+            return
+        trie = hub.subscriptions
+        trie.unsubscribe(_hub_pattern_(rns_ins, pattern), callback)
+        if not trie:
+            hub.remove_listener(trie)
+            hub.subscriptions = None
+            _release_hub_(rns_ins, hub)
+
+    @staticmethod
+    def batch(
+        rns_ins: "recursivenamespace",
+    ) -> contextlib.AbstractContextManager[None]:
+        """Coalesce subscriber notifications until the block exits."""
+        return _mutation_batch_(rns_ins)
+
+    @staticmethod
+    def history(
+        rns_ins: "recursivenamespace", max_depth: int = 100
+    ) -> events.History:
+        """Record undoable steps for this tree and return the history.
+
+        Every write (or every ``batch()`` / ``update()``) becomes one
+        step; ``undo()`` / ``redo()`` replay inverse operations on the
+        changed nodes only. At most ``max_depth`` steps are kept. Call
+        again to fetch the same history (resizing it if ``max_depth``
+        differs) and ``close()`` it to stop recording.
+        """
+        hub = _hub_for_(rns_ins, create=True)
+        assert hub is not None
+        if hub.history is None:
+            hub.history = events.History(
+                hub,
+                functools.partial(_replay_mutation_, hub),
+                max_depth,
+                functools.partial(_release_hub_, rns_ins, hub),
+            )
+            hub.add_listener(hub.history)
+        elif hub.history.max_depth != max_depth:
+            hub.history.max_depth = max_depth
+        return hub.history
+
+    @staticmethod
+    @contextlib.contextmanager
+    def transaction(
+        rns_ins: "recursivenamespace",
+    ) -> Generator["recursivenamespace", None, None]:
+        """Apply the writes made in the block atomically.
+
+        Writes take effect immediately (reads inside the block see them)
+        and are logged with their previous values. If the block raises —
+        e.g. ``SetChainKeyError`` half-way through a run of ``val_set``
+        calls — the log is replayed backwards and the tree is restored
+        exactly. On success, journal, subscribers and history see the
+        whole transaction once, as a single batch. Nested transactions
+        act as savepoints.
+
+        The log only holds what the block changed, so rollback costs
+        O(writes), not O(tree size). In-place list methods such as
+        ``cfg.hosts.append(x)`` bypass the nodes and are not undone;
+        write list items with ``val_set('hosts[].#', x)`` instead.
+
+        Trees that are not already observed are bound to a hub for the
+        duration of the block, which costs one more walk of the tree.
+        """
+        hub = _hub_for_(rns_ins, create=True)
+        assert hub is not None
+        outermost = hub.transaction is None
+        if outermost:
+            hub.transaction = events.Transaction()
+        txn = hub.transaction
+        assert txn is not None
+        savepoint = len(txn.log)
+        try:
+            yield rns_ins
+        except BaseException:
+            for mutation in reversed(txn.log[savepoint:]):
+                _replay_mutation_(hub, mutation, mutation.old, notify=False)
+            del txn.log[savepoint:]
+            if outermost:
+                hub.transaction = None
+                _release_hub_(rns_ins, hub)
+            raise
+        if outermost:
+            hub.transaction = None
+            try:
+                with hub.batch():
+                    for mutation in txn.log:
+                        hub.emit(mutation)
+            finally:
+                _release_hub_(rns_ins, hub)
+
+
+# ──────────────────────────────────────────────────────────────────
+# Async / bulk file helpers
+# ──────────────────────────────────────────────────────────────────
+
+
+def _snapshot_items_(value: Any) -> Optional[List[Tuple[str, Any]]]:
+    if isinstance(value, recursivenamespace):
+        return _StaticImpl.items(value)
+    return None
+
+
+def _write_chunked_(
+    fp: IO[Any], pieces: Iterable[str], chunk_size: int
+) -> None:
+    """Write ``pieces`` to ``fp`` in about ``chunk_size`` characters."""
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+    buffer: List[str] = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            text = "".join(buffer)
+            fp.write(text.encode("utf-8") if binary else text)
+            buffer.clear()
+            size = 0
+    text = "".join(buffer)
+    if text:
+        fp.write(text.encode("utf-8") if binary else text)
+
+
+def _match_key_(use_raw_key: bool) -> Callable[[str], str]:
+    """Key as stored by a node built with ``use_raw_key`` (see ``_re_``)."""
+    if use_raw_key:
+        return str
+    return functools.partial(_KEY_NORMALIZE_RE.sub, "_")
+
+
+def _run_off_loop_(
+    executor: Optional[Executor], func: Callable[..., T], *args: Any
+) -> "asyncio.Future[T]":
+    """Schedule ``func(*args)`` on ``executor`` from the running loop."""
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(executor, functools.partial(func, *args))
+
+
+def _is_toml_(filepath: Union[str, Path]) -> bool:
+    return Path(filepath).suffix.lower() == ".toml"
+
+
+_BulkOutcome = Tuple[str, Any, Optional[BaseException]]
+
+
+def _load_one_(job: Tuple[Any, str, Any, bool]) -> _BulkOutcome:
+    """Worker for ``load_many``; module-level so process pools can pickle
+    it. Errors are returned, not raised, so one bad file cannot abort
+    the map."""
+    cls, path, accepted_iter_types, use_raw_key = job
+    loader = cls.load_toml if _is_toml_(path) else cls.load_json
+    try:
+        return path, loader(path, accepted_iter_types, use_raw_key), None
+    # The loaders wrap everything else in SerializationError; missing
+    # files and a missing TOML parser come through as they are.
+    except (OSError, ImportError, SerializationError) as e:
+        return path, None, e
+
+
+def _save_one_(job: Tuple[str, "recursivenamespace"]) -> _BulkOutcome:
+    path, rns_ins = job
+    saver = _StaticImpl.save_toml if _is_toml_(path) else _StaticImpl.save_json
+    try:
+        saver(rns_ins, path)
+        return path, None, None
+    except SerializationError as e:  # the savers wrap every failure
+        return path, None, e
+
+
+def _map_bulk_(
+    worker: Callable[[Any], _BulkOutcome],
+    jobs: List[Any],
+    workers: Optional[int],
+    executor: Union[str, Executor],
+) -> List[_BulkOutcome]:
+    if not jobs:
+        return []
+    if isinstance(executor, Executor):
+        return list(executor.map(worker, jobs))
+    n_workers = workers or os.cpu_count() or 1
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            return list(pool.map(worker, jobs))
+    if executor == "process":
+        # Batch jobs per task: per-file IPC would dominate small files.
+        chunksize = max(1, len(jobs) // (n_workers * 4))
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            return list(pool.map(worker, jobs, chunksize=chunksize))
+    raise ValueError(
+        f"executor must be 'process', 'thread' or an Executor, got {executor!r}"
+    )
+
+
+def _collect_bulk_(outcomes: Iterable[_BulkOutcome]) -> Dict[str, Any]:
+    loaded: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    for path, value, error in outcomes:
+        if error is None:
+            loaded[path] = value
+        else:
+            errors[path] = error
+    if errors:
+        raise BulkSerializationError(errors, loaded)
+    return loaded
+
+
+# ──────────────────────────────────────────────────────────────────
+# Mutation-hub plumbing shared by the observing features
+# ──────────────────────────────────────────────────────────────────
+
+
+_BINDABLE_TYPES_ = (recursivenamespace, list, tuple)
+
+
+def _bind_tree_(
+    value: Any, hub: Optional[events.MutationHub], path: str
+) -> None:
+    """Point every RNS node under ``value`` at ``hub`` (or unbind).
+
+    Iterative so arbitrarily deep trees do not hit the recursion limit.
+    Nodes reached through lists/tuples get ``key[].<i>`` paths. Each
+    node and list is visited once, so self-referencing trees terminate;
+    a node already bound to ``hub`` at an ancestor of the path it is
+    reached by is a back-reference and keeps its path. When unbinding,
+    ``path`` is where ``value`` was detached: nodes bound at another
+    path are still reachable elsewhere and are left alone.
+    """
+    if not isinstance(value, _BINDABLE_TYPES_):
+        return
+    seen: Set[int] = set()
+    stack = [(value, path)]
+    while stack:
+        val, val_path = stack.pop()
+        if id(val) in seen:
+            continue
+        seen.add(id(val))
+        if isinstance(val, recursivenamespace):
+            binding = val._binding_
+            if hub is not None:
+                if (
+                    binding is not None
+                    and binding.hub is hub
+                    and events.is_descendant_path(binding.path, val_path)
+                ):
+                    # Already bound above ``val_path``: a back-reference.
+                    continue
+                val._binding_ = events.Binding(hub, val_path)
+            elif binding is None or binding.path != val_path:
+                continue
+            else:
+                val._binding_ = None
+            for k, v in _StaticImpl.items(val):
+                stack.append((v, events.child_path(val_path, k)))
+        elif isinstance(val, (list, tuple)):
+            for i, v in enumerate(val):
+                stack.append((v, events.item_path(val_path, i)))
+
+
+def _hub_for_(
+    rns_ins: "recursivenamespace", create: bool
+) -> Optional[events.MutationHub]:
+    """Return the hub observing ``rns_ins``, creating a root one if asked."""
+    if rns_ins._binding_ is not None:
+        return rns_ins._binding_.hub
+    if not create:
+        return None
+    hub = events.MutationHub()
+    _bind_tree_(rns_ins, hub, "")
+    return hub
+
+
+def _release_hub_(
+    rns_ins: "recursivenamespace", hub: events.MutationHub
+) -> None:
+    """Unbind the tree once its hub has nothing left to notify."""
+    binding = rns_ins._binding_
+    if not hub.listeners and binding is not None and binding.path == "":
+        _bind_tree_(rns_ins, None, "")
+
+
+def _replay_mutation_(
+    hub: events.MutationHub,
+    mutation: events.Mutation,
+    value: Any,
+    notify: bool = True,
+) -> None:
+    """Write ``value`` back to where ``mutation`` happened and re-emit.
+
+    ``value`` is ``mutation.old`` when undoing and ``mutation.new`` when
+    redoing; ``MISSING`` removes the entry (or the appended list item).
+    Transaction rollback passes ``notify=False``.
+    """
+    container, key = mutation.container, mutation.key
+    if isinstance(container, list):
+        assert isinstance(key, int)
+        current = container[key] if key < len(container) else events.MISSING
+        if value is events.MISSING:
+            del container[key]
+        elif key == len(container):
+            container.append(value)
+        else:
+            container[key] = value
+    else:
+        assert isinstance(key, str)
+        current = container.__dict__.get(key, events.MISSING)
+        if value is events.MISSING:
+            container.__dict__.pop(key, None)
+        else:
+            container.__dict__[key] = value
+    if current is not events.MISSING:
+        _bind_tree_(current, None, mutation.path)
+    if value is not events.MISSING:
+        _bind_tree_(value, hub, mutation.path)
+    if notify:
+        hub.emit(events.Mutation(mutation.path, container, key, current, value))
+
+
+def _mutation_batch_(
+    rns_ins: "recursivenamespace",
+) -> contextlib.AbstractContextManager[None]:
+    binding = rns_ins._binding_
+    if binding is None:
+        return contextlib.nullcontext()
+    return binding.hub.batch()
+
+
+def _hub_pattern_(rns_ins: "recursivenamespace", pattern: str) -> str:
+    """Re-root a pattern given on ``rns_ins`` at the hub's root node."""
+    binding = rns_ins._binding_
+    if binding is None or not binding.path:
+        return pattern
+    if not pattern:
+        return binding.path
+    return f"{binding.path}{utils.KEY_SEP_CHAR}{pattern}"
+
+
+def _journal_for_(rns_ins: "recursivenamespace") -> events.ChangeJournal:
+    hub = _hub_for_(rns_ins, create=False)
+    if hub is None or hub.journal is None:
+        raise ChangeTrackingError(
+            "Change tracking is not enabled; call obj._.track_changes() first."
+        )
+    return hub.journal
+
+
+# ──────────────────────────────────────────────────────────────────
+# Context-scoped overlays
+# ──────────────────────────────────────────────────────────────────
+
+# id(node) -> (node, {key: value}). Never mutated in place: every
+# ``scoped_overlay`` sets a new mapping so parent contexts are unchanged.
+_SCOPED_OVERRIDES_: contextvars.ContextVar[
+    Mapping[int, Tuple["recursivenamespace", Dict[str, Any]]]
+] = contextvars.ContextVar("rns_scoped_overrides", default=MappingProxyType({}))
+
+# id(node) -> number of open ``scoped_overlay`` blocks, in any context,
+# that override it. The node keeps its scoped class while this is > 0.
+_SCOPED_USERS_: Dict[int, int] = {}
+_SCOPED_LOCK_ = threading.Lock()
+
+
+class _ScopedMixin:
+    """Read-side hook for nodes that carry context-scoped overrides.
+
+    A node is switched to a ``_ScopedMixin`` subclass while at least
+    one ``scoped_overlay`` block targets it and switched back when the
+    last one exits, so other nodes keep the plain class and pay nothing
+    on attribute access.
+    """
+
+    __slots__ = ()
+    _scoped__base_: type
+
+    def __getattribute__(self, name: str) -> Any:
+        scoped = _SCOPED_OVERRIDES_.get()
+        if scoped:
+            entry = scoped.get(id(self))
+            if entry is not None and name in entry[1]:
+                return entry[1][name]
+        return object.__getattribute__(self, name)
+
+    def __contains__(self, key: str) -> bool:
+        key = self._re_(key)
+        if key in self.__dict__:
+            return True
+        entry = _SCOPED_OVERRIDES_.get().get(id(self))
+        return entry is not None and key in entry[1]
+
+    def __reduce__(self) -> Any:
+        # Pickle as the original class; overrides are context state.
+        return _rns_reduce_(self, self._scoped__base_)
+
+
+_SCOPED_CLASSES_: Dict[type, type] = {}
+
+
+def _scoped_class_(cls: type) -> type:
+    scoped = _SCOPED_CLASSES_.get(cls)
+    if scoped is None:
+        scoped = type(
+            f"Scoped{cls.__name__}",
+            (_ScopedMixin, cls),
+            {"__slots__": (), "_scoped__base_": cls},
+        )
+        _SCOPED_CLASSES_[cls] = scoped
+    return scoped
+
+
+def _scoped_target_(
+    rns_ins: "recursivenamespace", chain_key: str
+) -> Tuple["recursivenamespace", str]:
+    """Resolve ``chain_key`` to (parent node, normalized leaf key)."""
+    *parents, leaf = utils.split_key(chain_key)
+    node: Any = rns_ins
+    if parents:
+        node = _StaticImpl.val_get(rns_ins, utils.join_key(parents))
+        if not isinstance(node, recursivenamespace):
+            raise SetChainKeyError(node, utils.join_key(parents), leaf)
+    leaf = node._re_(utils.unescape_key(leaf))
+    if leaf[-2:] == utils.KEY_ARRAY:
+        raise KeyError(
+            f"Invalid scoped override '{chain_key}': array elements "
+            f"cannot be overridden, override the whole list instead."
+        )
+    if leaf in node._protected__keys_:
+        raise KeyError(f"The key '{leaf}' is protected.")
+    return node, leaf
+
+
+def _scoped_acquire_(nodes: List["recursivenamespace"]) -> None:
+    """Count a new block on each of ``nodes``, switching the class once."""
+    with _SCOPED_LOCK_:
+        for node in nodes:
+            count = _SCOPED_USERS_.get(id(node), 0)
+            if not isinstance(node, _ScopedMixin):
+                node.__class__ = _scoped_class_(type(node))
+            _SCOPED_USERS_[id(node)] = count + 1
+
+
+def _scoped_release_(nodes: List["recursivenamespace"]) -> None:
+    """Undo ``_scoped_acquire_``; the last block restores the class."""
+    with _SCOPED_LOCK_:
+        for node in nodes:
+            count = _SCOPED_USERS_.pop(id(node)) - 1
+            if count:
+                _SCOPED_USERS_[id(node)] = count
+                continue
+            base = getattr(type(node), "_scoped__base_", None)
+            # Leave nodes alone if their class changed in the meantime.
+            if base is not None and _SCOPED_CLASSES_.get(base) is type(node):
+                node.__class__ = base
+
+
+# ──────────────────────────────────────────────────────────────────
+# Frozen trees and the load cache
+# ──────────────────────────────────────────────────────────────────
+
+_FROZEN_MESSAGE_ = (
+    "RNS node is frozen (a shared, read-only tree); "
+    "use obj._.deepcopy() for a mutable copy"
+)
+
+
+class _FrozenMixin:
+    """Write guard for trees returned with ``frozen=True``.
+
+    Frozen nodes are shared by every caller, so attribute, item and
+    chain-key writes (and anything that re-keys or binds a node) raise
+    ``AttributeError``. Lists and sets inside are stored as read-only
+    subclasses that raise the same way. Copies and pickles are plain,
+    mutable nodes with plain lists and sets.
+    """
+
+    __slots__ = ()
+    _frozen__base_: Type["recursivenamespace"]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "__class__":  # scoped_overlay swaps the class
+            object.__setattr__(self, name, value)
+            return
+        raise AttributeError(_FROZEN_MESSAGE_)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(_FROZEN_MESSAGE_)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        raise AttributeError(_FROZEN_MESSAGE_)
+
+    def _chain_set_array_(self, key: str, subs: List[str], value: Any) -> None:
+        # Array writes go through the (read-only) list itself; refuse
+        # them before a missing list would be created.
+        raise AttributeError(_FROZEN_MESSAGE_)
+
+    def __copy__(self) -> Any:
+        base = self._frozen__base_
+        result = base.__new__(base)
+        result._binding_ = None
+        result.__dict__.update(_thawed_attrs_(self.__dict__))
+        return result
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+        return _clone_tree_(self)
+
+    def __reduce__(self) -> Any:
+        return _rns_reduce_(self, self._frozen__base_)
+
+
+def _frozen_write_(self: Any, *args: Any) -> Any:
+    raise AttributeError(_FROZEN_MESSAGE_)
+
+
+class _FrozenList(list):  # type: ignore[type-arg]
+    """List inside a frozen tree; in-place changes raise.
+
+    Compares, iterates and serializes like a list. Copies and pickles
+    are plain lists.
+    """
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen_write_
+    append = extend = insert = pop = remove = _frozen_write_
+    clear = sort = reverse = _frozen_write_  # type: ignore[assignment]
+
+    def __reduce__(self) -> Any:
+        return (list, (list(self),))
+
+
+class _FrozenSet(set):  # type: ignore[type-arg]
+    """Set inside a frozen tree; in-place changes raise."""
+
+    __slots__ = ()
+    add = discard = remove = pop = clear = update = _frozen_write_
+    difference_update = intersection_update = _frozen_write_
+    symmetric_difference_update = _frozen_write_
+    __ior__ = __iand__ = __isub__ = __ixor__ = _frozen_write_
+
+    def __reduce__(self) -> Any:
+        return (set, (set(self),))
+
+
+# Read-only container type -> the plain type it stands in for.
+_THAWED_TYPES_: Dict[type, type] = {_FrozenList: list, _FrozenSet: set}
+
+
+_FROZEN_CLASSES_: Dict[type, type] = {}
+
+
+def _frozen_class_(cls: type) -> type:
+    frozen = _FROZEN_CLASSES_.get(cls)
+    if frozen is None:
+        frozen = type(
+            f"Frozen{cls.__name__}",
+            (_FrozenMixin, cls),
+            {"__slots__": (), "_frozen__base_": cls},
+        )
+        _FROZEN_CLASSES_[cls] = frozen
+    return frozen
+
+
+def _freeze_tree_(root: "recursivenamespace") -> "recursivenamespace":
+    """Switch every node under ``root`` to its frozen class, in place.
+
+    Lists and sets are replaced by read-only copies, so nothing
+    reachable from a shared tree can be changed through it.
+    """
+    seen: set[int] = set()
+    stack: List[Any] = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if not isinstance(node, _FrozenMixin):
+            node.__class__ = _frozen_class_(type(node))
+        attrs = node.__dict__
+        for key, value in attrs.items():
+            if (
+                type(value) not in _SHARED_LEAF_TYPES_
+                and key not in _NODE_ATTRS_
+            ):
+                attrs[key] = _freeze_value_(value, stack)
+    return root
+
+
+def _freeze_value_(value: Any, nodes: List[Any]) -> Any:
+    """Read-only form of ``value``; nodes met are pushed onto ``nodes``."""
+    cls = type(value)
+    if cls is list:
+        return _FrozenList([_freeze_value_(v, nodes) for v in value])
+    if cls is tuple:
+        return tuple(_freeze_value_(v, nodes) for v in value)
+    if cls is set:
+        return _FrozenSet(value)
+    if isinstance(value, recursivenamespace):
+        nodes.append(value)
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            value[k] = _freeze_value_(v, nodes)
+    return value
+
+
+def _thawed_attrs_(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """``attrs`` with read-only lists and sets swapped for plain ones."""
+    return {
+        k: _THAWED_TYPES_[type(v)](v) if type(v) in _THAWED_TYPES_ else v
+        for k, v in attrs.items()
+    }
+
+
+def _thawed_class_(cls: type) -> Type["recursivenamespace"]:
+    thawed: Type[recursivenamespace] = getattr(cls, "_frozen__base_", cls)
+    return thawed
+
+
+# Immutable value types ``_clone_tree_`` shares instead of visiting.
+_SHARED_LEAF_TYPES_ = frozenset(
+    (str, int, float, bool, type(None), bytes)
+    + (datetime.datetime, datetime.date, datetime.time)
+)
+
+
+def _clone_tree_(root: Any) -> "recursivenamespace":
+    """Mutable copy of a loaded tree, without re-parsing or ``__init__``.
+
+    Nodes, lists and dicts are copied (frozen nodes come back as their
+    plain class, and their read-only lists and sets as plain ones);
+    other values are shared, which is a deep copy for the immutable
+    leaves JSON and TOML produce.
+    """
+    memo: Dict[int, Any] = {}
+    pending: List[Any] = []
+
+    def copy_of(value: Any) -> Any:
+        if isinstance(value, recursivenamespace):
+            new = memo.get(id(value))
+            if new is None:
+                cls = _thawed_class_(type(value))
+                new = memo[id(value)] = cls.__new__(cls)
+                new._binding_ = None
+                attrs = new.__dict__
+                attrs.update(value.__dict__)
+                attrs["_supported__types_"] = list(value._supported__types_)
+                pending.append(attrs)
+            return new
+        if isinstance(value, (list, dict)):
+            new = memo.get(id(value))
+            if new is None:
+                new = memo[id(value)] = value.copy()
+                pending.append(new)
+            return new
+        if isinstance(value, tuple):
+            return tuple(copy_of(v) for v in value)
+        if isinstance(value, set):
+            return set(value)
+        return value
+
+    result: recursivenamespace = copy_of(root)
+    while pending:
+        container = pending.pop()
+        if isinstance(container, list):
+            for i, v in enumerate(container):
+                if type(v) not in _SHARED_LEAF_TYPES_:
+                    container[i] = copy_of(v)
+            continue
+        for k, v in container.items():
+            if type(v) not in _SHARED_LEAF_TYPES_ and k not in _NODE_ATTRS_:
+                container[k] = copy_of(v)
+    return result
+
+
+def _cached_load_(
+    load: Callable[[], "recursivenamespace"],
+    filepath: Union[str, Path],
+    variant: Tuple[Any, ...],
+    cached: bool,
+    frozen: bool,
+) -> "recursivenamespace":
+    """``load()`` through ``cache.load_cache`` and/or frozen, as asked."""
+    if not cached:
+        tree = load()
+        return _freeze_tree_(tree) if frozen else tree
+    tree = cache.load_cache.get(
+        filepath, variant, lambda: _freeze_tree_(load())
+    )
+    return tree if frozen else _clone_tree_(tree)
+
+
+def _apply_diff_(
+    rns_ins: "recursivenamespace", source: "recursivenamespace"
+) -> List[str]:
+    """Make ``rns_ins`` equal ``source``, writing only what differs.
+
+    Nodes present on both sides are updated in place (iteratively);
+    any other changed value, lists included, is replaced whole. Writes
+    go through ``__setitem__`` / ``pop`` in one batch, so observers are
+    notified. Returns the written chain keys, relative to ``rns_ins``.
+    """
+    changed: List[str] = []
+    stack = [(rns_ins, source, "")]
+    with _mutation_batch_(rns_ins):
+        while stack:
+            node, new, path = stack.pop()
+            new_items = dict(_StaticImpl.items(new))
+            for key in _StaticImpl.keys(node):
+                if key not in new_items:
+                    _StaticImpl.pop(node, key)
+                    changed.append(events.child_path(path, key))
+            nested = []
+            for key, value in new_items.items():
+                old = node.__dict__.get(key, events.MISSING)
+                key_path = events.child_path(path, key)
+                if isinstance(old, recursivenamespace) and isinstance(
+                    value, recursivenamespace
+                ):
+                    nested.append((old, value, key_path))
+                elif type(old) is not type(value) or old != value:
+                    node[key] = value
+                    changed.append(key_path)
+            stack.extend(reversed(nested))
+    return changed
+
+
+# ──────────────────────────────────────────────────────────────────
+# Environment variables
+# ──────────────────────────────────────────────────────────────────
+
+
+class _EnvArray(Dict[int, Any]):
+    """List under construction in ``_env_tree_``: index -> item.
+
+    ``name`` is the variable name up to the list segment, for errors.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str = "") -> None:
+        super().__init__()
+        self.name = name
+
+
+_ENV_BOOLS_ = {"true": True, "false": False}
+_ENV_INT_RE_ = re.compile(r"[+-]?(?:0|[1-9]\d*)\Z")
+_ENV_FLOAT_RE_ = re.compile(
+    r"[+-]?(?:(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+)\Z"
+)
+
+
+def _coerce_env_(value: str) -> Any:
+    flag = _ENV_BOOLS_.get(value.lower())
+    if flag is not None:
+        return flag
+    if _ENV_INT_RE_.match(value):
+        return int(value)
+    if _ENV_FLOAT_RE_.match(value):
+        return float(value)
+    return value
+
+
+def _env_tree_(
+    environ: Mapping[str, str],
+    prefix: str,
+    sep: str,
+    coerce: bool,
+    lowercase: bool,
+) -> Dict[str, Any]:
+    """Nest the ``prefix``-ed variables into dicts and ``_EnvArray``s."""
+    if not sep:
+        raise ValueError("sep must not be empty")
+    root: Dict[Any, Any] = {}
+    start = len(prefix)
+    for name, raw in environ.items():
+        rest = name[start:]
+        if not rest or not name.startswith(prefix):
+            continue  # not ours, or just the prefix (``APP__=x``)
+        segs = (rest.lower() if lowercase else rest).split(sep)
+        last = len(segs) - 1
+        node: Dict[Any, Any] = root
+        for i, seg in enumerate(segs):
+            key: Union[str, int]
+            if isinstance(node, _EnvArray):
+                if not seg.isdigit():
+                    raise ValueError(f"{name}: bad list index {seg!r}")
+                key = int(seg)
+                child_type: Type[Dict[Any, Any]] = dict
+            elif seg.endswith(utils.KEY_ARRAY):
+                key, child_type = seg[:-2], _EnvArray
+            else:
+                key, child_type = seg, dict
+            if key == "":
+                raise ValueError(f"{name}: empty key segment")
+            child = node.get(key, events.MISSING)
+            if i == last:
+                if child_type is _EnvArray:
+                    raise ValueError(f"{name}: list key needs an index")
+                if isinstance(child, dict):
+                    raise ValueError(f"{name}: {seg!r} clashes with a table")
+                node[key] = _coerce_env_(raw) if coerce else raw
+            elif child is events.MISSING:
+                if child_type is _EnvArray:
+                    path = sep.join(rest.split(sep)[: i + 1])
+                    child = _EnvArray(prefix + path)
+                else:
+                    child = child_type()
+                node[key] = child
+                node = child
+            elif type(child) is child_type:
+                node = child
+            else:
+                raise ValueError(f"{name}: {seg!r} clashes with a value")
+    return root
+
+
+def _env_value_(value: Any, build: Callable[[Any], Any]) -> Any:
+    """Finish ``_env_tree_`` output: lists in index order, tables built."""
+    if isinstance(value, _EnvArray):
+        if max(value) >= len(value):
+            raise ValueError(
+                f"{value.name}: list indices must run from 0 without gaps,"
+                f" got {sorted(value)}"
+            )
+        return [_env_value_(value[i], build) for i in range(len(value))]
+    if isinstance(value, dict):
+        return build([(k, _env_value_(v, build)) for k, v in value.items()])
+    return value
+
+
+# ──────────────────────────────────────────────────────────────────
+# Bound proxy + descriptor for ``obj._``
+# ──────────────────────────────────────────────────────────────────
+
+
+class _BoundProxy:
+    """Curries the owner into ``_StaticImpl`` calls so ``obj._.to_dict()``
+    works as a normal bound-method call."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "recursivenamespace") -> None:
+        object.__setattr__(self, "_owner", owner)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(_StaticImpl, name, None)
+        if attr is None or not callable(attr):
+            raise AttributeError(name)
         return functools.partial(attr, self._owner)
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -953,6 +2613,8 @@ setattr(recursivenamespace, "_", _Descriptor())
 # All single-underscore class attrs — the ``_`` proxy plus every
 # private helper (_re_, _process_, _chain_*_, _iter_to_dict_, etc.)
 # and ``_logger_``. Excludes Python dunders.
+# Set through ``__setattr__`` before a node has its protected keys.
+_UNOBSERVED_ATTRS_: frozenset[str] = frozenset({"_binding_", "__class__"})
 _HARD_PROTECTED_CLASS_ATTRS: frozenset[str] = frozenset(
     name
     for name in dir(recursivenamespace)
@@ -963,6 +2625,319 @@ _DEPRECATED_PUBLIC_METHODS: frozenset[str] = frozenset(
 )
 
 
+# ``_protected__keys_`` of a node built by ``__init__``: the class-level
+# names plus the attributes it stores before any data key. One set is
+# shared by every JSON-decoded node; it is never mutated in place.
+_NODE_PROTECTED_KEYS_: set[str] = set(_HARD_PROTECTED_CLASS_ATTRS) | {
+    "_key_",
+    "_use__raw_key_",
+    "_supported__types_",
+    "_protected__keys_",
+}
+
+
+_NODE_ATTRS_ = frozenset(
+    ("_key_", "_use__raw_key_", "_supported__types_", "_protected__keys_")
+)
+
+
+# Per-tree settings a node carries besides its data: class, use_raw_key,
+# supported iterable types.
+_NodeConfig = Tuple[Type["recursivenamespace"], bool, Tuple[type, ...]]
+_DEFAULT_NODE_CONFIG_: _NodeConfig = (
+    recursivenamespace,
+    False,
+    (list, tuple, set),
+)
+
+# (use_raw_key, supported types) per node class, interned so every node
+# of a tree pickles a reference to one shared tuple. The tuples do not
+# refer to the class, so the weak keys let unused classes go.
+_NodeOptions = Tuple[bool, Tuple[type, ...]]
+_NODE_CONFIGS_: "weakref.WeakKeyDictionary[type, Dict[Any, _NodeOptions]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _node_config_(cls: Type["recursivenamespace"], rns_ins: Any) -> _NodeConfig:
+    return (cls, rns_ins._use__raw_key_, tuple(rns_ins._supported__types_))
+
+
+def _node_options_(cls: type, rns_ins: Any) -> _NodeOptions:
+    options = (rns_ins._use__raw_key_, tuple(rns_ins._supported__types_))
+    interned = _NODE_CONFIGS_.get(cls)
+    if interned is None:
+        interned = _NODE_CONFIGS_.setdefault(cls, {})
+    return interned.setdefault(options, options)
+
+
+def _new_node_(key: str, config: _NodeConfig) -> Any:
+    """Empty node with ``__init__``'s attributes, without running it."""
+    cls = config[0]
+    node = cls.__new__(cls)
+    node._binding_ = None
+    attrs = node.__dict__
+    attrs["_key_"] = key
+    attrs["_use__raw_key_"] = config[1]
+    attrs["_supported__types_"] = list(config[2])
+    attrs["_protected__keys_"] = _NODE_PROTECTED_KEYS_
+    return node
+
+
+def _rns_reduce_(rns_ins: Any, cls: Type["recursivenamespace"]) -> Any:
+    """``__reduce__`` payload: key, shared options and user data only.
+
+    Pickles name only ``cls`` and stdlib callables; ``__setstate__``
+    fills the node. Nodes of exactly ``cls`` are recreated without
+    ``__init__`` through ``copyreg.__newobj__``, which pickle only
+    allows for the object's own class, so frozen and scoped nodes call
+    ``cls()`` instead. The state is applied after the node exists, so
+    trees that reference themselves still round-trip. Nodes whose
+    protected keys were edited keep the full ``__dict__`` form.
+    """
+    if type(rns_ins) is cls:
+        create: Tuple[Any, ...] = (copyreg.__newobj__, (cls,))  # type: ignore[attr-defined]
+    else:
+        cls = _thawed_class_(cls)
+        create = (cls, ())
+    attrs = rns_ins.__dict__
+    protected = attrs.get("_protected__keys_")
+    if protected is not _NODE_PROTECTED_KEYS_ and (
+        protected != _NODE_PROTECTED_KEYS_ or not _NODE_ATTRS_ <= attrs.keys()
+    ):
+        return (*create, dict(attrs))
+    data = attrs.copy()
+    for name in _NODE_ATTRS_:
+        del data[name]
+    options = _node_options_(cls, rns_ins)
+    return (*create, (attrs["_key_"], options, data))
+
+
+def _fast_decode_ok_(
+    cls: type,
+    accepted_iter_types: Optional[List[type]],
+    use_raw_key: bool,
+) -> bool:
+    """Whether ``_rns_from_pairs_`` builds what ``cls(data, ...)`` would.
+
+    The hook cannot tell objects inside arrays (which ``_process_``
+    builds with default options) from the rest, so only the default
+    options qualify; everything else takes the two-pass path.
+    """
+    return (
+        cls is recursivenamespace
+        and not use_raw_key
+        and all(t in (list, tuple, set) for t in accepted_iter_types or ())
+    )
+
+
+def _rns_from_pairs_(pairs: List[Tuple[str, Any]]) -> "recursivenamespace":
+    """Trusted fast constructor, used as ``json``'s ``object_pairs_hook``.
+
+    Builds the same node as ``recursivenamespace(dict(pairs))`` with the
+    default options, but skips the per-value ``_process_`` walk: values
+    coming out of the decoder are already final (nested objects went
+    through this hook, arrays hold nothing to convert). Key
+    normalization, protected keys, shadow warnings and dunder names
+    follow ``__setitem__``.
+    """
+    node: recursivenamespace = _new_node_("", _DEFAULT_NODE_CONFIG_)
+    attrs = node.__dict__
+    protected = _NODE_PROTECTED_KEYS_
+    normalize = _KEY_NORMALIZE_RE.sub
+    for key, value in pairs:
+        key = normalize("_", key)
+        if key in protected:
+            raise KeyError(f"The key '{key}' is protected.")
+        if key in _DEPRECATED_PUBLIC_METHODS:
+            warnings.warn(
+                _SHADOW_TEMPLATE.format(name=key), FutureWarning, stacklevel=2
+            )
+        if type(value) is recursivenamespace:
+            value.__dict__["_key_"] = key
+        if key[:2] == "__":
+            # Dunder names take the checked path, which refuses to
+            # replace ``__class__`` or ``__dict__``.
+            setattr(node, key, value)
+        else:
+            attrs[key] = value
+    return node
+
+
+# ──────────────────────────────────────────────────────────────────
+# Dataclass and object ingestion
+# ──────────────────────────────────────────────────────────────────
+
+# Reads a dataclass instance's fields as ``(name, value)`` pairs.
+_FieldReader = Callable[[Any], Iterable[Tuple[str, Any]]]
+
+# Per class: the reader for its instances and whether the field names
+# are final keys (not protected, not shadowing, nothing to normalize),
+# or None when instances are not dataclasses. Weakly keyed so classes
+# made at runtime are not kept alive by having been ingested once.
+_FieldPlan = Optional[Tuple[_FieldReader, bool]]
+_FIELD_PLANS_: "weakref.WeakKeyDictionary[type, _FieldPlan]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Instances of these keep a ``__dict__`` but are values, not records.
+_OPAQUE_TYPES_ = (type, enum.Enum, BaseException, ModuleType)
+
+
+def _fields_reader_(names: Tuple[str, ...]) -> _FieldReader:
+    if not names:
+        return lambda obj: ()
+    if len(names) == 1:
+        name = names[0]
+        return lambda obj: ((name, getattr(obj, name)),)
+    getter = operator.attrgetter(*names)
+    return lambda obj: zip(names, getter(obj))
+
+
+def _final_keys_(names: Iterable[str]) -> bool:
+    return not any(
+        _KEY_NORMALIZE_RE.search(name)
+        or name in _NODE_PROTECTED_KEYS_
+        or name in _DEPRECATED_PUBLIC_METHODS
+        for name in names
+    )
+
+
+def _field_plan_(cls: type) -> _FieldPlan:
+    """Cached ingestion plan for dataclass instances of ``cls``."""
+    try:
+        return _FIELD_PLANS_[cls]
+    except KeyError:
+        pass
+    plan: _FieldPlan = None
+    if dataclasses.is_dataclass(cls):
+        names = tuple(f.name for f in dataclasses.fields(cls))
+        plan = (_fields_reader_(names), _final_keys_(names))
+    _FIELD_PLANS_[cls] = plan
+    return plan
+
+
+def _record_pairs_(
+    obj: Any,
+) -> Optional[Tuple[Iterable[Tuple[str, Any]], bool]]:
+    """``from_dataclass``'s root: a dataclass, namedtuple or plain object.
+
+    Returns the ``(name, value)`` pairs and whether the names are final
+    keys, or None when ``obj`` is none of those.
+    """
+    cls = type(obj)
+    plan = _field_plan_(cls)
+    if plan is not None:
+        return plan[0](obj), plan[1]
+    if isinstance(obj, tuple) and hasattr(cls, "_fields"):
+        return zip(cls._fields, obj), _final_keys_(cls._fields)
+    attrs = getattr(obj, "__dict__", None)
+    if (
+        type(attrs) is dict
+        and not isinstance(obj, _OPAQUE_TYPES_)
+        and not callable(obj)
+    ):
+        return attrs.items(), False
+    return None
+
+
+def _asdict_value_(value: Any) -> Any:
+    """What ``dataclasses.asdict`` makes of a value ``__init__`` keeps.
+
+    Used for lists and tuples of types the node does not rebuild, such
+    as namedtuples, which ``asdict`` rebuilds with plain contents. Other
+    leaves are shared rather than deep-copied.
+    """
+    if _field_plan_(type(value)) is not None:
+        return dataclasses.asdict(value)
+    if isinstance(value, tuple) and hasattr(type(value), "_fields"):
+        return type(value)(*[_asdict_value_(v) for v in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_asdict_value_(v) for v in value)
+    if isinstance(value, dict):
+        return type(value)(
+            (_asdict_value_(k), _asdict_value_(v)) for k, v in value.items()
+        )
+    return value
+
+
+def _ingest_key_(key: str, use_raw_key: bool) -> str:
+    """Key checks of ``__setitem__`` for names that are not final."""
+    if not use_raw_key:
+        key = _KEY_NORMALIZE_RE.sub("_", key)
+    if key in _NODE_PROTECTED_KEYS_:
+        raise KeyError(f"The key '{key}' is protected.")
+    if key in _DEPRECATED_PUBLIC_METHODS:
+        warnings.warn(
+            _SHADOW_TEMPLATE.format(name=key), FutureWarning, stacklevel=3
+        )
+    return key
+
+
+def _ingest_fill_(
+    node: Any,
+    pairs: Iterable[Tuple[str, Any]],
+    final: bool,
+    config: _NodeConfig,
+) -> Any:
+    """Store ``pairs`` on ``node`` as ``__init__`` would, converting
+    nested records on the way. Children are built with ``config``.
+    """
+    attrs = node.__dict__
+    use_raw_key = config[1]
+    for key, value in pairs:
+        if not final:
+            key = _ingest_key_(key, use_raw_key)
+        attrs[key] = _ingest_value_(value, key, config, config[2])
+    return node
+
+
+def _ingest_value_(
+    value: Any,
+    key: Optional[str],
+    config: _NodeConfig,
+    iter_types: Tuple[type, ...],
+) -> Any:
+    """One value of ``_ingest_fill_``; ``key`` is None inside arrays.
+
+    Mirrors ``__init__`` and ``_process_``: nodes inside arrays get the
+    default options and an empty key, while the owning node's
+    ``iter_types`` decide which arrays are rebuilt.
+    """
+    cls = type(value)
+    if cls in _SHARED_LEAF_TYPES_:
+        return value
+    if isinstance(value, recursivenamespace):
+        if key is not None:
+            _StaticImpl.set_key(value, key)
+        return value
+    if key is None:
+        key, config = "", _DEFAULT_NODE_CONFIG_
+    if isinstance(value, dict):
+        return _ingest_fill_(
+            _new_node_(key, config), value.items(), False, config
+        )
+    plan = _field_plan_(cls)
+    if plan is not None:
+        return _ingest_fill_(
+            _new_node_(key, config), plan[0](value), plan[1], config
+        )
+    if cls in iter_types and not isinstance(value, str):
+        items = [_ingest_value_(v, None, config, iter_types) for v in value]
+        try:
+            return cls(items)
+        except (TypeError, ValueError) as e:
+            print(
+                f"Failed to make iterable object of type {cls}",
+                e,
+                file=sys.stderr,
+            )
+        return value
+    if isinstance(value, (list, tuple, dict)):
+        return _asdict_value_(value)
+    return value
+
+
 # %%
 def _rns_normalize_return_(
     ret_val: Any, use_chain_key: bool, props: str
@@ -971,6 +2946,8 @@ def _rns_normalize_return_(
 
     Recognised shapes: a list of ``KV_Pair`` (chain-key mode), a dict,
     a dataclass instance, or any other scalar (wrapped under ``props``).
+    Outside chain-key mode the decorator hands dataclasses to
+    ``from_dataclass`` instead.
     """
     if (
         use_chain_key
@@ -990,38 +2967,230 @@ def _rns_build_from_data_(
     accepted_iter_types_list: List[type],
     use_raw_key: bool,
     use_chain_key: bool,
+    skeletons: Optional["_ChainSkeletons"] = None,
 ) -> "recursivenamespace":
     if not use_chain_key:
         return recursivenamespace(data, accepted_iter_types_list, use_raw_key)
-    ret = recursivenamespace(None, accepted_iter_types_list, use_raw_key)
     items = data.items() if isinstance(data, dict) else data
+    if skeletons is not None:
+        built = skeletons.build(items)
+        if built is not None:
+            return built
+    ret = recursivenamespace(None, accepted_iter_types_list, use_raw_key)
     for key, value in items:
         _StaticImpl.val_set(ret, key, value)
     return ret
 
 
+class _ChainSlot:
+    """Stand-in value marking where the ``index``-th pair lands."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+# ``_ChainSkeletons`` entry for a key sequence seen once, not compiled.
+_SEEN_ONCE_ = object()
+
+
+class _ChainSkeletons:
+    """Compiled builds for the key sequences a chain-key function repeats.
+
+    The first call with a key sequence takes the ``val_set`` path. On the
+    second, the sequence is replayed once with ``_ChainSlot`` values,
+    and the resulting tree of nodes and lists becomes the skeleton;
+    later calls only rebuild it and drop the values into their slots.
+    A replay that fails (a key descends into an earlier value, a bad
+    index, a protected key) or a key that would warn is not compiled,
+    since there the outcome depends on the values. ``build`` returns
+    None whenever the caller has to take the ``val_set`` path.
+    """
+
+    __slots__ = ("_accepted", "_config", "_lock", "_plans", "_use_raw_key")
+
+    maxsize = 32
+
+    def __init__(self, accepted: List[type], use_raw_key: bool) -> None:
+        self._accepted = accepted
+        self._use_raw_key = use_raw_key
+        types = tuple(dict.fromkeys([list, tuple, set] + accepted))
+        self._config = (recursivenamespace, use_raw_key, types)
+        self._plans: Dict[Tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def build(
+        self, items: Iterable[Tuple[str, Any]]
+    ) -> Optional["recursivenamespace"]:
+        pairs = list(items)
+        try:
+            keys = tuple(pair[0] for pair in pairs)
+            plan = self._plans.get(keys)
+        except (TypeError, IndexError):
+            return None
+        if plan is None or plan is _SEEN_ONCE_:
+            plan = self._compile(keys) if plan is _SEEN_ONCE_ else _SEEN_ONCE_
+            with self._lock:
+                if keys not in self._plans and len(self._plans) >= self.maxsize:
+                    del self._plans[next(iter(self._plans))]
+                self._plans[keys] = plan
+        if type(plan) is not tuple:
+            return None
+        values = [pair[1] for pair in pairs]
+        node: recursivenamespace = _fill_skeleton_(plan, values, self._config)
+        return node
+
+    def _compile(self, keys: Tuple[Any, ...]) -> Any:
+        """The skeleton for ``keys``, or False if they cannot have one."""
+        if not all(self._quiet(key) for key in keys):
+            return False
+        root = recursivenamespace(None, self._accepted, self._use_raw_key)
+        try:
+            for i, key in enumerate(keys):
+                _StaticImpl.val_set(root, key, _ChainSlot(i))
+        except (LookupError, ValueError, TypeError, AttributeError):
+            return False
+        return _skeleton_of_(root)
+
+    def _quiet(self, key: Any) -> bool:
+        """Whether setting ``key`` cannot emit a shadow warning."""
+        if not isinstance(key, str):
+            return False
+        for seg in utils.split_key(key):
+            name = utils.unescape_key(seg)
+            if name[-2:] == utils.KEY_ARRAY:
+                name = name[:-2]
+            if not self._use_raw_key:
+                name = _KEY_NORMALIZE_RE.sub("_", name)
+            if name in _DEPRECATED_PUBLIC_METHODS:
+                return False
+        return True
+
+
+def _skeleton_of_(value: Any) -> Any:
+    """Skeleton of a replayed tree; False if it holds anything else.
+
+    An int is the slot of that pair's value, a list is a list, and a
+    tuple of ``(key, skeleton)`` pairs is a node.
+    """
+    if type(value) is _ChainSlot:
+        return value.index
+    if type(value) is list:
+        items = [_skeleton_of_(item) for item in value]
+        return False if any(item is False for item in items) else items
+    if type(value) is not recursivenamespace:
+        return False
+    node = []
+    for key, item in _StaticImpl.items(value):
+        skeleton = _skeleton_of_(item)
+        if skeleton is False:
+            return False
+        node.append((key, skeleton))
+    return tuple(node)
+
+
+def _fill_skeleton_(
+    skeleton: Any, values: List[Any], config: _NodeConfig
+) -> Any:
+    if type(skeleton) is int:
+        return values[skeleton]
+    if type(skeleton) is list:
+        return [_fill_skeleton_(item, values, config) for item in skeleton]
+    node = _new_node_("", config)
+    attrs = node.__dict__
+    for key, item in skeleton:
+        attrs[key] = (
+            values[item]
+            if type(item) is int
+            else _fill_skeleton_(item, values, config)
+        )
+    return node
+
+
+# Separates positional from keyword arguments in ``rns(cache=N)`` keys.
+_KWARGS_MARK_ = object()
+
+
 def rns(
     accepted_iter_types: Optional[List[type]] = None,
     use_raw_key: bool = False,
     use_chain_key: bool = False,
     props: str = "props",
+    cache: Optional[int] = None,
+    ttl: Optional[float] = None,
+    freeze: bool = True,
 ) -> Callable[[Callable[..., Any]], Callable[..., recursivenamespace]]:
-    """Create RNS object"""
+    """Create RNS object
+
+    ``cache=N`` memoizes the built tree per argument tuple, keeping the
+    ``N`` most recently used; entries expire ``ttl`` seconds after they
+    were built. Hits return the cached tree frozen and shared (its
+    lists and sets read-only too), or a mutable copy of a private tree
+    with ``freeze=False``, so callers cannot change what later calls
+    get. Calls with unhashable arguments are not cached.
+    The wrapper gets ``cache_info()`` and ``cache_clear()``.
+    """
     accepted_iter_types_list: List[type] = (
         [] if accepted_iter_types is None else accepted_iter_types
     )
+    if cache is not None and cache < 1:
+        raise ValueError(f"cache must be >= 1 or None, got {cache}")
+    if ttl is not None and cache is None:
+        raise ValueError("ttl needs cache=N")
 
     def fn_wrapper(
         func: Callable[..., Any],
     ) -> Callable[..., recursivenamespace]:  # NOSONAR
-        @functools.wraps(func)
-        def create_rns(*args: Any, **kwargs: Any) -> recursivenamespace:
+        skeletons = (
+            _ChainSkeletons(accepted_iter_types_list, use_raw_key)
+            if use_chain_key
+            else None
+        )
+
+        def build(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
             ret_val = func(*args, **kwargs)
+            if not use_chain_key and dataclasses.is_dataclass(ret_val):
+                return recursivenamespace.from_dataclass(
+                    ret_val, accepted_iter_types_list, use_raw_key
+                )
             data = _rns_normalize_return_(ret_val, use_chain_key, props)
             return _rns_build_from_data_(
-                data, accepted_iter_types_list, use_raw_key, use_chain_key
+                data,
+                accepted_iter_types_list,
+                use_raw_key,
+                use_chain_key,
+                skeletons,
             )
 
-        return create_rns
+        if cache is None:
+
+            @functools.wraps(func)
+            def create_rns(*args: Any, **kwargs: Any) -> recursivenamespace:
+                tree: recursivenamespace = build(args, kwargs)
+                return tree
+
+            return create_rns
+
+        memo = MemoCache(cache, ttl)
+
+        @functools.wraps(func)
+        def create_cached_rns(*args: Any, **kwargs: Any) -> recursivenamespace:
+            key: Tuple[Any, ...] = args
+            if kwargs:
+                key += (_KWARGS_MARK_, *kwargs.items())
+            try:
+                hash(key)
+            except TypeError:
+                tree = build(args, kwargs)
+                return _freeze_tree_(tree) if freeze else tree
+            if not freeze:
+                return _clone_tree_(memo.get(key, lambda: build(args, kwargs)))
+            tree = memo.get(key, lambda: _freeze_tree_(build(args, kwargs)))
+            return tree
+
+        create_cached_rns.cache_info = memo.cache_info  # type: ignore[attr-defined]
+        create_cached_rns.cache_clear = memo.clear  # type: ignore[attr-defined]
+        return create_cached_rns
 
     return fn_wrapper
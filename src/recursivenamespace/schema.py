@@ -0,0 +1,672 @@
+"""Dataclass conversion and compiled validation for RNS trees.
+
+The first conversion to a dataclass builds a plan for it from its
+resolved type hints and caches it. The plan lists each ``__init__``
+field with a converter, or ``None`` when the value is passed through
+unchanged. Converters turn nested nodes and dicts into nested
+dataclasses, and handle ``Optional[...]``, ``List[...]``,
+``Tuple[...]``, ``Set[...]`` and ``Dict[..., ...]`` of them. Nodes in
+fields annotated ``dict`` become plain dicts. Other values are not
+checked or coerced.
+
+``SchemaValidator`` compiles a dataclass or a small dict DSL once into
+nested checking closures. Each call walks the data once, coerces
+scalars in place when asked, and collects every problem by chain key.
+
+Nodes are recognized as ``SimpleNamespace`` instances and read through
+their ``__dict__``, so this module does not import ``main``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import inspect
+import operator
+import re
+import threading
+import types
+import typing
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from . import events
+from .errors import SchemaError
+
+T = TypeVar("T")
+
+Converter = Callable[[Any], Any]
+
+__all__ = [
+    "SchemaValidator",
+    "plan_for",
+    "to_dataclass",
+    "to_dataclass_many",
+]
+
+_MISSING: Any = object()
+
+
+class Plan:
+    """How to build one dataclass from a node's attributes.
+
+    ``fields`` pairs every ``__init__`` field with its converter (or
+    ``None``). When all fields are present and positional, ``getter``
+    fetches them in one call and only ``converters`` (field index,
+    converter) run before the class is called positionally.
+    """
+
+    __slots__ = ("converters", "fields", "getter")
+
+    def __init__(self, fields: Tuple[Tuple[str, Optional[Converter]], ...]):
+        self.fields = fields
+        self.converters = tuple(
+            (i, convert)
+            for i, (_, convert) in enumerate(fields)
+            if convert is not None
+        )
+        # ``itemgetter`` returns a bare value (not a tuple) for one name.
+        self.getter: Optional[Callable[[Any], Tuple[Any, ...]]] = (
+            operator.itemgetter(*(name for name, _ in fields))
+            if len(fields) > 1
+            else None
+        )
+
+
+_PLANS: Dict[type, Plan] = {}
+_PLANS_LOCK = threading.Lock()
+_UNION_TYPES: Tuple[Any, ...] = (Union,) + (
+    (types.UnionType,) if hasattr(types, "UnionType") else ()
+)
+
+
+def plan_for(schema_cls: type) -> Plan:
+    """Cached conversion plan of the dataclass ``schema_cls``."""
+    plan = _PLANS.get(schema_cls)
+    if plan is not None:
+        return plan
+    if not (
+        isinstance(schema_cls, type) and dataclasses.is_dataclass(schema_cls)
+    ):
+        raise TypeError("The 'schema_cls' must be a DataClass type.")
+    try:
+        hints = typing.get_type_hints(schema_cls)
+    except (NameError, TypeError, AttributeError):
+        # Unresolvable forward references: pass every value through.
+        hints = {}
+    fields = [f for f in dataclasses.fields(schema_cls) if f.init]
+    plan = Plan(tuple((f.name, _converter(hints.get(f.name))) for f in fields))
+    if not _positional(schema_cls, [f.name for f in fields]):
+        plan.getter = None
+    with _PLANS_LOCK:
+        return _PLANS.setdefault(schema_cls, plan)
+
+
+def _positional(schema_cls: type, names: List[str]) -> bool:
+    """Whether ``schema_cls(*values)`` binds exactly ``names``, in order.
+
+    Not so for keyword-only fields, ``InitVar`` pseudo-fields or a
+    hand-written ``__init__``.
+    """
+    try:
+        params = list(inspect.signature(schema_cls).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    return [p.name for p in params] == names and all(
+        p.kind is p.POSITIONAL_OR_KEYWORD for p in params
+    )
+
+
+def to_dataclass(source: Any, schema_cls: Type[T], /, **kwargs: Any) -> T:
+    """Build ``schema_cls`` from a node (or mapping) following its plan.
+
+    Fields missing from ``source`` are taken from ``kwargs``, then from
+    the field's default; the dataclass raises ``TypeError`` if none
+    applies.
+    """
+    return _build(_attrs(source), schema_cls, plan_for(schema_cls), kwargs)
+
+
+def to_dataclass_many(
+    sources: Iterable[Any], schema_cls: Type[T], /, **kwargs: Any
+) -> List[T]:
+    """``to_dataclass`` over ``sources``, looking the plan up once."""
+    plan = plan_for(schema_cls)
+    return [
+        _build(_attrs(source), schema_cls, plan, dict(kwargs))
+        for source in sources
+    ]
+
+
+def _attrs(source: Any) -> Mapping[str, Any]:
+    if isinstance(source, types.SimpleNamespace):
+        return source.__dict__
+    if isinstance(source, Mapping):
+        return source
+    raise TypeError(
+        f"Cannot convert {type(source).__name__} to a dataclass; "
+        "expected an RNS node or a mapping"
+    )
+
+
+def _build(
+    attrs: Mapping[str, Any],
+    schema_cls: Type[T],
+    plan: Plan,
+    kwargs: Dict[str, Any],
+) -> T:
+    if plan.getter is not None and not kwargs:
+        try:
+            values: Any = plan.getter(attrs)
+        except KeyError:
+            pass  # some field is missing: defaults apply
+        else:
+            if plan.converters:
+                values = list(values)
+                for i, to_value in plan.converters:
+                    values[i] = to_value(values[i])
+            return schema_cls(*values)
+    for name, convert in plan.fields:
+        value = attrs.get(name, _MISSING)
+        if value is _MISSING:
+            continue
+        kwargs[name] = value if convert is None else convert(value)
+    return schema_cls(**kwargs)
+
+
+# ── Converters ───────────────────────────────────────────────────
+
+
+def _converter(hint: Any) -> Optional[Converter]:
+    """Converter for values annotated ``hint``; ``None``: keep as is."""
+    if hint is None:
+        return None
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        return functools.partial(_nested, hint)
+    if hint is dict:
+        return _plain_dict
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    if origin in _UNION_TYPES:
+        options = [a for a in args if a is not type(None)]
+        if len(options) != 1:
+            return None
+        inner = _converter(options[0])
+        return None if inner is None else functools.partial(_optional, inner)
+    if origin in (list, set, frozenset):
+        inner = _converter(args[0]) if args else None
+        if inner is None:
+            return None
+        return functools.partial(_each, origin, inner)
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            inner = _converter(args[0])
+            return (
+                None
+                if inner is None
+                else functools.partial(_each, tuple, inner)
+            )
+        return None
+    if origin is dict:
+        inner = _converter(args[1]) if len(args) == 2 else None
+        return functools.partial(_dict_values, inner)
+    return None
+
+
+def _nested(schema_cls: type, value: Any) -> Any:
+    if isinstance(value, (types.SimpleNamespace, Mapping)):
+        return _build(_attrs(value), schema_cls, plan_for(schema_cls), {})
+    return value
+
+
+def _optional(inner: Converter, value: Any) -> Any:
+    return None if value is None else inner(value)
+
+
+def _each(container: type, inner: Converter, value: Any) -> Any:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return container(inner(v) for v in value)
+    return value
+
+
+def _plain_dict(value: Any) -> Any:
+    if isinstance(value, types.SimpleNamespace):
+        return _dict_values(None, value)
+    return value
+
+
+def _dict_values(inner: Optional[Converter], value: Any) -> Any:
+    """Nodes become dicts of their data; values go through ``inner``."""
+    if isinstance(value, types.SimpleNamespace):
+        protected = getattr(value, "_protected__keys_", ())
+        items = [
+            (k, v) for k, v in value.__dict__.items() if k not in protected
+        ]
+    elif isinstance(value, Mapping):
+        items = list(value.items())
+    else:
+        return value
+    if inner is None:
+        return {
+            k: _dict_values(None, v)
+            if isinstance(v, types.SimpleNamespace)
+            else v
+            for k, v in items
+        }
+    return {k: inner(v) for k, v in items}
+
+
+# ── Validation ───────────────────────────────────────────────────
+
+# A compiled check: ``check(value, path, problems)`` returns the value,
+# coerced if needed, and appends ``(path, message)`` for each problem.
+# ``path`` is ``None`` at the root, else ``(parent_path, key_or_index)``;
+# it is only rendered to a chain key when a problem is reported.
+_Path = Optional[Tuple[Any, Union[str, int]]]
+_Problems = List[Tuple[_Path, str]]
+Check = Callable[[Any, _Path, _Problems], Any]
+
+_BOOL_WORDS = {
+    "true": True,
+    "yes": True,
+    "on": True,
+    "1": True,
+    "false": False,
+    "no": False,
+    "off": False,
+    "0": False,
+}
+
+
+# What counts as an int string: ``int()`` also takes ``"1_000"`` and
+# surrounding whitespace, which are not lossless spellings of an int.
+_INT_RE = re.compile(r"[+-]?[0-9]+")
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, str):
+        if _INT_RE.fullmatch(value) is None:
+            raise ValueError(value)
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise TypeError
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, (str, int)) and not isinstance(value, bool):
+        return float(value)
+    raise TypeError
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return _BOOL_WORDS[value.strip().lower()]
+    if type(value) is int and value in (0, 1):
+        return bool(value)
+    raise TypeError
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise TypeError
+
+
+_COERCIONS: Dict[type, Callable[[Any], Any]] = {
+    int: _to_int,
+    float: _to_float,
+    bool: _to_bool,
+    str: _to_str,
+}
+
+
+class SchemaValidator:
+    """A shape compiled once into a checking (and coercing) function.
+
+    ``spec`` is a dataclass type or a dict DSL. In the DSL, a dict is a
+    table whose keys are required unless they end in ``?``, and
+    ``[spec]`` is a list of ``spec``. A type is checked with
+    ``isinstance``, a tuple of specs accepts any of them, and ``None``
+    accepts only ``None``. ``typing`` hints (``Optional``, ``Union``,
+    ``List``, ``Dict``, ``Any``) are accepted in both forms::
+
+        check = RNS.compile_schema({
+            "id": int,
+            "user": {"name": str, "email?": (str, None)},
+            "tags": [str],
+        })
+        check(response)           # raises SchemaError listing every problem
+        check.errors(response)    # {} or {"user.name": "expected str, ..."}
+
+    Extra keys are allowed. With ``coerce=True`` (the default), scalar
+    mismatches that convert losslessly are fixed in place: digit
+    strings such as ``"-12"`` to ``int``, numeric strings to
+    ``float``, ``"true"`` / ``"no"`` / ``1``
+    and similar to ``bool``, numbers to ``str``, ``int`` to ``float``.
+    Coerced values are written through ``__setitem__``, so observers
+    of the tree see them.
+    """
+
+    __slots__ = ("_check", "coerce", "spec")
+
+    def __init__(self, spec: Any, coerce: bool = True) -> None:
+        self.spec = spec
+        self.coerce = coerce
+        self._check = _Compiler(coerce).compile(spec)
+
+    def __repr__(self) -> str:
+        return f"SchemaValidator({self.spec!r}, coerce={self.coerce})"
+
+    def __call__(self, data: T) -> T:
+        return self.validate(data)
+
+    def errors(self, data: Any) -> Dict[str, str]:
+        """Check ``data`` in one pass; return ``{chain key: message}``."""
+        problems: _Problems = []
+        self._check(data, None, problems)
+        return {_render(path): message for path, message in problems}
+
+    def validate(self, data: T) -> T:
+        """Return ``data`` if it fits, else raise ``SchemaError``."""
+        errors = self.errors(data)
+        if errors:
+            raise SchemaError(errors)
+        return data
+
+
+def _render(path: _Path) -> str:
+    keys: List[Union[str, int]] = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+    result = ""
+    for key in reversed(keys):
+        if isinstance(key, int):
+            result = events.item_path(result, key)
+        else:
+            result = events.child_path(result, key)
+    return result
+
+
+def _type_name(spec: Any) -> str:
+    if spec is None or spec is type(None):
+        return "None"
+    return getattr(spec, "__name__", None) or repr(spec)
+
+
+# Values whose checks may coerce items in place.
+_CONTAINERS = (types.SimpleNamespace, Mapping, list, tuple, set, frozenset)
+
+
+def _accept(value: Any, path: _Path, problems: _Problems) -> Any:
+    return value
+
+
+class _Compiler:
+    """Turn a spec into nested ``Check`` closures, once."""
+
+    def __init__(self, coerce: bool, write: bool = True) -> None:
+        self.coerce = coerce
+        # False for a probe: coerces to check, but keeps containers as is.
+        self.write = write
+        # Dataclass -> its table check; a one-slot list so that
+        # self-referencing dataclasses can point at it before it exists.
+        self.tables: Dict[type, List[Check]] = {}
+        # Scalar check -> its type, so containers can skip the call for
+        # values of exactly that type.
+        self.exact: Dict[Check, type] = {}
+        # Non-coercing twin for the first pass of ``any_of``.
+        self._strict: Optional[_Compiler] = None if coerce else self
+        # Coercing but non-writing twin for the second pass.
+        self._probe: Optional[_Compiler] = None if write else self
+
+    def strict(self) -> "_Compiler":
+        if self._strict is None:
+            self._strict = _Compiler(False)
+        return self._strict
+
+    def probe(self) -> "_Compiler":
+        if self._probe is None:
+            self._probe = _Compiler(self.coerce, write=False)
+        return self._probe
+
+    def compile(self, spec: Any) -> Check:
+        if spec is Any or spec is object:
+            return _accept
+        if spec is None or spec is type(None):
+            return self.any_of([])
+        if spec is dict:  # nodes count as tables
+            return self.mapping(_accept)
+        if isinstance(spec, dict):
+            return self.table(
+                [
+                    (key[:-1], False, self.compile(sub))
+                    if key.endswith("?")
+                    else (key, True, self.compile(sub))
+                    for key, sub in spec.items()
+                ]
+            )
+        if isinstance(spec, list):
+            if len(spec) != 1:
+                raise TypeError(f"A list spec holds one item spec: {spec!r}")
+            return self.sequence(self.compile(spec[0]))
+        if isinstance(spec, tuple):
+            return self.any_of(list(spec))
+        if isinstance(spec, type) and dataclasses.is_dataclass(spec):
+            return self.dataclass(spec)
+        origin = typing.get_origin(spec)
+        args = typing.get_args(spec)
+        if origin in _UNION_TYPES:
+            return self.any_of(list(args))
+        if origin in (list, set, frozenset):
+            return self.sequence(self.compile(args[0] if args else Any))
+        if origin is tuple:
+            # Only homogeneous ``Tuple[X, ...]`` checks its items.
+            variadic = len(args) == 2 and args[1] is Ellipsis
+            return self.sequence(self.compile(args[0] if variadic else Any))
+        if origin is dict:
+            return self.mapping(self.compile(args[1] if args else Any))
+        if isinstance(spec, type):
+            return self.scalar(spec)
+        raise TypeError(f"Unsupported schema spec: {spec!r}")
+
+    def dataclass(self, schema_cls: type) -> Check:
+        slot = self.tables.get(schema_cls)
+        if slot is None:
+            slot = self.tables[schema_cls] = []
+            try:
+                hints = typing.get_type_hints(schema_cls)
+            except (NameError, TypeError, AttributeError):
+                hints = {}
+            entries = [
+                (
+                    f.name,
+                    f.default is dataclasses.MISSING
+                    and f.default_factory is dataclasses.MISSING,
+                    self.compile(hints.get(f.name, Any)),
+                )
+                for f in dataclasses.fields(schema_cls)
+                if f.init
+            ]
+            slot.append(self.table(entries))
+        if slot:
+            return slot[0]
+        # Still compiling ``schema_cls``: resolve on first use.
+        return lambda value, path, problems: slot[0](value, path, problems)
+
+    def table(self, entries: List[Tuple[str, bool, Check]]) -> Check:
+        plan = [
+            (key, required, sub, self.exact.get(sub))
+            for key, required, sub in entries
+        ]
+        write = self.write
+
+        def check(value: Any, path: _Path, problems: _Problems) -> Any:
+            attrs: Mapping[str, Any]
+            if isinstance(value, types.SimpleNamespace):
+                attrs = value.__dict__
+            elif isinstance(value, Mapping):
+                attrs = value
+            else:
+                problems.append(
+                    (path, f"expected a table, got {_type_name(type(value))}")
+                )
+                return value
+            for key, required, sub, exact in plan:
+                item = attrs.get(key, _MISSING)
+                if type(item) is exact:
+                    continue
+                if item is _MISSING:
+                    if required:
+                        problems.append(((path, key), "required key missing"))
+                    continue
+                new = sub(item, (path, key), problems)
+                if new is not item and write:
+                    value[key] = new
+            return value
+
+        return check
+
+    def sequence(self, item_check: Check) -> Check:
+        exact = self.exact.get(item_check)
+        write = self.write
+
+        def check(value: Any, path: _Path, problems: _Problems) -> Any:
+            if not isinstance(value, (list, tuple, set, frozenset)):
+                problems.append(
+                    (path, f"expected a list, got {_type_name(type(value))}")
+                )
+                return value
+            # Lists are fixed in place; other containers are rebuilt.
+            items = value if isinstance(value, list) else list(value)
+            changed = False
+            for i, item in enumerate(items):
+                if type(item) is exact:
+                    continue
+                new = item_check(item, (path, i), problems)
+                if new is not item and write:
+                    items[i] = new
+                    changed = True
+            if changed and items is not value:
+                return type(value)(items)
+            return value
+
+        return check
+
+    def mapping(self, value_check: Check) -> Check:
+        write = self.write
+
+        def check(value: Any, path: _Path, problems: _Problems) -> Any:
+            if isinstance(value, types.SimpleNamespace):
+                protected = getattr(value, "_protected__keys_", ())
+                items = [
+                    (k, v)
+                    for k, v in value.__dict__.items()
+                    if k not in protected
+                ]
+            elif isinstance(value, Mapping):
+                items = list(value.items())
+            else:
+                problems.append(
+                    (path, f"expected a table, got {_type_name(type(value))}")
+                )
+                return value
+            for key, item in items:
+                new = value_check(item, (path, key), problems)
+                if new is not item and write:
+                    value[key] = new
+            return value
+
+        return check
+
+    def scalar(self, expected: type) -> Check:
+        convert = _COERCIONS.get(expected) if self.coerce else None
+        # ``bool`` is an ``int`` subclass, but not a valid int or float.
+        reject_bool = expected in (int, float)
+        accept_int = expected is float
+        name = _type_name(expected)
+
+        def check(value: Any, path: _Path, problems: _Problems) -> Any:
+            if type(value) is expected:
+                return value
+            if isinstance(value, expected) and not (
+                reject_bool and isinstance(value, bool)
+            ):
+                return value
+            if (
+                accept_int
+                and isinstance(value, int)
+                and not isinstance(value, bool)
+            ):
+                return float(value) if convert is not None else value
+            if convert is not None:
+                try:
+                    return convert(value)
+                except (KeyError, TypeError, ValueError):
+                    pass
+            problems.append(
+                (path, f"expected {name}, got {_type_name(type(value))}")
+            )
+            return value
+
+        self.exact[check] = expected
+        return check
+
+    def any_of(self, specs: List[Any]) -> Check:
+        nullable = any(s is None or s is type(None) for s in specs)
+        options = [s for s in specs if not (s is None or s is type(None))]
+        checks = [self.compile(s) for s in options]
+        strict = [self.strict().compile(s) for s in options]
+        coerce = self.coerce
+        probes = [self.probe().compile(s) for s in options] if coerce else []
+        names = " | ".join(
+            [_type_name(s) for s in options] + (["None"] if nullable else [])
+        )
+        if nullable and len(checks) == 1:
+            inner = checks[0]
+            return lambda value, path, problems: (
+                value if value is None else inner(value, path, problems)
+            )
+
+        def check(value: Any, path: _Path, problems: _Problems) -> Any:
+            if value is None and nullable:
+                return value
+            # Without coercion first, so ``(int, str)`` keeps "1" a str.
+            # Non-coercing checks never write, so failed options leave
+            # no trace.
+            for option in strict:
+                scratch: _Problems = []
+                option(value, path, scratch)
+                if not scratch:
+                    return value
+            for option, probe in zip(checks, probes):
+                scratch = []
+                if not isinstance(value, _CONTAINERS):
+                    new = option(value, path, scratch)
+                    if not scratch:
+                        return new
+                    continue
+                # Coercions write into containers: try with the probe,
+                # which writes nothing, and only let the winning option
+                # write into ``value``.
+                probe(value, path, scratch)
+                if not scratch:
+                    return option(value, path, problems)
+            problems.append(
+                (path, f"expected {names}, got {_type_name(type(value))}")
+            )
+            return value
+
+        return check
@@ -0,0 +1,507 @@
+"""Binary snapshots of RecursiveNamespaceV2 trees.
+
+A snapshot is a single file written bottom-up: every value is a tagged
+record, containers store the offsets of their children, and node keys
+are ids into one interned key table. ``open_snapshot`` memory-maps the
+file and decodes a node only when it is accessed, so opening costs the
+same for any file size and reading a few paths touches only the pages
+on those paths. Only ``struct`` and ``mmap`` are used.
+
+Layout (little-endian)::
+
+    header   magic(8) version(u16) flags(u16) keys_at(u64) root_at(u64)
+    record   tag(u8) payload
+               INT i64 | BIGINT u32 len + signed bytes | FLOAT f64
+               STR / BYTES u32 len + bytes
+               NODE / DICT u32 count + count * (key id u32, value at u64)
+                 NODE with >= 16 keys: + count * u32 entry numbers
+                 sorted by key, for binary search
+               LIST / TUPLE / SET u32 count + count * value at u64
+    keys     u32 count + count * u64 offsets of (u32 len + UTF-8)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import struct
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from . import utils
+from .errors import GetChainKeyError, SerializationError
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+MAGIC = b"RNSSNAP\x00"
+VERSION = 1
+FLAG_RAW_KEY = 1
+# Nodes with at least this many keys get a sorted index, so one lookup
+# reads O(log n) entries instead of the whole entry table.
+INDEX_MIN_KEYS = 16
+
+_HEADER = struct.Struct("<8sHHQQ")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_ENTRY = struct.Struct("<IQ")
+
+(
+    T_NONE,
+    T_FALSE,
+    T_TRUE,
+    T_INT,
+    T_BIGINT,
+    T_FLOAT,
+    T_STR,
+    T_BYTES,
+    T_NODE,
+    T_DICT,
+    T_LIST,
+    T_TUPLE,
+    T_SET,
+) = range(13)
+
+_SEQUENCE_TAGS: Dict[type, int] = {list: T_LIST, tuple: T_TUPLE, set: T_SET}
+_SEQUENCE_TYPES: Dict[int, type] = {T_LIST: list, T_TUPLE: tuple, T_SET: set}
+
+NodeItems = Callable[[Any], Optional[List[Tuple[str, Any]]]]
+
+# No decoded value is waiting to be added to its parent (``plain``).
+_PENDING: Any = object()
+
+
+class _Frame:
+    __slots__ = ("ident", "items", "keys", "offsets", "tag")
+
+    def __init__(
+        self, tag: int, ident: int, items: Iterator[Tuple[Any, Any]]
+    ) -> None:
+        self.tag = tag
+        self.ident = ident
+        self.items = items
+        self.keys: List[int] = []
+        self.offsets: List[int] = []
+
+
+class _Writer:
+    def __init__(self, fp: IO[bytes], node_items: NodeItems) -> None:
+        self._fp = fp
+        self._node_items = node_items
+        self._pos = 0
+        self._key_ids: Dict[str, int] = {}
+        self._key_list: List[str] = []
+
+    def _emit(self, *parts: bytes) -> int:
+        offset = self._pos
+        for part in parts:
+            self._fp.write(part)
+            self._pos += len(part)
+        return offset
+
+    def _key_id(self, key: Any) -> int:
+        if not isinstance(key, str):
+            raise SerializationError(
+                f"Snapshot keys must be str, got {type(key).__name__}"
+            )
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = self._key_ids[key] = len(self._key_ids)
+            self._key_list.append(key)
+        return key_id
+
+    def _open(self, value: Any) -> Optional[_Frame]:
+        items = self._node_items(value)
+        if items is not None:
+            return _Frame(T_NODE, id(value), iter(items))
+        if isinstance(value, dict):
+            return _Frame(T_DICT, id(value), iter(value.items()))
+        tag = _SEQUENCE_TAGS.get(type(value))
+        if tag is None and isinstance(value, (list, set)):
+            # Read-only lists and sets of frozen trees.
+            tag = _SEQUENCE_TAGS[list if isinstance(value, list) else set]
+        if tag is not None:
+            return _Frame(tag, id(value), enumerate(value))
+        return None
+
+    def _scalar(self, value: Any) -> int:
+        if value is None:
+            return self._emit(bytes((T_NONE,)))
+        if value is True or value is False:
+            return self._emit(bytes((T_TRUE if value else T_FALSE,)))
+        if type(value) is int:
+            if -(2**63) <= value < 2**63:
+                return self._emit(bytes((T_INT,)), _I64.pack(value))
+            raw = value.to_bytes(
+                (value.bit_length() + 8) // 8, "little", signed=True
+            )
+            return self._emit(bytes((T_BIGINT,)), _U32.pack(len(raw)), raw)
+        if type(value) is float:
+            return self._emit(bytes((T_FLOAT,)), _F64.pack(value))
+        if type(value) is str:
+            raw = value.encode("utf-8", "surrogatepass")
+            return self._emit(bytes((T_STR,)), _U32.pack(len(raw)), raw)
+        if type(value) is bytes:
+            return self._emit(bytes((T_BYTES,)), _U32.pack(len(value)), value)
+        raise SerializationError(
+            f"Cannot store {type(value).__name__} in a snapshot"
+        )
+
+    def _close(self, frame: _Frame) -> int:
+        head = bytes((frame.tag,)) + _U32.pack(len(frame.offsets))
+        if frame.tag in (T_NODE, T_DICT):
+            body = b"".join(
+                _ENTRY.pack(k, o) for k, o in zip(frame.keys, frame.offsets)
+            )
+            if frame.tag == T_NODE and len(frame.keys) >= INDEX_MIN_KEYS:
+                names = [self._key_list[k] for k in frame.keys]
+                order = sorted(range(len(names)), key=names.__getitem__)
+                body += b"".join(_U32.pack(i) for i in order)
+        else:
+            body = b"".join(_U64.pack(o) for o in frame.offsets)
+        return self._emit(head, body)
+
+    def value(self, value: Any) -> int:
+        """Write ``value`` children-first; return its record offset."""
+        frames: List[_Frame] = []
+        active: Set[int] = set()  # ids of the containers being written
+        offset = -1
+        while True:
+            frame = self._open(value)
+            if frame is None:
+                offset = self._scalar(value)
+            elif frame.ident in active:
+                raise SerializationError("Circular reference detected")
+            else:
+                active.add(frame.ident)
+                frames.append(frame)
+                offset = -1
+            while True:
+                if not frames:
+                    return offset
+                top = frames[-1]
+                if offset >= 0:
+                    top.offsets.append(offset)
+                step = next(top.items, None)
+                if step is None:
+                    frames.pop()
+                    active.discard(top.ident)
+                    offset = self._close(top)
+                    continue
+                key, value = step
+                if top.tag in (T_NODE, T_DICT):
+                    top.keys.append(self._key_id(key))
+                break
+
+    def key_table(self) -> int:
+        offsets = []
+        for key in self._key_ids:  # insertion order == id order
+            raw = key.encode("utf-8", "surrogatepass")
+            offsets.append(self._emit(_U32.pack(len(raw)), raw))
+        return self._emit(
+            _U32.pack(len(offsets)), b"".join(_U64.pack(o) for o in offsets)
+        )
+
+    def write(self, root: Any, flags: int) -> None:
+        if self._node_items(root) is None:
+            raise SerializationError("Snapshot root must be an RNS node")
+        self._emit(_HEADER.pack(MAGIC, VERSION, flags, 0, 0))
+        root_at = self.value(root)
+        keys_at = self.key_table()
+        self._fp.seek(0)
+        self._fp.write(_HEADER.pack(MAGIC, VERSION, flags, keys_at, root_at))
+
+
+def write_snapshot(
+    fp: IO[bytes], root: Any, node_items: NodeItems, flags: int = 0
+) -> None:
+    """Write ``root`` to the seekable binary file ``fp``.
+
+    ``node_items(value)`` returns a node's ``(key, value)`` pairs, or
+    ``None`` when ``value`` is not a node. Scalars are ``None``, bool,
+    int, float, str and bytes; containers are nodes, dicts, lists,
+    tuples and sets. Anything else, or a container that contains
+    itself, raises ``SerializationError``.
+    """
+    _Writer(fp, node_items).write(root, flags)
+
+
+class _Reader:
+    """Decodes records out of the shared memory map."""
+
+    def __init__(
+        self,
+        file: IO[bytes],
+        make_node: Callable[[Dict[str, Any], bool], Any],
+    ) -> None:
+        self.file = file
+        self.mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.make_node = make_node
+        if len(self.mm) < _HEADER.size:
+            self.close()
+            raise SerializationError("Not an RNS snapshot (file too short)")
+        magic, version, flags, self.keys_at, self.root_at = _HEADER.unpack_from(
+            self.mm, 0
+        )
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise SerializationError("Not an RNS snapshot (bad header)")
+        self.raw_key = bool(flags & FLAG_RAW_KEY)
+        self._keys: Dict[int, str] = {}
+
+    def close(self) -> None:
+        self.mm.close()
+        self.file.close()
+
+    def key(self, key_id: int) -> str:
+        key = self._keys.get(key_id)
+        if key is None:
+            (at,) = _U64.unpack_from(self.mm, self.keys_at + 4 + 8 * key_id)
+            (size,) = _U32.unpack_from(self.mm, at)
+            key = self.mm[at + 4 : at + 4 + size].decode(
+                "utf-8", "surrogatepass"
+            )
+            self._keys[key_id] = key
+        return key
+
+    def lookup(self, at: int, key: str) -> Optional[int]:
+        """Binary-search an indexed node for ``key``'s value offset.
+
+        Returns None when the node is too small to carry an index;
+        raises KeyError when it has one and ``key`` is absent.
+        """
+        mm = self.mm
+        (count,) = _U32.unpack_from(mm, at + 1)
+        if count < INDEX_MIN_KEYS:
+            return None
+        entries_at = at + 5
+        order_at = entries_at + _ENTRY.size * count
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (i,) = _U32.unpack_from(mm, order_at + 4 * mid)
+            key_id, value_at = _ENTRY.unpack_from(
+                mm, entries_at + _ENTRY.size * i
+            )
+            found = self.key(key_id)
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                return int(value_at)
+        raise KeyError(key)
+
+    def entries(self, at: int) -> Dict[str, int]:
+        (count,) = _U32.unpack_from(self.mm, at + 1)
+        raw = self.mm[at + 5 : at + 5 + _ENTRY.size * count]
+        return {self.key(k): o for k, o in _ENTRY.iter_unpack(raw)}
+
+    def plain(self, at: int) -> Any:
+        """Decode the record at ``at`` fully, nodes as dicts.
+
+        Iterative, like the writer, so deep trees do not hit the
+        recursion limit.
+        """
+        frames: List[
+            Tuple[int, Iterator[Tuple[Any, int]], List[Any], List[Any]]
+        ] = []
+        result: Any = _PENDING
+        while True:
+            tag = self.mm[at]
+            if tag in (T_NODE, T_DICT):
+                items = iter(self.entries(at).items())
+                frames.append((tag, items, [], []))
+            elif tag in _SEQUENCE_TYPES:
+                (count,) = _U32.unpack_from(self.mm, at + 1)
+                raw = self.mm[at + 5 : at + 5 + 8 * count]
+                offsets = (o for (o,) in _U64.iter_unpack(raw))
+                frames.append((tag, enumerate(offsets), [], []))
+            else:
+                result = self.value(at)
+            while True:
+                if not frames:
+                    return result
+                tag, items, keys, values = frames[-1]
+                if result is not _PENDING:
+                    values.append(result)
+                    result = _PENDING
+                step = next(items, None)
+                if step is not None:
+                    key, at = step
+                    keys.append(key)
+                    break
+                frames.pop()
+                if tag in (T_NODE, T_DICT):
+                    result = dict(zip(keys, values))
+                else:
+                    result = _SEQUENCE_TYPES[tag](values)
+
+    def value(self, at: int) -> Any:
+        mm = self.mm
+        tag = mm[at]
+        if tag == T_NONE:
+            return None
+        if tag == T_FALSE:
+            return False
+        if tag == T_TRUE:
+            return True
+        if tag == T_INT:
+            return _I64.unpack_from(mm, at + 1)[0]
+        if tag == T_FLOAT:
+            return _F64.unpack_from(mm, at + 1)[0]
+        if tag in (T_STR, T_BYTES, T_BIGINT):
+            (size,) = _U32.unpack_from(mm, at + 1)
+            raw = mm[at + 5 : at + 5 + size]
+            if tag == T_STR:
+                return raw.decode("utf-8", "surrogatepass")
+            if tag == T_BYTES:
+                return raw
+            return int.from_bytes(raw, "little", signed=True)
+        if tag == T_NODE:
+            return SnapshotNode(self, at)
+        if tag == T_DICT:
+            return {k: self.value(o) for k, o in self.entries(at).items()}
+        seq_type = _SEQUENCE_TYPES.get(tag)
+        if seq_type is None:
+            raise SerializationError(f"Corrupt snapshot: tag {tag} at {at}")
+        (count,) = _U32.unpack_from(mm, at + 1)
+        raw = mm[at + 5 : at + 5 + 8 * count]
+        return seq_type(self.value(o) for (o,) in _U64.iter_unpack(raw))
+
+
+class SnapshotNode:
+    """Read-only, lazily decoded view of one node in a snapshot.
+
+    Data is reached like on an RNS: ``node.key``, ``node["key"]``, or a
+    chain key through ``val_get("a.b[].0.c")``. Single lookups on large
+    nodes binary-search the node's sorted index; listing keys reads its
+    entry table once. Child nodes are further ``SnapshotNode`` views
+    and scalars are decoded when read. ``to_dict()`` equals the
+    saved tree's ``to_dict()``; ``to_rns()`` rebuilds a full RNS.
+    Closing the root (or leaving its ``with`` block) unmaps the file.
+    """
+
+    __slots__ = ("_at", "_index", "_reader")
+
+    def __init__(self, reader: _Reader, at: int) -> None:
+        self._reader = reader
+        self._at = at
+        self._index: Optional[Dict[str, int]] = None
+
+    def _entries(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = self._reader.entries(self._at)
+        return self._index
+
+    def _value_at(self, key: str) -> int:
+        if not self._reader.raw_key:
+            key = utils.KEY_NORMALIZE_RE.sub("_", key)
+        if self._index is None:
+            at = self._reader.lookup(self._at, key)
+            if at is not None:
+                return at
+        return self._entries()[key]
+
+    def __getitem__(self, key: str) -> Any:
+        return self._reader.value(self._value_at(key))
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        try:
+            self._value_at(key)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries())
+
+    def __repr__(self) -> str:
+        return f"SnapshotNode(keys={list(self._entries())})"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def keys(self) -> List[str]:
+        return list(self._entries())
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(k, self[k]) for k in self._entries()]
+
+    def val_get(self, key: str) -> Any:
+        """Resolve a chain key (``a.b``, ``a.list[].0.c``, ``a.list[].#``).
+
+        A path that cannot be followed raises ``GetChainKeyError``, as
+        ``RNS.val_get`` does.
+        """
+        value: Any = self
+        parts = utils.split_key(key)
+        for i, part in enumerate(parts):
+            name = utils.unescape_key(part)
+            try:
+                if isinstance(value, (list, tuple)):
+                    value = value[-1 if name == "#" else int(name)]
+                    continue
+                if name[-2:] == utils.KEY_ARRAY:
+                    name = name[:-2]
+                value = value[name]
+            except (LookupError, TypeError, ValueError):
+                raise GetChainKeyError(
+                    value, utils.join_key(parts[:i]), utils.join_key(parts[i:])
+                ) from None
+        return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = self._reader.plain(self._at)
+        return data
+
+    def to_rns(self) -> Any:
+        return self._reader.make_node(self.to_dict(), self._reader.raw_key)
+
+    def close(self) -> None:
+        self._reader.close()
+
+
+def open_snapshot(
+    path: Any, make_node: Callable[[Dict[str, Any], bool], Any]
+) -> SnapshotNode:
+    """Map the snapshot at ``path`` and return its root view.
+
+    ``make_node(data, use_raw_key)`` builds the RNS for ``to_rns``.
+    """
+    with contextlib.ExitStack() as stack:
+        file = stack.enter_context(open(path, "rb"))
+        try:
+            reader = _Reader(file, make_node)
+        except (ValueError, OSError) as e:
+            raise SerializationError(f"Failed to open snapshot: {e}")
+        stack.pop_all()  # the reader owns the file from here on
+    return SnapshotNode(reader, reader.root_at)
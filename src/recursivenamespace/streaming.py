@@ -0,0 +1,411 @@
+"""Incremental JSON reading for RecursiveNamespaceV2.
+
+``parse_json_stream`` reads a document from a file object in fixed-size
+chunks and builds the result bottom-up: every JSON object is handed to
+``make_node`` as soon as its closing brace is read, so the raw text is
+never held in full and no intermediate plain-dict tree is kept around.
+Only the standard library is used; strings are decoded with
+``json.decoder.scanstring`` and numbers matched with ``json``'s own
+number pattern, so values decode exactly as ``json.loads`` would.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from json.scanner import NUMBER_RE
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from . import utils
+from .errors import SerializationError
+from .events import WILDCARD
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Not in the typeshed stubs, but public and stable since Python 2.
+_scanstring: Callable[[str, int], Tuple[str, int]] = json.decoder.scanstring  # type: ignore[attr-defined]
+
+_WHITESPACE = " \t\n\r"
+_SKIP_RUN_RE = re.compile(
+    r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL
+)
+_STRING_TAIL_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_BARE_RE = re.compile(r"[^\s,:\]}]+")
+_LITERALS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+_LITERAL_MAX_LEN = max(len(k) for k in _LITERALS)
+
+
+class _ChunkReader:
+    """Sliding text window over a file object.
+
+    ``buf[pos:]`` is the unread text. ``fill()`` appends the next chunk
+    and drops the consumed prefix, so memory stays at roughly one chunk
+    plus the token currently being decoded.
+    """
+
+    __slots__ = ("_decoder", "_fp", "buf", "chunk_size", "eof", "pos")
+
+    def __init__(self, fp: IO[Any], chunk_size: int) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        self._fp = fp
+        self._decoder: Optional[codecs.IncrementalDecoder] = None
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, at_least: int = 0) -> bool:
+        """Read one more chunk; return False at end of input."""
+        if self.eof:
+            return False
+        raw = self._fp.read(max(self.chunk_size, at_least))
+        if isinstance(raw, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            text = self._decoder.decode(raw, final=not raw)
+        else:
+            text = raw
+        if not raw:
+            self.eof = True
+        if text:
+            self.buf = self.buf[self.pos :] + text
+            self.pos = 0
+        return bool(text) or not self.eof
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next char ('' at end)."""
+        while True:
+            buf, pos, n = self.buf, self.pos, len(self.buf)
+            while pos < n and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < n:
+                return buf[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def read_string(self) -> str:
+        """Decode the string starting at ``pos`` (which is on the quote)."""
+        while True:
+            try:
+                value, end = _scanstring(self.buf, self.pos + 1)
+            except json.JSONDecodeError:
+                # Possibly just cut by the chunk boundary: read more,
+                # growing geometrically so a huge string is rescanned
+                # O(log n) times rather than once per chunk.
+                if not self.fill(len(self.buf)):
+                    raise
+                continue
+            self.pos = end
+            return value
+
+    def read_scalar(self) -> Any:
+        char = self.peek()
+        if char == '"':
+            return self.read_string()
+        while True:
+            match = NUMBER_RE.match(self.buf, self.pos)
+            if match is not None:
+                # A number ending within 2 chars of the buffer may go on
+                # in the next chunk ("1" + ".5", "1e" + "-3").
+                if len(self.buf) - match.end() < 3 and self.fill():
+                    continue
+                integer, frac, exp = match.groups()
+                self.pos = match.end()
+                if frac or exp:
+                    return float(integer + (frac or "") + (exp or ""))
+                return int(integer)
+            if len(self.buf) - self.pos < _LITERAL_MAX_LEN and self.fill():
+                continue
+            for literal, value in _LITERALS.items():
+                if self.buf.startswith(literal, self.pos):
+                    self.pos += len(literal)
+                    return value
+            raise self.error("Expecting value")
+
+    def skip_value(self) -> None:
+        """Step over the next value without decoding it.
+
+        Containers are skipped by bracket counting: one regex call
+        consumes everything up to the next bracket, strings included,
+        so unselected subtrees cost a scan rather than a parse. Only
+        their bracket balance is checked.
+        """
+        char = self.peek()
+        if char not in "{[":
+            self.pos += char == '"'
+            self._skip_token(_STRING_TAIL_RE if char == '"' else _BARE_RE)
+            return
+        depth = 0
+        while True:
+            run = _SKIP_RUN_RE.match(self.buf, self.pos)
+            assert run is not None  # the pattern also matches ""
+            self.pos = pos = run.end()
+            if pos == len(self.buf) or self.buf[pos] == '"':
+                # Buffer exhausted, or a string cut by its end.
+                if not self.fill(len(self.buf) - pos):
+                    raise self.error("Unterminated container")
+                continue
+            self.pos = pos + 1
+            if self.buf[pos] in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if not depth:
+                    return
+
+    def _skip_token(self, pattern: re.Pattern[str]) -> None:
+        """Move past ``pattern`` matched whole, refilling as needed."""
+        while True:
+            match = pattern.match(self.buf, self.pos)
+            if match is not None and match.end() < len(self.buf):
+                break
+            if not self.fill(len(self.buf)):
+                if match is None or not match.group():
+                    raise self.error("Expecting value")
+                break
+        self.pos = match.end()
+
+    def error(self, msg: str) -> SerializationError:
+        snippet = self.buf[self.pos : self.pos + 20]
+        return SerializationError(f"Invalid JSON: {msg} near {snippet!r}")
+
+
+Selection = Dict[str, Any]
+"""Compiled ``select`` paths: key -> child ``Selection`` or ``None``.
+
+``None`` takes the whole subtree; a nested dict keeps only the keys it
+names. ``"*"`` matches any key or array index.
+"""
+
+
+def compile_selection(
+    paths: Iterable[str], match_key: Callable[[str], str] = str
+) -> Selection:
+    """Turn chain keys such as ``"data.users[].*.id"`` into a trie.
+
+    ``"name[]"`` segments address arrays: the segment after them is an
+    index or ``*``. A path that is a prefix of another takes the whole
+    subtree, so ``["a", "a.b"]`` selects all of ``a``. Segments are
+    unescaped and passed through ``match_key``, the same function that
+    ``project`` and ``parse_json_stream`` apply to the keys they read,
+    so ``"a-b.c"`` finds what ``val_get("a-b.c")`` would.
+    """
+    root: Selection = {}
+    for path in paths:
+        if not path:
+            raise ValueError("select paths must be non-empty chain keys")
+        segments = [
+            match_key(utils.unescape_key(seg[: -len(utils.KEY_ARRAY)]))
+            if seg.endswith(utils.KEY_ARRAY)
+            else match_key(utils.unescape_key(seg))
+            for seg in utils.split_key(path)
+        ]
+        node = root
+        for seg in segments[:-1]:
+            child = node.setdefault(seg, {})
+            if child is None:
+                break  # an ancestor is already taken whole
+            node = child
+        else:
+            node[segments[-1]] = None
+    return root
+
+
+_SKIP: Any = object()
+
+
+def _merge(a: Optional[Selection], b: Optional[Selection]) -> Any:
+    if a is None or b is None:
+        return None
+    merged = dict(a)
+    for key, sub in b.items():
+        merged[key] = _merge(merged[key], sub) if key in merged else sub
+    return merged
+
+
+def _child_selection(selection: Selection, key: str) -> Any:
+    exact = selection.get(key, _SKIP)
+    wild = selection.get(WILDCARD, _SKIP)
+    if wild is _SKIP:
+        return exact
+    if exact is _SKIP:
+        return wild
+    return _merge(exact, wild)
+
+
+def project(
+    value: Any, selection: Selection, match_key: Callable[[str], str] = str
+) -> Any:
+    """Apply ``selection`` to an already decoded object or array.
+
+    Same rules as ``parse_json_stream(select=...)``, for callers that
+    decode with ``json.loads`` first (e.g. one JSON Lines record).
+    """
+    if isinstance(value, dict):
+        items: Iterable[Tuple[Any, Any]] = value.items()
+    else:
+        items = enumerate(value)
+    picked: List[Tuple[Any, Any]] = []
+    for key, sub in items:
+        name = match_key(key) if isinstance(key, str) else str(key)
+        child = _child_selection(selection, name)
+        if child is _SKIP:
+            continue
+        if child is not None:
+            if not isinstance(sub, (dict, list)):
+                continue  # the selected path goes below a scalar
+            sub = project(sub, child, match_key)
+            if not sub:
+                continue
+        picked.append((key, sub))
+    if isinstance(value, dict):
+        return dict(picked)
+    return [sub for _, sub in picked]
+
+
+def parse_json_stream(
+    fp: IO[Any],
+    make_node: Callable[[Dict[str, Any]], Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    make_item_node: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    select: Optional[Selection] = None,
+    match_key: Callable[[str], str] = str,
+) -> Any:
+    """Parse one JSON object from ``fp`` incrementally.
+
+    ``fp`` may be opened in text or binary (UTF-8) mode. Each completed
+    JSON object is replaced by ``make_node(dict)``, or by
+    ``make_item_node(dict)`` when it sits anywhere inside an array;
+    arrays stay lists. The parse is iterative, so nesting depth is not
+    bounded by the recursion limit. The top-level value must be an
+    object.
+
+    With ``select`` (see ``compile_selection``) only the selected
+    subtrees and the containers leading to them are built; everything
+    else is scanned past without decoding. Object keys are compared
+    after ``match_key``; array items are matched by index and kept in
+    order without gaps. Containers in which no selected path was found
+    are left out.
+    """
+    if make_item_node is None:
+        make_item_node = make_node
+    reader = _ChunkReader(fp, chunk_size)
+    if reader.peek() != "{":
+        raise reader.error("JSON must represent a dict")
+
+    # Open containers, the key (objects) or next index (arrays) whose
+    # value is being read, and each container's selection.
+    stack: List[Union[Dict[str, Any], List[Any]]] = []
+    keys: List[Any] = []
+    selections: List[Optional[Selection]] = []
+    array_depth = 0
+
+    def read_key() -> str:
+        if reader.peek() != '"':
+            raise reader.error("Expecting property name enclosed in quotes")
+        key = reader.read_string()
+        reader.expect(":")
+        return key
+
+    while True:
+        selection: Any
+        if not stack:
+            selection = select
+        elif selections[-1] is None:
+            selection = None
+        elif isinstance(keys[-1], str):
+            selection = _child_selection(selections[-1], match_key(keys[-1]))
+        else:
+            selection = _child_selection(selections[-1], str(keys[-1]))
+
+        char = reader.peek()
+        value: Any
+        if selection is _SKIP:
+            reader.skip_value()
+            value = _SKIP
+        elif char == "{":
+            reader.pos += 1
+            if reader.peek() != "}":
+                stack.append({})
+                keys.append(read_key())
+                selections.append(selection)
+                continue
+            reader.pos += 1
+            if selection is not None and stack:
+                value = _SKIP
+            else:
+                value = (make_item_node if array_depth else make_node)({})
+        elif char == "[":
+            reader.pos += 1
+            if reader.peek() != "]":
+                stack.append([])
+                keys.append(0)
+                selections.append(selection)
+                array_depth += 1
+                continue
+            reader.pos += 1
+            value = [] if selection is None else _SKIP
+        else:
+            value = reader.read_scalar()
+            if selection is not None:
+                value = _SKIP  # the selected path goes below a scalar
+
+        # Attach ``value`` to its parent, closing every container that
+        # ends right after it.
+        while stack:
+            container = stack[-1]
+            is_dict = isinstance(container, dict)
+            if value is _SKIP:
+                pass
+            elif isinstance(container, dict):
+                container[keys[-1]] = value
+            else:
+                container.append(value)
+            char = reader.peek()
+            reader.pos += 1
+            if char == ",":
+                keys[-1] = read_key() if is_dict else keys[-1] + 1
+                break
+            if char != ("}" if is_dict else "]"):
+                reader.pos -= 1
+                raise reader.error("Expecting ',' delimiter")
+            stack.pop()
+            keys.pop()
+            if not is_dict:
+                array_depth -= 1
+            if selections.pop() is not None and not container and stack:
+                value = _SKIP  # nothing selected was found in here
+            elif isinstance(container, dict):
+                maker = make_item_node if array_depth else make_node
+                value = maker(container)
+            else:
+                value = container
+        else:
+            if reader.peek() != "":
+                raise reader.error("Extra data")
+            return value
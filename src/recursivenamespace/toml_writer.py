@@ -0,0 +1,246 @@
+"""Streaming TOML writer for RecursiveNamespaceV2 trees.
+
+``iter_toml`` walks a tree with an explicit stack and yields the
+document line by line, so it can be written in chunks without building
+it first. Tables become ``[a.b]`` headers, non-empty arrays whose items
+are all tables become ``[[a.b]]`` arrays of tables, and tables inside
+any other array become inline tables. Keys that are not bare are quoted
+per dotted-key segment. ``datetime``, ``date`` and ``time`` values are
+written as TOML date-times.
+
+TOML has no null, so ``None`` table values are omitted. Values TOML
+cannot represent (``None`` inside an array, unknown types) turn their
+entry into a ``# key = [type X not supported]`` comment.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import re
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+NodeItems = Callable[[Any], List[Tuple[str, Any]]]
+
+_ARRAY_TYPES = (list, tuple, set, frozenset)
+_BARE_KEY_RE = re.compile(r"[A-Za-z0-9_-]+")
+_ESCAPE_RE = re.compile(r'[\x00-\x1f"\\\x7f]')
+_ESCAPES = {
+    "\b": "\\b",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\f": "\\f",
+    "\r": "\\r",
+    '"': '\\"',
+    "\\": "\\\\",
+}
+
+# Inline work items: text to emit, a value to render, or leaving a
+# container (for cycle detection).
+_TEXT, _VALUE, _LEAVE = range(3)
+
+
+class _Unsupported(TypeError):
+    """A value TOML cannot represent; the message is its type name."""
+
+
+def _escape_char(match: "re.Match[str]") -> str:
+    char = match.group()
+    return _ESCAPES.get(char) or f"\\u{ord(char):04x}"
+
+
+def format_string(value: str) -> str:
+    """Render ``value`` as a TOML basic string."""
+    return f'"{_ESCAPE_RE.sub(_escape_char, value)}"'
+
+
+@functools.lru_cache(maxsize=4096)
+def format_key(key: str) -> str:
+    """Render one key segment, quoting it unless it is a bare key."""
+    return key if _BARE_KEY_RE.fullmatch(key) else format_string(key)
+
+
+def format_path(path: Sequence[str]) -> str:
+    """Render a dotted key such as ``a."b.c".d``."""
+    return ".".join(map(format_key, path))
+
+
+def format_scalar(value: Any) -> Optional[str]:
+    """Render a bool, number, string or date-time; None for other types."""
+    fmt = _SCALAR_FORMATS.get(type(value))
+    if fmt is not None:
+        return fmt(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return float.__repr__(value)
+    if isinstance(value, str):
+        return format_string(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return None
+
+
+_SCALAR_FORMATS: Dict[type, Callable[[Any], str]] = {
+    bool: lambda v: "true" if v else "false",
+    int: int.__repr__,
+    float: float.__repr__,
+    str: format_string,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: datetime.time.isoformat,
+}
+
+
+def _is_table(value: Any, node_type: type) -> bool:
+    return isinstance(value, (node_type, Mapping))
+
+
+def _table_items(
+    value: Any, node_type: type, node_items: NodeItems
+) -> Optional[List[Tuple[str, Any]]]:
+    if isinstance(value, node_type):
+        return node_items(value)
+    if not isinstance(value, Mapping):
+        return None
+    items = list(value.items())
+    for key, _ in items:
+        if not isinstance(key, str):
+            raise _Unsupported(f"{type(key).__name__} key")
+    return items
+
+
+def format_inline(value: Any, node_type: type, node_items: NodeItems) -> str:
+    """Render ``value`` as an inline TOML value, without recursion.
+
+    Raises ``_Unsupported`` for values TOML cannot hold and
+    ``ValueError`` for a container that contains itself.
+    """
+    if isinstance(value, _ARRAY_TYPES):
+        # Common case: a flat array of scalars.
+        texts = [format_scalar(v) for v in value]
+        if None not in texts:
+            return f"[{', '.join(texts)}]"  # type: ignore[arg-type]
+    parts: List[str] = []
+    active: Set[int] = set()
+    stack: List[Tuple[int, Any]] = [(_VALUE, value)]
+    while stack:
+        kind, item = stack.pop()
+        if kind == _TEXT:
+            parts.append(item)
+            continue
+        if kind == _LEAVE:
+            active.discard(item)
+            continue
+        text = format_scalar(item)
+        if text is not None:
+            parts.append(text)
+            continue
+        items = _table_items(item, node_type, node_items)
+        if items is not None:
+            children = [
+                (f"{format_key(k)} = ", v) for k, v in items if v is not None
+            ]
+            opener, closer = ("{ ", " }") if children else ("{", "}")
+        elif isinstance(item, _ARRAY_TYPES):
+            children = [("", v) for v in item]
+            opener, closer = "[", "]"
+        else:
+            raise _Unsupported(type(item).__name__)
+        if id(item) in active:
+            raise ValueError("Circular reference detected")
+        active.add(id(item))
+        stack.append((_LEAVE, id(item)))
+        stack.append((_TEXT, closer))
+        for index in range(len(children) - 1, -1, -1):
+            prefix, child = children[index]
+            stack.append((_VALUE, child))
+            if index:
+                prefix = ", " + prefix
+            if prefix:
+                stack.append((_TEXT, prefix))
+        stack.append((_TEXT, opener))
+    return "".join(parts)
+
+
+def iter_toml(
+    root: Any, node_type: type, node_items: NodeItems
+) -> Iterator[str]:
+    """Yield the TOML document for ``root`` one line at a time.
+
+    ``node_items`` returns the ``(key, value)`` pairs of a
+    ``node_type`` instance; plain mappings are tables as well. A
+    table's items are only read when it is written, so memory stays
+    proportional to the nesting depth. Raises ``ValueError`` if a table
+    contains itself.
+    """
+    if not _is_table(root, node_type):
+        raise TypeError(f"cannot write {type(root).__name__} as a TOML table")
+    written = False
+    active: Set[int] = set()
+    # (path, node, header): header is "" for the root, "[" for a table
+    # and "[[" for an array-of-tables element; an int leaves a table.
+    stack: List[Any] = [((), root, "")]
+    while stack:
+        frame = stack.pop()
+        if isinstance(frame, int):
+            active.discard(frame)
+            continue
+        table_path, node, header = frame
+        if id(node) in active:
+            raise ValueError("Circular reference detected")
+        lines: List[str] = []
+        children: List[Tuple[Tuple[str, ...], Any, str]] = []
+        for key, value in _table_items(node, node_type, node_items) or ():
+            if value is None:
+                continue
+            text = format_scalar(value)
+            if text is not None:
+                lines.append(f"{format_key(key)} = {text}\n")
+                continue
+            path = table_path + (key,)
+            if _is_table(value, node_type):
+                children.append((path, value, "["))
+                continue
+            if (
+                isinstance(value, _ARRAY_TYPES)
+                and value
+                and all(_is_table(v, node_type) for v in value)
+            ):
+                children.extend((path, v, "[[") for v in value)
+                continue
+            try:
+                text = format_inline(value, node_type, node_items)
+            except _Unsupported as e:
+                lines.append(
+                    f"# {format_key(key)} = [type {e} not supported]\n"
+                )
+            else:
+                lines.append(f"{format_key(key)} = {text}\n")
+
+        if header and (header == "[[" or lines or not children):
+            closer = "]]" if header == "[[" else "]"
+            if written:
+                yield "\n"
+            yield f"{header}{format_path(table_path)}{closer}\n"
+            written = True
+        if lines:
+            yield "".join(lines)
+            written = True
+
+        active.add(id(node))
+        stack.append(id(node))
+        stack.extend(reversed(children))
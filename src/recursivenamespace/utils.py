@@ -9,6 +9,8 @@ from typing import Any, Dict, List, NamedTuple
 
 KEY_SEP_CHAR = "."
 KEY_ARRAY = "[]"
+# Characters that nodes without ``use_raw_key`` replace with "_" in keys.
+KEY_NORMALIZE_RE = re.compile(r"[.\-\s]")
 
 
 def escape_key(key: str, sep: str | None = None) -> str:
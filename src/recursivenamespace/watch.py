@@ -0,0 +1,143 @@
+"""Poll a config file and apply its changes to a live tree in place."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    List,
+    Optional,
+    Union,
+)
+
+from .cache import Stamp, file_stamp
+from .concurrency import RWLock
+from .errors import SerializationError
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = ["FileWatcher"]
+
+_logger = logging.getLogger(__name__)
+
+
+class FileWatcher:
+    """Keep ``tree`` in sync with the file at ``filepath``.
+
+    Each ``poll()`` costs one ``os.stat``; the file is parsed again
+    only when its ``(st_mtime_ns, st_size, st_ino)`` stamp changed.
+    The new contents are then diffed against ``tree`` and only the
+    differing entries are written, so unchanged subtrees keep their
+    identity and subscribers see one batch of mutations. ``on_change``
+    receives the changed chain keys.
+
+    A file that fails to parse (e.g. caught mid-write) is logged,
+    kept in ``error``, and retried once it changes again; ``tree``
+    keeps the last good contents. Built by ``RNS.watch``.
+    """
+
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        load: Callable[[], Any],
+        apply_diff: Callable[[Any, Any], List[str]],
+        interval: Optional[float] = 1.0,
+        on_change: Optional[Callable[[List[str]], None]] = None,
+    ) -> None:
+        if interval is not None and interval <= 0:
+            raise ValueError(f"interval must be > 0 or None, got {interval}")
+        self.filepath = Path(filepath)
+        self.interval = interval
+        self.on_change = on_change
+        self.error: Optional[Exception] = None
+        self._load = load
+        self._apply_diff = apply_diff
+        self._lock = RWLock()
+        self._poll_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stamp: Optional[Stamp] = file_stamp(self.filepath)
+        self.tree = load()
+        if interval is not None:
+            self.start()
+
+    def __repr__(self) -> str:
+        state = "running" if self.running else "stopped"
+        return f"FileWatcher({str(self.filepath)!r}, {state})"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @contextlib.contextmanager
+    def read(self) -> Generator[Any, None, None]:
+        """Yield ``tree`` while no reload is being applied."""
+        with self._lock.read_locked():
+            yield self.tree
+
+    def poll(self) -> List[str]:
+        """Check the file once; return the chain keys that changed."""
+        with self._poll_lock:
+            try:
+                stamp = file_stamp(self.filepath)
+            except FileNotFoundError:
+                # Replaced by rename, or deleted: wait for it to return.
+                return []
+            if stamp == self._stamp:
+                return []
+            self._stamp = stamp
+            try:
+                new_tree = self._load()
+            # What load_json / load_toml raise for a bad or missing file.
+            except (OSError, SerializationError) as e:
+                self.error = e
+                _logger.warning("Reload of %s failed: %s", self.filepath, e)
+                return []
+            self.error = None
+            with self._lock.write_locked():
+                changed = self._apply_diff(self.tree, new_tree)
+        if changed and self.on_change is not None:
+            self.on_change(changed)
+        return changed
+
+    def start(self) -> None:
+        """Poll every ``interval`` seconds on a daemon thread."""
+        if self.running:
+            return
+        if self.interval is None:
+            raise ValueError("start() needs an interval")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"FileWatcher({self.filepath.name})",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the polling thread and wait for it to exit."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        assert self.interval is not None
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                _logger.exception("on_change for %s failed", self.filepath)
@@ -0,0 +1,90 @@
+"""Tests for the async loaders and savers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from recursivenamespace import RNS, SerializationError
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SAMPLE_JSON = FIXTURES_DIR / "sample_config.json"
+SAMPLE_TOML = FIXTURES_DIR / "sample_config.toml"
+
+
+def test_aload_json_matches_load_json():
+    loaded = asyncio.run(RNS.aload_json(SAMPLE_JSON))
+    assert loaded == RNS.load_json(SAMPLE_JSON)
+
+
+def test_aload_toml_matches_load_toml():
+    loaded = asyncio.run(RNS.aload_toml(SAMPLE_TOML))
+    assert loaded == RNS.load_toml(SAMPLE_TOML)
+
+
+def test_aload_json_custom_executor():
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        loaded = asyncio.run(RNS.aload_json(SAMPLE_JSON, executor=pool))
+    assert loaded._.to_dict() == json.loads(SAMPLE_JSON.read_text())
+
+
+def test_aload_json_errors_propagate(tmp_path):
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    with pytest.raises(SerializationError):
+        asyncio.run(RNS.aload_json(bad))
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(RNS.aload_json(tmp_path / "missing.json"))
+
+
+def test_asave_json_and_toml_round_trip(tmp_path):
+    ns = RNS({"app": {"name": "demo", "port": 8080}, "tags": ["a", "b"]})
+
+    async def main():
+        await ns._.asave_json(tmp_path / "out" / "cfg.json", indent=None)
+        await ns._.asave_toml(tmp_path / "out" / "cfg.toml")
+        return await RNS.aload_many(
+            [tmp_path / "out" / "cfg.json", tmp_path / "out" / "cfg.toml"]
+        )
+
+    loaded = asyncio.run(main())
+    assert [v._.to_dict() for v in loaded.values()] == [ns._.to_dict()] * 2
+    assert "\n" not in (tmp_path / "out" / "cfg.json").read_text()
+
+
+def test_aload_many_respects_limit(tmp_path, monkeypatch):
+    paths = []
+    for i in range(12):
+        p = tmp_path / f"f{i}.json"
+        p.write_text(json.dumps({"i": i}))
+        paths.append(p)
+
+    active = []
+    peak = []
+    original = RNS.load_json.__func__
+
+    def tracking_load(cls, *args, **kwargs):
+        active.append(1)
+        peak.append(len(active))
+        try:
+            time.sleep(0.01)
+            return original(cls, *args, **kwargs)
+        finally:
+            active.pop()
+
+    monkeypatch.setattr(RNS, "load_json", classmethod(tracking_load))
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        loaded = asyncio.run(RNS.aload_many(paths, limit=3, executor=pool))
+    assert [ns.i for ns in loaded.values()] == list(range(12))
+    assert list(loaded) == [str(p) for p in paths]
+    assert max(peak) <= 3
+
+
+def test_aload_many_rejects_bad_limit():
+    with pytest.raises(ValueError):
+        asyncio.run(RNS.aload_many([], limit=0))
@@ -0,0 +1,108 @@
+"""Tests for load_many() / save_many()."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from recursivenamespace import RNS, BulkSerializationError, SerializationError
+
+
+def _write_corpus(tmp_path, n):
+    paths = []
+    for i in range(n):
+        p = tmp_path / f"tenant_{i}.json"
+        p.write_text(json.dumps({"tenant": {"id": i, "tags": ["a", "b"]}}))
+        paths.append(p)
+    return paths
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_many(tmp_path, executor):
+    paths = _write_corpus(tmp_path, 10)
+    loaded = RNS.load_many(paths, workers=2, executor=executor)
+    assert list(loaded) == [str(p) for p in paths]
+    assert [ns.tenant.id for ns in loaded.values()] == list(range(10))
+    assert isinstance(loaded[str(paths[0])].tenant, RNS)
+
+
+def test_load_many_mixed_suffixes_and_custom_executor(tmp_path):
+    (tmp_path / "a.json").write_text('{"x": 1}')
+    (tmp_path / "b.toml").write_text("x = 2\n")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        loaded = RNS.load_many(
+            [tmp_path / "a.json", tmp_path / "b.toml"], executor=pool
+        )
+    assert [ns.x for ns in loaded.values()] == [1, 2]
+
+
+def test_load_many_collects_errors(tmp_path):
+    paths = _write_corpus(tmp_path, 3)
+    bad = tmp_path / "bad.json"
+    bad.write_text("{oops")
+    missing = tmp_path / "missing.json"
+    with pytest.raises(BulkSerializationError) as exc_info:
+        RNS.load_many([paths[0], bad, missing, paths[1]], executor="thread")
+    err = exc_info.value
+    assert isinstance(err, SerializationError)
+    assert set(err.errors) == {str(bad), str(missing)}
+    assert isinstance(err.errors[str(missing)], FileNotFoundError)
+    assert list(err.loaded) == [str(paths[0]), str(paths[1])]
+    copy = pickle.loads(pickle.dumps(err))
+    assert type(copy) is BulkSerializationError and str(copy) == str(err)
+    assert set(copy.errors) == set(err.errors)
+    assert copy.loaded[str(paths[0])].tenant.id == 0
+
+
+def test_load_many_empty_and_bad_executor(tmp_path):
+    assert RNS.load_many([]) == {}
+    with pytest.raises(ValueError, match="executor"):
+        RNS.load_many(_write_corpus(tmp_path, 1), executor="fiber")
+
+
+def test_save_many_round_trip(tmp_path):
+    targets = {
+        tmp_path / "out" / "a.json": RNS({"a": 1}),
+        tmp_path / "out" / "b.toml": RNS({"b": {"c": 2}}),
+    }
+    RNS.save_many(targets)
+    loaded = RNS.load_many(targets, executor="thread")
+    assert [ns._.to_dict() for ns in loaded.values()] == [
+        {"a": 1},
+        {"b": {"c": 2}},
+    ]
+
+
+def test_save_many_collects_errors(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    ok = tmp_path / "ok.json"
+    with pytest.raises(BulkSerializationError) as exc_info:
+        RNS.save_many({ok: RNS({"a": 1}), blocker / "x.json": RNS({})})
+    assert list(exc_info.value.errors) == [str(blocker / "x.json")]
+    assert ok.exists()
+
+
+def test_aload_many_collects_errors(tmp_path):
+    paths = _write_corpus(tmp_path, 2)
+    with pytest.raises(BulkSerializationError) as exc_info:
+        asyncio.run(RNS.aload_many([paths[0], tmp_path / "nope.json"]))
+    assert list(exc_info.value.loaded) == [str(paths[0])]
+
+
+def test_aload_many_reraises_cancellation(tmp_path, monkeypatch):
+    paths = _write_corpus(tmp_path, 2)
+    original = RNS.load_json.__func__
+
+    def load(cls, path, *args):
+        if path == paths[1]:
+            raise asyncio.CancelledError
+        return original(cls, path, *args)
+
+    monkeypatch.setattr(RNS, "load_json", classmethod(load))
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(RNS.aload_many(paths))
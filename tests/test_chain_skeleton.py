@@ -0,0 +1,112 @@
+"""Tests for compiled skeletons in @rns.rns(use_chain_key=True)."""
+
+from __future__ import annotations
+
+import pytest
+
+from recursivenamespace import RNS, rns
+from recursivenamespace.main import _StaticImpl
+from recursivenamespace.utils import KV_Pair
+
+
+def chain_builder(keys, **options):
+    @rns.rns(use_chain_key=True, **options)
+    def build(values):
+        return [KV_Pair(k, v) for k, v in zip(keys, values)]
+
+    return build
+
+
+def slow_build(keys, values, accepted=None, use_raw_key=False):
+    ret = RNS(None, accepted, use_raw_key)
+    for key, value in zip(keys, values):
+        ret._.val_set(key, value)
+    return ret
+
+
+@pytest.fixture
+def val_set_calls(monkeypatch):
+    calls = []
+    original = _StaticImpl.val_set
+
+    def counting(rns_ins, key, value):
+        calls.append(key)
+        original(rns_ins, key, value)
+
+    monkeypatch.setattr(_StaticImpl, "val_set", staticmethod(counting))
+    return calls
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        ["app.name", "app.version", "db.host", "db.port"],
+        ["s[].#.host", "s[].#.host", "s[].0.port", "s[].1", "x"],
+        ["a.b", "a", "c[].#", "c[].0"],
+        ["a\\.b.c", "d-e.f", "d-e.g"],
+        [],
+    ],
+)
+def test_matches_val_set_path(keys):
+    build = chain_builder(keys)
+    for i in range(3):
+        values = [{"v": i}, [i], i, "s", None][: len(keys)]
+        expected = slow_build(keys, values)
+        result = build(values)
+        assert result == expected
+        assert result._.to_dict() == expected._.to_dict()
+    first = build(["x"] * len(keys))
+    assert build(["x"] * len(keys)) is not first
+
+
+def test_skeleton_replaces_val_set(val_set_calls):
+    build = chain_builder(["a.b", "a.c", "l[].#"])
+    build([1, 2, 3])
+    build([1, 2, 3])
+    del val_set_calls[:]
+    result = build([4, 5, 6])
+    assert val_set_calls == []
+    assert result._.to_dict() == {"a": {"b": 4, "c": 5}, "l": [6]}
+
+
+def test_different_keys_fall_back(val_set_calls):
+    @rns.rns(use_chain_key=True)
+    def build(keys):
+        return [KV_Pair(k, 1) for k in keys]
+
+    for _ in range(3):
+        build(["a.b"])
+    del val_set_calls[:]
+    assert build(["a.c"])._.to_dict() == {"a": {"c": 1}}
+    assert val_set_calls == ["a.c", "c"]
+
+
+def test_value_dependent_keys_are_not_compiled():
+    build = chain_builder(["a", "a.b"])
+    for _ in range(3):
+        assert build([RNS({"x": 1}), 2]).a._.to_dict() == {"x": 1, "b": 2}
+    build = chain_builder(["l", "l[].#"])
+    for _ in range(3):
+        assert build([[0], 1]).l == [0, 1]
+
+
+def test_errors_and_warnings_repeat():
+    build = chain_builder(["a[].0"])
+    for _ in range(3):
+        with pytest.raises(IndexError):
+            build([1])
+    build = chain_builder(["to_dict"])
+    for _ in range(3):
+        with pytest.warns(FutureWarning, match="shadows"):
+            assert build([1])["to_dict"] == 1
+
+
+def test_options_are_kept():
+    keys = ["a-b.c", "t"]
+    build = chain_builder(
+        keys, accepted_iter_types=[frozenset], use_raw_key=True
+    )
+    for _ in range(3):
+        result = build([1, (2,)])
+    assert result == slow_build(keys, [1, (2,)], [frozenset], True)
+    assert result["a-b"]._use__raw_key_
@@ -0,0 +1,139 @@
+"""Tests for track_changes() / changes() / checkpoint()."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+
+import pytest
+
+from recursivenamespace import RNS, ChangeTrackingError
+
+
+class TestTrackChanges:
+    def test_disabled_by_default(self):
+        cfg = RNS({"a": 1})
+        with pytest.raises(ChangeTrackingError, match="not enabled"):
+            cfg._.changes()
+
+    def test_setitem_and_val_set(self):
+        cfg = RNS({"a": 1, "db": {"pool": {"size": 5}}})
+        cfg._.track_changes()
+        cfg["a"] = 2
+        cfg._.val_set("db.pool.size", 10)
+        assert cfg._.changes() == ["a", "db.pool.size"]
+
+    def test_nested_node_writes_report_full_path(self):
+        cfg = RNS({"db": {"pool": {"size": 5}}})
+        cfg._.track_changes()
+        cfg.db.pool["size"] = 6
+        assert cfg._.changes() == ["db.pool.size"]
+
+    def test_auto_vivified_branch_is_one_write(self):
+        cfg = RNS({"a": {}})
+        cfg._.track_changes()
+        cfg._.val_set("x.y", 1)
+        cfg._.val_set("a.b.c", 2)
+        assert cfg._.changes() == ["x", "a.b"]
+
+    def test_update_pop_and_del(self):
+        cfg = RNS({"a": 1, "b": 2, "c": 3})
+        cfg._.track_changes()
+        cfg._.update({"a": 10})
+        cfg._.pop("b")
+        del cfg["c"]
+        assert cfg._.changes() == ["a", "b", "c"]
+
+    def test_array_writes(self):
+        cfg = RNS({"items": [1, 2]})
+        cfg._.track_changes()
+        cfg._.val_set("items[].#", 3)
+        cfg._.val_set("items[].0", 0)
+        cfg._.val_set("items[].-1", 4)
+        assert cfg._.changes() == ["items[].2", "items[].0"]
+
+    def test_overlay_records_apply_and_restore(self):
+        cfg = RNS({"a": 1})
+        cfg._.track_changes()
+        with cfg._.overlay({"a": 2, "tmp": 3}):
+            pass
+        assert cfg._.changes() == ["a", "tmp"]
+        assert cfg._.to_dict() == {"a": 1}
+
+    def test_paths_are_deduplicated_in_first_write_order(self):
+        cfg = RNS({"a": 1, "b": 2})
+        cfg._.track_changes()
+        cfg["b"] = 3
+        cfg["a"] = 4
+        cfg["b"] = 5
+        assert cfg._.changes() == ["b", "a"]
+
+    def test_checkpoint_resets(self):
+        cfg = RNS({"a": 1})
+        cfg._.track_changes()
+        cfg["a"] = 2
+        assert cfg._.checkpoint() == ["a"]
+        assert cfg._.changes() == []
+        cfg["b"] = 1
+        assert cfg._.changes() == ["b"]
+
+    def test_assigned_subtree_is_observed(self):
+        cfg = RNS({})
+        cfg._.track_changes()
+        cfg["db"] = RNS({"host": "localhost"})
+        cfg._.checkpoint()
+        cfg.db["host"] = "remote"
+        assert cfg._.changes() == ["db.host"]
+
+    def test_detached_subtree_is_not_observed(self):
+        cfg = RNS({"db": {"host": "localhost"}})
+        cfg._.track_changes()
+        db = cfg._.pop("db")
+        cfg._.checkpoint()
+        db["host"] = "remote"
+        assert cfg._.changes() == []
+
+    def test_self_referencing_tree(self):
+        cfg = RNS({"a": {"l": []}})
+        cfg.a["me"] = cfg
+        cfg.a.l.append(cfg.a.l)
+        cfg._.track_changes()
+        cfg.a.me.a["x"] = 1
+        cfg.a["me"] = None
+        assert cfg._.changes() == ["a.x", "a.me"]
+        assert cfg._binding_.path == ""
+        cfg._.track_changes(False)
+        assert cfg._binding_ is None and cfg.a._binding_ is None
+
+    def test_raw_key_with_dot_is_escaped(self):
+        cfg = RNS({"a.b": {"c": 1}}, use_raw_key=True)
+        cfg._.track_changes()
+        cfg["a.b"]["c"] = 2
+        (path,) = cfg._.changes()
+        assert cfg._.val_get(path) == 2
+
+    def test_stop_tracking(self):
+        cfg = RNS({"a": {"b": 1}})
+        cfg._.track_changes()
+        cfg._.track_changes(False)
+        assert cfg._binding_ is None
+        assert cfg.a._binding_ is None
+        with pytest.raises(ChangeTrackingError):
+            cfg._.changes()
+
+    def test_tracking_state_is_not_data(self):
+        cfg = RNS({"a": {"b": 1}})
+        cfg._.track_changes()
+        assert cfg._.to_dict() == {"a": {"b": 1}}
+        assert cfg == RNS({"a": {"b": 1}})
+
+    def test_copies_and_pickles_are_untracked(self):
+        cfg = RNS({"a": {"b": 1}})
+        cfg._.track_changes()
+        for other in (
+            copy.copy(cfg),
+            cfg._.deepcopy(),
+            pickle.loads(pickle.dumps(cfg)),
+        ):
+            other["z"] = 1
+        assert cfg._.changes() == []
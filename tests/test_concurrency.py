@@ -0,0 +1,166 @@
+"""Tests for RWLock and SharedRNS."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from recursivenamespace import RNS, SharedRNS
+from recursivenamespace.concurrency import RWLock
+
+
+def _queue_writer(lock, work):
+    """Start a thread that runs ``work`` under ``lock``'s write lock and
+    return it once the writer is queued."""
+
+    def writer():
+        with lock.write_locked():
+            work()
+
+    t = threading.Thread(target=writer)
+    t.start()
+    while not lock._writers_waiting:
+        time.sleep(0.001)
+    return t
+
+
+class TestRWLock:
+    def test_readers_share(self):
+        lock = RWLock()
+        lock.acquire_read()
+        lock.acquire_read()
+        lock.release_read()
+        lock.release_read()
+
+    def test_writer_excludes_readers(self):
+        lock = RWLock()
+        events = []
+        started = threading.Event()
+        lock.acquire_write()
+
+        def reader():
+            started.set()
+            with lock.read_locked():
+                events.append("read")
+
+        t = threading.Thread(target=reader)
+        t.start()
+        started.wait()
+        assert events == []
+        events.append("write-done")
+        lock.release_write()
+        t.join()
+        assert events == ["write-done", "read"]
+
+    def test_write_is_reentrant_for_owner(self):
+        lock = RWLock()
+        with lock.write_locked(), lock.write_locked(), lock.read_locked():
+            pass
+
+    def test_read_is_reentrant_while_writer_waits(self):
+        lock = RWLock()
+        order = []
+        with lock.read_locked():
+            t = _queue_writer(lock, lambda: order.append("write"))
+            with lock.read_locked():
+                order.append("read")
+        t.join()
+        assert order == ["read", "write"]
+
+    def test_reader_cannot_upgrade(self):
+        lock = RWLock()
+        with lock.read_locked(), pytest.raises(RuntimeError, match="upgrade"):
+            lock.acquire_write()
+        with lock.write_locked():
+            pass
+
+    def test_release_write_by_other_thread_fails(self):
+        lock = RWLock()
+        lock.acquire_write()
+        errors = []
+
+        def intruder():
+            try:
+                lock.release_write()
+            except RuntimeError as e:
+                errors.append(e)
+
+        t = threading.Thread(target=intruder)
+        t.start()
+        t.join()
+        lock.release_write()
+        assert len(errors) == 1
+
+
+class TestSharedRNS:
+    def test_wraps_dict_or_rns(self):
+        assert SharedRNS({"a": 1}).val_get("a") == 1
+        assert SharedRNS(RNS({"a": {"b": 2}})).val_get("a.b") == 2
+
+    def test_accessors(self):
+        shared = SharedRNS({"a": 1})
+        shared.val_set("b.c", 2)
+        shared.update({"d": 3})
+        assert shared.val_get_many(["a", "b.c", "d"]) == [1, 2, 3]
+        assert shared.get_or_else("missing", 0) == 0
+        assert shared.pop("d") == 3
+        assert shared.to_dict() == {"a": 1, "b": {"c": 2}}
+        snap = shared.snapshot()
+        shared.val_set("a", 9)
+        assert snap.a == 1
+
+    def test_calls_inside_read_block_with_writer_waiting(self):
+        shared = SharedRNS({"a": 1})
+        with shared.read() as cfg:
+            t = _queue_writer(shared._lock, lambda: cfg._.val_set("a", 2))
+            assert shared.val_get("a") == 1
+            assert repr(shared) == "SharedRNS(RNS(a=1))"
+            with pytest.raises(RuntimeError, match="upgrade"):
+                shared.val_set("a", 3)
+        t.join()
+        assert shared.val_get("a") == 2
+
+    def test_write_block_with_transaction_rolls_back(self):
+        shared = SharedRNS({"a": 1, "s": "leaf"})
+        raises = pytest.raises(KeyError)
+        with raises, shared.write() as cfg, cfg._.transaction():
+            cfg._.val_set("a", 2)
+            cfg._.val_set("s.x", 3)
+        assert shared.val_get("a") == 1
+
+    def test_readers_never_see_torn_updates(self):
+        shared = SharedRNS({"a": 0, "b": 0, "nested": {"c": 0}})
+        stop = threading.Event()
+        torn = []
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                with shared.write() as cfg:
+                    cfg._.val_set("a", i)
+                    time.sleep(0)  # invite a context switch mid-update
+                    cfg._.val_set("nested.c", i)
+                    cfg._.update({"b": i})
+
+        def reader():
+            while not stop.is_set():
+                a, b, c = shared.val_get_many(["a", "b", "nested.c"])
+                if not a == b == c:
+                    torn.append((a, b, c))
+                with shared.read() as cfg:
+                    if not cfg.a == cfg.b == cfg.nested.c:
+                        torn.append((cfg.a, cfg.b, cfg.nested.c))
+
+        threads = [threading.Thread(target=writer) for _ in range(2)]
+        threads += [threading.Thread(target=reader) for _ in range(8)]
+        for t in threads:
+            t.start()
+        time.sleep(0.5)
+        stop.set()
+        for t in threads:
+            t.join()
+        assert torn == []
+        assert shared.val_get("a") > 0
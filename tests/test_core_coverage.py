@@ -477,10 +477,15 @@ class TestSerializationErrors:
         toml_str = ns.to_toml()
         assert "b = 1" in toml_str
 
-    def test_to_toml_complex_array(self):
+    def test_to_toml_array_of_tables(self):
         ns = RNS({"a": [{"nested": 1}]})
         toml_str = ns.to_toml()
-        assert "complex array" in toml_str
+        assert "[[a]]\nnested = 1" in toml_str
+
+    def test_to_toml_none_in_array(self):
+        ns = RNS({"a": [1, None]})
+        toml_str = ns.to_toml()
+        assert "not supported" in toml_str
 
     def test_to_toml_unsupported_type(self):
         ns = RNS({})
@@ -0,0 +1,165 @@
+"""Tests for RNS.from_dataclass and dataclass returns from @rns.rns."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import datetime
+import enum
+import gc
+import logging
+import weakref
+from typing import List, NamedTuple
+
+import pytest
+
+from recursivenamespace import RNS, rns
+from recursivenamespace.main import _FIELD_PLANS_, recursivenamespace
+
+
+@dataclasses.dataclass
+class Pool:
+    size: int
+    tags: List[str] = dataclasses.field(default_factory=list)
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Spot(NamedTuple):
+    pool: Pool
+    label: str
+
+
+@dataclasses.dataclass
+class App:
+    name: str
+    pool: Pool
+    pools: list
+    replicas: tuple
+    extra: dict
+    node: RNS
+    spots: List[Spot]
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+class Plain:
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+class Slotted:
+    __slots__ = ("v",)
+
+    def __init__(self, v):
+        self.v = v
+
+
+def make_app() -> App:
+    return App(
+        name="svc",
+        pool=Pool(1, ["a"]),
+        pools=[Pool(2), [Pool(3)]],
+        replicas=(Pool(4),),
+        extra={"k-y": {"z": Pool(5)}},
+        node=RNS({"q": 1}),
+        spots=[Spot(Pool(6), "s")],
+    )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [(), ([collections.deque],), ([collections.deque], True)],
+)
+def test_matches_asdict(options):
+    app = make_app()
+    expected = RNS(dataclasses.asdict(app), *options)
+    assert RNS.from_dataclass(app, *options) == expected
+
+
+def test_nodes_keys_and_shared_values():
+    app = make_app()
+    cfg = RNS.from_dataclass(app)
+    assert type(cfg) is recursivenamespace
+    assert cfg.pool._key_ == "pool" and cfg.pools[0]._key_ == ""
+    assert cfg.node is app.node and cfg.node._key_ == "node"
+    assert cfg.pool.tags == ["a"] and cfg.pool.tags is not app.pool.tags
+    assert cfg._.val_get("extra.k_y.z.size") == 5
+    assert cfg.spots == [Spot({"size": 6, "tags": []}, "s")]
+    assert type(cfg.spots[0]) is Spot
+
+
+def test_nested_objects_stay_values():
+    stamp = datetime.datetime(2024, 1, 1)
+    inner = Plain(v=1)
+    inner.self = inner
+    logger = logging.getLogger("rns.test")
+
+    @dataclasses.dataclass
+    class Holder:
+        point: Point
+        inner: Plain
+        logger: logging.Logger
+        color: Color
+        stamp: datetime.datetime
+
+    holder = Holder(Point(1, 2), inner, logger, Color.RED, stamp)
+    cfg = RNS.from_dataclass(holder)
+    assert cfg.point == Point(1, 2) and type(cfg.point) is Point
+    assert cfg.inner is inner and cfg.logger is logger
+    assert cfg.color is Color.RED and cfg.stamp is stamp
+
+
+def test_namedtuple_and_plain_object_roots():
+    assert RNS.from_dataclass(Point(3, 4))._.to_dict() == {"x": 3, "y": 4}
+    cfg = RNS.from_dataclass(Plain(**{"a.b": 1}, pool=Pool(1), p=Plain()))
+    assert cfg.a_b == 1 and cfg.pool.size == 1
+    assert type(cfg.p) is Plain
+
+
+def test_plan_cached_per_class():
+    RNS.from_dataclass(Pool(1))
+    plan = _FIELD_PLANS_[Pool]
+    RNS.from_dataclass(Pool(2))
+    assert _FIELD_PLANS_[Pool] is plan
+
+
+def test_plan_does_not_keep_class_alive():
+    Temp = dataclasses.make_dataclass("Temp", ["a"])
+    assert RNS.from_dataclass(Temp(1)).a == 1
+    ref = weakref.ref(Temp)
+    del Temp
+    gc.collect()
+    assert ref() is None
+
+
+def test_invalid_objects_and_keys():
+    for obj in (1, "s", Pool, Slotted(1), len, Color.RED):
+        with pytest.raises(TypeError, match="from_dataclass"):
+            RNS.from_dataclass(obj)
+    with pytest.raises(KeyError, match="protected"):
+        RNS.from_dataclass(Plain(_key_=1))
+    with pytest.warns(FutureWarning, match="shadows"):
+        assert RNS.from_dataclass(Plain(to_dict=1))["to_dict"] == 1
+
+
+def test_decorator_uses_direct_ingestion():
+    @rns.rns(accepted_iter_types=[collections.deque], use_raw_key=True)
+    def create():
+        return make_app()
+
+    app = make_app()
+    result = create()
+    assert result == RNS(dataclasses.asdict(app), [collections.deque], True)
+    assert type(result.spots[0]) is Spot
+
+    @rns.rns(use_chain_key=True)
+    def chained():
+        return Pool(1)
+
+    assert chained().size == 1
@@ -0,0 +1,76 @@
+"""Tests for RNS.from_env."""
+
+from __future__ import annotations
+
+import pytest
+
+from recursivenamespace import RNS
+
+ENVIRON = {
+    "APP__DB__POOL__SIZE": "10",
+    "APP__DB__HOST": "db.local",
+    "APP__DEBUG": "True",
+    "APP__RATE": "0.5",
+    "APP__ZIP": "01234",
+    "APP__SERVERS[]__1__HOST": "b",
+    "APP__SERVERS[]__0__HOST": "a",
+    "APP__TAGS[]__0": "x",
+    "APP__LOG-LEVEL": "info",
+    "OTHER__DB__HOST": "ignored",
+}
+
+
+def test_nesting_arrays_and_coercion():
+    cfg = RNS.from_env(environ=ENVIRON)
+    assert cfg._.to_dict() == {
+        "db": {"pool": {"size": 10}, "host": "db.local"},
+        "debug": True,
+        "rate": 0.5,
+        "zip": "01234",
+        "servers": [{"host": "a"}, {"host": "b"}],
+        "tags": ["x"],
+        "log_level": "info",
+    }
+    assert isinstance(cfg.servers[1], RNS)
+    assert cfg._.val_get("db.pool.size") == 10
+
+
+def test_key_options():
+    cfg = RNS.from_env("APP__", coerce=False, environ=ENVIRON, use_raw_key=True)
+    assert cfg["log-level"] == "info"
+    assert cfg._.val_get("db.pool.size") == "10"
+    cased = RNS.from_env("OTHER__", environ=ENVIRON, lowercase=False)
+    assert cased._.to_dict() == {"DB": {"HOST": "ignored"}}
+
+
+def test_reads_os_environ(monkeypatch):
+    monkeypatch.setenv("RNSTEST__A__B", "-3")
+    monkeypatch.setenv("RNSTEST__A__C", "1e3")
+    cfg = RNS.from_env("RNSTEST__")
+    assert cfg._.to_dict() == {"a": {"b": -3, "c": 1000.0}}
+    assert RNS.from_env("RNSTEST_MISSING__")._.to_dict() == {}
+
+
+def test_variable_equal_to_prefix_is_skipped():
+    cfg = RNS.from_env(environ={"APP__": "x", "APP__A": "1"})
+    assert cfg._.to_dict() == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    "environ",
+    [
+        {"APP__A": "1", "APP__A__B": "2"},
+        {"APP__A__B": "2", "APP__A": "1"},
+        {"APP__A[]__0": "1", "APP__A__B": "2"},
+        {"APP__A[]": "1"},
+        {"APP__A[]__X": "1"},
+        {"APP__A____B": "1"},
+        {"APP__L[]__0": "a", "APP__L[]__2": "b"},
+        {"APP__X__L[]__1__Y": "a"},
+        {"APP___": "1"},
+        {"APP__A___KEY_": "1"},
+    ],
+)
+def test_invalid_variables(environ):
+    with pytest.raises(ValueError, match="APP__"):
+        RNS.from_env(environ=environ)
@@ -0,0 +1,147 @@
+"""Tests for history() undo/redo."""
+
+from __future__ import annotations
+
+import pytest
+
+from recursivenamespace import RNS
+
+
+class TestHistory:
+    def test_undo_redo_setitem(self):
+        cfg = RNS({"a": 1})
+        h = cfg._.history()
+        cfg["a"] = 2
+        assert h.undo() is True
+        assert cfg.a == 1
+        assert h.redo() is True
+        assert cfg.a == 2
+
+    def test_undo_insert_removes_key(self):
+        cfg = RNS({})
+        h = cfg._.history()
+        cfg["new"] = 1
+        h.undo()
+        assert "new" not in cfg
+
+    def test_undo_pop_and_del_restore(self):
+        cfg = RNS({"a": 1, "b": {"c": 2}})
+        h = cfg._.history()
+        cfg._.pop("a")
+        del cfg["b"]
+        h.undo()
+        h.undo()
+        assert cfg._.to_dict() == {"a": 1, "b": {"c": 2}}
+
+    def test_chain_key_auto_vivify_is_one_step(self):
+        cfg = RNS({})
+        h = cfg._.history()
+        cfg._.val_set("x.y.z", 1)
+        h.undo()
+        assert cfg._.to_dict() == {}
+        assert not h.can_undo
+        h.redo()
+        assert cfg._.to_dict() == {"x": {"y": {"z": 1}}}
+        assert cfg.x.y._binding_.path == "x.y"
+
+    def test_batch_is_one_step(self):
+        cfg = RNS({})
+        h = cfg._.history()
+        with cfg._.batch():
+            cfg._.val_set("x.y", 1)
+            cfg._.val_set("x.z", 2)
+        h.undo()
+        assert cfg._.to_dict() == {}
+        assert not h.can_undo
+        h.redo()
+        assert cfg._.to_dict() == {"x": {"y": 1, "z": 2}}
+
+    def test_update_is_one_step(self):
+        cfg = RNS({"a": 1, "b": 2})
+        h = cfg._.history()
+        cfg._.update({"a": 10, "b": 20, "c": 30})
+        h.undo()
+        assert cfg._.to_dict() == {"a": 1, "b": 2}
+
+    def test_array_append_and_set(self):
+        cfg = RNS({"items": [1, 2]})
+        h = cfg._.history()
+        cfg._.val_set("items[].#", 3)
+        cfg._.val_set("items[].0", 0)
+        h.undo()
+        assert cfg["items"] == [1, 2, 3]
+        h.undo()
+        assert cfg["items"] == [1, 2]
+        h.redo()
+        h.redo()
+        assert cfg["items"] == [0, 2, 3]
+
+    def test_nested_write_then_parent_replace(self):
+        cfg = RNS({"db": {"host": "a"}})
+        h = cfg._.history()
+        cfg.db["host"] = "b"
+        cfg["db"] = RNS({"host": "c"})
+        h.undo()
+        assert cfg.db.host == "b"
+        h.undo()
+        assert cfg.db.host == "a"
+        # The restored subtree is observed again.
+        cfg.db["host"] = "d"
+        h.undo()
+        assert cfg.db.host == "a"
+
+    def test_new_write_clears_redo(self):
+        cfg = RNS({"a": 1})
+        h = cfg._.history()
+        cfg["a"] = 2
+        h.undo()
+        cfg["a"] = 3
+        assert not h.can_redo
+        assert h.redo() is False
+
+    def test_max_depth_bounds_steps(self):
+        cfg = RNS({"a": 0})
+        h = cfg._.history(max_depth=3)
+        for i in range(1, 10):
+            cfg["a"] = i
+        assert h.undo() and h.undo() and h.undo()
+        assert h.undo() is False
+        assert cfg.a == 6
+
+    def test_history_is_shared_and_resizable(self):
+        cfg = RNS({"a": 0})
+        h = cfg._.history(max_depth=5)
+        assert cfg._.history(max_depth=2) is h
+        assert h.max_depth == 2
+        with pytest.raises(ValueError):
+            h.max_depth = 0
+
+    def test_undo_notifies_journal_and_subscribers(self):
+        cfg = RNS({"a": 1})
+        h = cfg._.history()
+        cfg["a"] = 2
+        cfg._.track_changes()
+        seen = []
+        cfg._.subscribe("a", lambda ms: seen.append([m.new for m in ms]))
+        h.undo()
+        assert cfg._.changes() == ["a"]
+        assert seen == [[1]]
+
+    def test_close_stops_recording(self):
+        cfg = RNS({"a": {"b": 1}})
+        h = cfg._.history()
+        h.close()
+        assert cfg._binding_ is None
+        cfg["a"] = 2
+        assert h.undo() is False
+
+    def test_self_referencing_tree(self):
+        cfg = RNS({"a": {}})
+        cfg.a["me"] = cfg
+        h = cfg._.history()
+        cfg.a["me"] = None
+        cfg.a["x"] = 1
+        assert h.undo() and h.undo()
+        assert cfg.a.me is cfg and "x" not in cfg.a
+        cfg.a.me["b"] = 2
+        assert h.undo() and "b" not in cfg
@@ -0,0 +1,84 @@
+"""Tests for iter_jsonl / write_jsonl."""
+
+from __future__ import annotations
+
+import io
+import logging
+import types
+
+import pytest
+
+from recursivenamespace import RNS, SerializationError
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "out" / "events.jsonl"
+    records = [RNS({"seq": i, "user": {"id": i}}) for i in range(5)]
+    assert RNS.write_jsonl(records, path, batch_size=2) == 5
+    assert path.read_text().count("\n") == 5
+    assert list(RNS.iter_jsonl(path)) == records
+
+
+def test_write_accepts_dicts_and_file_objects():
+    buf = io.StringIO()
+    RNS.write_jsonl([{"a": 1}, RNS({"b": [1, 2]})], buf)
+    assert buf.getvalue() == '{"a":1}\n{"b":[1,2]}\n'
+
+
+def test_write_is_batched():
+    writes = []
+    target = types.SimpleNamespace(write=writes.append)
+    RNS.write_jsonl(({"i": i} for i in range(5)), target, batch_size=2)
+    assert len(writes) == 3
+
+
+def test_write_unserializable_record():
+    with pytest.raises(SerializationError, match="record 1"):
+        RNS.write_jsonl([{"a": 1}, {"b": object()}], io.StringIO())
+
+
+def test_iter_is_lazy():
+    lines = iter(['{"a": 1}\n', "not json\n"])
+    records = RNS.iter_jsonl(lines)
+    assert next(records) == RNS({"a": 1})
+    with pytest.raises(SerializationError, match="line 2"):
+        next(records)
+
+
+def test_iter_binary_and_blank_lines():
+    data = b'{"a": 1}\n\n  \n{"b": "\xc3\xa9"}\n'
+    assert list(RNS.iter_jsonl(io.BytesIO(data))) == [
+        RNS({"a": 1}),
+        RNS({"b": "é"}),
+    ]
+
+
+def test_skip_errors_logs_and_continues(caplog):
+    text = '{"a": 1}\n{broken\n[1, 2]\n{"b": 2}\n'
+    with caplog.at_level(logging.WARNING):
+        records = list(RNS.iter_jsonl(io.StringIO(text), skip_errors=True))
+    assert records == [RNS({"a": 1}), RNS({"b": 2})]
+    assert "line 2" in caplog.text and "line 3" in caplog.text
+
+
+def test_select_projects_each_record():
+    text = '{"user": {"id": 1, "name": "a"}, "x": 1}\n{"x": 2}\n'
+    records = list(RNS.iter_jsonl(io.StringIO(text), select=["user.id"]))
+    assert [r._.to_dict() for r in records] == [{"user": {"id": 1}}, {}]
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError):
+        RNS.write_jsonl([], io.StringIO(), batch_size=0)
+
+
+def test_records_that_cannot_be_built(caplog):
+    text = '{"a": 1}\n{"_key_": 1}\n{"b": {"_": 2}}\n{"c": 3}\n'
+    with pytest.raises(SerializationError, match="line 2"):
+        list(RNS.iter_jsonl(io.StringIO(text)))
+    with caplog.at_level(logging.WARNING):
+        records = list(RNS.iter_jsonl(io.StringIO(text), skip_errors=True))
+    assert records == [RNS({"a": 1}), RNS({"c": 3})]
+    assert "line 2" in caplog.text and "line 3" in caplog.text
+    records = RNS.iter_jsonl(io.StringIO(text), True, select=["b"])
+    assert len(list(records)) == 3
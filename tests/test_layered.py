@@ -0,0 +1,108 @@
+"""Tests for RNS.layered / LayeredRNS."""
+
+from __future__ import annotations
+
+import pytest
+
+from recursivenamespace import RNS, LayeredRNS
+
+
+def make_layers():
+    defaults = RNS(
+        {
+            "db": {"host": "localhost", "port": 5432, "opts": {"ssl": False}},
+            "servers": [{"name": "a"}],
+            "name": "app",
+        }
+    )
+    site = RNS({"db": {"host": "db.site", "opts": {"timeout": 3}}})
+    env = RNS({"db": {"port": 6432}})
+    cli = RNS({"name": "cli"})
+    return defaults, site, env, cli
+
+
+def test_merge_order_and_lookups():
+    layers = make_layers()
+    stack = RNS.layered(list(layers))
+    assert isinstance(stack, LayeredRNS)
+    assert stack.to_dict() == {
+        "db": {
+            "host": "db.site",
+            "port": 6432,
+            "opts": {"ssl": False, "timeout": 3},
+        },
+        "servers": [{"name": "a"}],
+        "name": "cli",
+    }
+    assert stack.val_get("db.port") == 6432
+    assert stack.val_get("servers[].0.name") == "a"
+    assert stack.get_or_else("db.missing", 1) == 1
+    # The merge never shares containers with a layer.
+    assert stack.merged.servers is not layers[0].servers
+    with pytest.raises(AttributeError, match="frozen"):
+        stack.merged.db.host = "x"
+
+
+def test_layer_write_remerges_only_that_path():
+    defaults, site, env, cli = make_layers()
+    stack = RNS.layered([defaults, site, env, cli])
+    db, opts = stack.merged.db, stack.merged.db.opts
+    assert stack.val_get("db.port") == 6432
+    assert stack.val_get("db.opts") is opts
+
+    env._.val_set("db.port", 7000)
+    assert stack.val_get("db.port") == 7000
+    assert stack.merged.db is db and stack.val_get("db.opts") is opts
+
+    defaults._.val_set("db.opts.retries", 2)
+    assert stack.val_get("db.opts.retries") == 2
+    assert stack.merged.db.opts is opts
+
+    env._.pop("db")
+    assert stack.val_get("db.port") == 5432
+    defaults._.val_set("servers[].0.name", "b")
+    assert stack.val_get("servers[].0.name") == "b"
+
+
+def test_scalar_masks_lower_nodes():
+    defaults, site, env, cli = make_layers()
+    stack = RNS.layered([defaults, site, env, cli])
+    site["db"] = "sqlite:///x.db"
+    # env still defines db.port as a node, which wins over site.
+    assert stack.to_dict()["db"] == {"port": 6432}
+    env._.pop("db")
+    assert stack.val_get("db") == "sqlite:///x.db"
+    defaults._.val_set("db.host", "other")
+    assert stack.val_get("db") == "sqlite:///x.db"
+
+
+def test_update_layer_and_close():
+    defaults = make_layers()[0]
+    with RNS.layered([defaults, {"name": "site"}]) as stack:
+        assert stack.val_get("name") == "site"
+        assert stack.update_layer(1, {"name": "new", "extra": 1}) == [
+            "name",
+            "extra",
+        ]
+        assert stack.val_get("name") == "new"
+        assert stack.layers[1].extra == 1
+    defaults._.val_set("db.host", "after-close")
+    assert stack.val_get("db.host") == "localhost"
+
+
+def test_nested_and_frozen_layers(tmp_path):
+    path = tmp_path / "site.json"
+    path.write_text('{"db": {"host": "file"}}')
+    frozen = RNS.load_json(path, frozen=True)
+    tree = RNS({"profiles": {"dev": {"db": {"port": 1}}}})
+    stack = RNS.layered([frozen, tree.profiles.dev])
+    assert stack.to_dict() == {"db": {"host": "file", "port": 1}}
+    tree._.val_set("profiles.dev.db.port", 2)
+    tree._.val_set("other", 3)
+    assert stack.val_get("db.port") == 2
+    assert "other" not in stack.merged
+
+
+def test_requires_a_layer():
+    with pytest.raises(ValueError):
+        RNS.layered([])
@@ -0,0 +1,147 @@
+"""Tests for the stat-keyed loader cache and frozen trees."""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import pickle
+
+import pytest
+
+from recursivenamespace import RNS, LoaderCache, load_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    load_cache.clear()
+    yield
+    load_cache.clear()
+    load_cache.maxsize = 128
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data))
+    # Make the change visible even on coarse mtime filesystems.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_hit_returns_independent_copy(tmp_path):
+    path = tmp_path / "cfg.json"
+    write_json(path, {"db": {"hosts": ["a"]}})
+    first = RNS.load_json(path, cached=True)
+    second = RNS.load_json(path, cached=True)
+    assert first == second and first is not second
+    first.db.hosts.append("b")
+    first.db.port = 1
+    assert RNS.load_json(path, cached=True).to_dict() == {
+        "db": {"hosts": ["a"]}
+    }
+    assert load_cache.cache_info()[:2] == (2, 1)
+
+
+def test_change_on_disk_is_reloaded(tmp_path):
+    path = tmp_path / "cfg.json"
+    write_json(path, {"v": 1})
+    assert RNS.load_json(path, cached=True).v == 1
+    write_json(path, {"v": 2})
+    assert RNS.load_json(path, cached=True).v == 2
+    assert load_cache.cache_info().misses == 2
+    assert load_cache.cache_info().currsize == 1
+
+
+def test_variants_are_cached_separately(tmp_path):
+    path = tmp_path / "cfg.json"
+    write_json(path, {"a-b": 1, "c": 2})
+    assert "a_b" in RNS.load_json(path, cached=True)
+    assert "a-b" in RNS.load_json(path, cached=True, use_raw_key=True)
+    selected = RNS.load_json(path, cached=True, select=["c"])
+    assert selected.to_dict() == {"c": 2}
+    assert load_cache.cache_info().misses == 3
+
+
+def test_toml(tmp_path):
+    path = tmp_path / "cfg.toml"
+    path.write_text('[app]\nname = "x"\n')
+    assert RNS.load_toml(path, cached=True).app.name == "x"
+    assert RNS.load_toml(path, cached=True).app.name == "x"
+    assert load_cache.cache_info().hits == 1
+
+
+def test_frozen_is_shared_and_read_only(tmp_path):
+    path = tmp_path / "cfg.json"
+    write_json(path, {"db": {"host": "a"}, "servers": [{"k": 1}]})
+    frozen = RNS.load_json(path, cached=True, frozen=True)
+    assert RNS.load_json(path, cached=True, frozen=True) is frozen
+    for write in (
+        lambda: setattr(frozen.db, "host", "b"),
+        lambda: frozen._.val_set("servers[].0.k", 2),
+        lambda: frozen._.pop("db"),
+        lambda: frozen._.update({"x": 1}),
+    ):
+        with pytest.raises(AttributeError, match="frozen"):
+            write()
+    assert frozen.db.host == "a" and frozen.servers[0].k == 1
+
+
+def test_lists_in_frozen_hits_are_read_only(tmp_path):
+    path = tmp_path / "cfg.json"
+    write_json(path, {"l": [1, {"tags": ["a"]}]})
+    frozen = RNS.load_json(path, cached=True, frozen=True)
+    for write in (
+        lambda: frozen._.val_set("l[].0", 9),
+        lambda: frozen._.val_set("l[].#", 9),
+        lambda: frozen.l.append(9),
+        lambda: frozen.l.__setitem__(0, 9),
+        lambda: frozen.l[1].tags.extend("b"),
+    ):
+        with pytest.raises(AttributeError, match="frozen"):
+            write()
+    assert frozen.l == [1, frozen.l[1]] and isinstance(frozen.l, list)
+    again = RNS.load_json(path, cached=True)
+    assert again.to_dict() == {"l": [1, {"tags": ["a"]}]}
+    again.l.append(2)
+    again.l[1].tags.append("b")
+    assert RNS.load_json(path, cached=True, frozen=True).to_dict() == {
+        "l": [1, {"tags": ["a"]}]
+    }
+
+
+def test_frozen_copies_and_pickles_are_mutable(tmp_path):
+    path = tmp_path / "cfg.json"
+    write_json(path, {"db": {"host": "a", "hosts": ["a"]}})
+    frozen = RNS.load_json(path, frozen=True)
+    for thawed in (copy.deepcopy(frozen), pickle.loads(pickle.dumps(frozen))):
+        assert type(thawed) is RNS and type(thawed.db) is RNS
+        thawed.db.host = "b"
+        thawed.db.hosts.append("b")
+    assert frozen.db.host == "a"
+    with frozen._.scoped_overlay({"db.host": "c"}):
+        assert frozen.db.host == "c"
+
+
+def test_invalidate_lru_and_missing_file(tmp_path):
+    paths = [tmp_path / f"{i}.json" for i in range(3)]
+    for path in paths:
+        write_json(path, {"v": 1})
+    load_cache.maxsize = 2
+    for path in paths:
+        RNS.load_json(path, cached=True)
+    assert load_cache.cache_info().currsize == 2
+    assert load_cache.invalidate(paths[0]) == 0
+    assert load_cache.invalidate(paths[2]) == 1
+    paths[1].unlink()
+    with pytest.raises(FileNotFoundError):
+        RNS.load_json(paths[1], cached=True)
+    assert load_cache.cache_info().currsize == 0
+
+
+def test_loader_cache_bounds():
+    with pytest.raises(ValueError):
+        LoaderCache(maxsize=-1)
+    cache = LoaderCache(maxsize=0)
+    calls = []
+    for _ in range(2):
+        cache.get(__file__, "v", lambda: calls.append(1))
+    assert len(calls) == 2 and cache.cache_info().currsize == 0
@@ -0,0 +1,104 @@
+"""Tests for result memoization in the @rns.rns() decorator."""
+
+from __future__ import annotations
+
+import pytest
+
+from recursivenamespace import RNS, MemoCache, rns
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hits_share_a_frozen_tree():
+    calls = []
+
+    @rns.rns(cache=8)
+    def settings(env, debug=False):
+        calls.append(env)
+        return {"env": env, "db": {"hosts": ["a"]}, "debug": debug}
+
+    first = settings("prod")
+    assert settings("prod") is first
+    assert settings("prod", debug=True) is not first
+    assert calls == ["prod", "prod"]
+    assert settings.cache_info() == (1, 2, 8, 2)
+    with pytest.raises(AttributeError, match="frozen"):
+        first.db.port = 1
+    assert first._.deepcopy().db._.to_dict() == {"hosts": ["a"]}
+    settings.cache_clear()
+    assert settings.cache_info() == (0, 0, 8, 0)
+
+
+def test_lists_in_a_hit_cannot_be_changed():
+    @rns.rns(cache=4)
+    def cfg(n):
+        return {"hosts": ["a", "b"], "ids": (1, [2])}
+
+    hit = cfg(1)
+    for write in (
+        lambda: hit.hosts.append("EVIL"),
+        lambda: hit._.val_set("hosts[].0", "X"),
+        lambda: hit.ids[1].append(3),
+    ):
+        with pytest.raises(AttributeError, match="frozen"):
+            write()
+    assert cfg(1).hosts == ["a", "b"] and cfg(1).ids == (1, [2])
+
+
+def test_copies_when_not_frozen():
+    @rns.rns(cache=2, freeze=False, accepted_iter_types=[tuple])
+    def settings(env):
+        return {"env": env, "db": {"hosts": ["a"]}, "pair": (1, 2)}
+
+    first = settings("dev")
+    first.db.hosts.append("b")
+    first.env = "changed"
+    second = settings("dev")
+    assert second._.to_dict() == {
+        "env": "dev",
+        "db": {"hosts": ["a"]},
+        "pair": (1, 2),
+    }
+    assert type(second) is RNS
+    assert settings.cache_info().hits == 1
+
+
+def test_lru_eviction_and_unhashable_arguments():
+    calls = []
+
+    @rns.rns(cache=2)
+    def item(key):
+        calls.append(key)
+        return {"key": str(key)}
+
+    item(1), item(2), item(1), item(3), item(2)
+    assert calls == [1, 2, 3, 2]
+    assert item(["x"]).key == "['x']"
+    assert item.cache_info() == (1, 4, 2, 2)
+
+
+def test_ttl_expiry():
+    clock = Clock()
+    memo = MemoCache(4, ttl=10, clock=clock)
+    assert memo.get("k", lambda: 1) == 1
+    clock.now = 9.5
+    assert memo.get("k", lambda: 2) == 1
+    clock.now = 10.5
+    assert memo.get("k", lambda: 3) == 3
+    assert memo.cache_info() == (1, 2, 4, 1)
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError, match="cache"):
+        rns.rns(cache=0)
+    with pytest.raises(ValueError, match="ttl"):
+        rns.rns(ttl=5)
+    with pytest.raises(ValueError, match="ttl"):
+        MemoCache(ttl=0)
+    assert not hasattr(rns.rns()(dict), "cache_info")
@@ -0,0 +1,242 @@
+"""Tests for plan-cached as_schema / as_schema_many."""
+
+from __future__ import annotations
+
+import dataclasses
+import pickle
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from recursivenamespace import RNS, SchemaError, SchemaValidator, schema
+
+
+@dataclasses.dataclass
+class Pool:
+    size: int
+    timeout: float = 1.0
+
+
+@dataclasses.dataclass
+class Server:
+    host: str
+    pool: Optional[Pool] = None
+
+
+@dataclasses.dataclass
+class App:
+    name: str
+    primary: Server
+    servers: List[Server]
+    replicas: Tuple[Server, ...]
+    pools: Dict[str, Pool]
+    extra: dict
+    debug: bool = False
+    computed: int = dataclasses.field(init=False, default=0)
+
+
+@dataclasses.dataclass
+class Tree:
+    label: str
+    children: List["Tree"] = dataclasses.field(default_factory=list)
+
+
+def test_nested_conversion():
+    data = RNS(
+        {
+            "name": "svc",
+            "primary": {"host": "p", "pool": {"size": 4}},
+            "servers": [{"host": "a"}, {"host": "b", "pool": None}],
+            "replicas": ({"host": "r"},),
+            "pools": {"main": {"size": 2, "timeout": 0.5}},
+            "extra": {"nested": {"k": 1}},
+            "computed": 99,
+        }
+    )
+    app = data._.as_schema(App)
+    assert app == App(
+        name="svc",
+        primary=Server("p", Pool(4)),
+        servers=[Server("a"), Server("b")],
+        replicas=(Server("r"),),
+        pools={"main": Pool(2, 0.5)},
+        extra={"nested": {"k": 1}},
+    )
+    assert app.computed == 0
+
+
+def test_missing_fields_use_kwargs_then_defaults():
+    assert RNS({"host": "h"})._.as_schema(Server) == Server("h")
+    assert RNS({})._.as_schema(Server, host="kw") == Server("kw")
+    assert RNS({"host": "h"})._.as_schema(Server, host="kw").host == "h"
+    with pytest.raises(TypeError):
+        RNS({})._.as_schema(Server)
+
+
+def test_recursive_dataclass_and_plan_cache():
+    data = RNS({"label": "root", "children": [{"label": "leaf"}]})
+    tree = data._.as_schema(Tree)
+    assert tree.children == [Tree("leaf")]
+    plan = schema.plan_for(Tree)
+    assert schema.plan_for(Tree) is plan
+    assert [name for name, _ in plan.fields] == ["label", "children"]
+
+
+def test_as_schema_many():
+    nodes = [RNS({"host": f"h{i}", "pool": {"size": i}}) for i in range(3)]
+    servers = RNS.as_schema_many(nodes, Server)
+    assert servers == [Server(f"h{i}", Pool(i)) for i in range(3)]
+    assert RNS.as_schema_many([RNS({})], Pool, size=1) == [Pool(1)]
+
+
+def test_invalid_arguments():
+    with pytest.raises(TypeError, match="DataClass"):
+        RNS.as_schema_many([], dict)
+    with pytest.raises(TypeError, match="mapping"):
+        schema.to_dataclass(1, Pool)
+
+
+@dataclasses.dataclass
+class WithInitVar:
+    name: str
+    scale: dataclasses.InitVar[int] = 1
+    size: int = 1
+
+    def __post_init__(self, scale):
+        self.size *= scale
+
+
+def test_init_var_is_not_bound_positionally():
+    data = RNS({"name": "a", "size": 2, "scale": 10})
+    assert data._.as_schema(WithInitVar).size == 2
+    assert data._.as_schema(WithInitVar, scale=3).size == 6
+
+
+# ── SchemaValidator ──────────────────────────────────────────────
+
+RESPONSE_SPEC = {
+    "id": int,
+    "user": {"name": str, "email?": (str, None)},
+    "tags": [str],
+    "score": float,
+    "active": bool,
+    "meta?": dict,
+}
+
+
+def test_validate_coerces_in_place_and_notifies():
+    data = RNS(
+        {
+            "id": "12",
+            "user": {"name": "ann", "email": None},
+            "tags": ["a", 3],
+            "score": 1,
+            "active": "yes",
+            "meta": {"k": 1},
+        }
+    )
+    seen = []
+    data._.subscribe("", seen.extend)
+    check = RNS.compile_schema(RESPONSE_SPEC)
+    assert isinstance(check, SchemaValidator)
+    assert check(data) is data
+    assert data._.to_dict() == {
+        "id": 12,
+        "user": {"name": "ann", "email": None},
+        "tags": ["a", "3"],
+        "score": 1.0,
+        "active": True,
+        "meta": {"k": 1},
+    }
+    assert sorted(m.path for m in seen) == ["active", "id", "score"]
+
+
+def test_all_errors_in_one_pass():
+    data = {
+        "id": True,
+        "user": {"email": []},
+        "tags": ["ok", None],
+        "score": "fast",
+        "active": 2,
+    }
+    with pytest.raises(SchemaError) as info:
+        RNS.compile_schema(RESPONSE_SPEC).validate(data)
+    assert info.value.errors == {
+        "id": "expected int, got bool",
+        "user.name": "required key missing",
+        "user.email": "expected str, got list",
+        "tags[].1": "expected str, got None",
+        "score": "expected float, got str",
+        "active": "expected bool, got int",
+    }
+    assert RNS.compile_schema({"a": int}).errors([]) == {
+        "": "expected a table, got list"
+    }
+    copy = pickle.loads(pickle.dumps(info.value))
+    assert copy.errors == info.value.errors and str(copy) == str(info.value)
+
+
+def test_without_coercion():
+    check = RNS.compile_schema({"n": int, "x": float}, coerce=False)
+    data = {"n": "1", "x": 2}
+    assert check.errors(data) == {"n": "expected int, got str"}
+    assert data == {"n": "1", "x": 2}
+    assert RNS.compile_schema({"v": (int, str)}).errors({"v": "1"}) == {}
+
+
+def test_int_strings_must_be_plain_digits():
+    check = RNS.compile_schema({"n": int})
+    data = {"n": "-12"}
+    assert check.errors(data) == {} and data == {"n": -12}
+    for text in ("1_000", " 7", "7\n", "+", "\u0661"):
+        data = {"n": text}
+        assert check.errors(data) == {"n": "expected int, got str"}
+        assert data == {"n": text}
+
+
+def test_dataclass_spec():
+    check = RNS.compile_schema(App)
+    data = RNS(
+        {
+            "name": "svc",
+            "primary": {"host": "p", "pool": {"size": "4"}},
+            "servers": [{"host": 1}],
+            "replicas": [],
+            "pools": {"main": {"timeout": 1}},
+            "extra": {},
+        }
+    )
+    assert check.errors(data) == {"pools.main.size": "required key missing"}
+    assert data.primary.pool.size == 4 and data.servers[0].host == "1"
+    assert RNS.compile_schema(Tree).errors(
+        {"label": "a", "children": [{"children": []}]}
+    ) == {"children[].0.label": "required key missing"}
+
+
+def test_invalid_spec():
+    with pytest.raises(TypeError):
+        RNS.compile_schema({"a": [int, str]})
+    with pytest.raises(TypeError):
+        RNS.compile_schema({"a": 1})
+
+
+def test_failed_union_options_leave_no_coercions():
+    check = RNS.compile_schema({"v": ({"a": float, "b": int}, {"a": str})})
+    data = {"v": {"a": "2"}}
+    assert check.errors(data) == {} and data == {"v": {"a": "2"}}
+    check = RNS.compile_schema({"v": ({"a": int, "b": int}, {"c": str})})
+    data = {"v": {"a": "5", "c": "x"}}
+    assert check.errors(data) == {} and data == {"v": {"a": "5", "c": "x"}}
+    check = RNS.compile_schema({"v": ({"a": int, "b": int}, {"c": int})})
+    data = RNS({"v": {"a": "5", "c": "7"}})
+    assert check.errors(data) == {}
+    assert data._.to_dict() == {"v": {"a": "5", "c": 7}}
+
+
+def test_union_options_are_tried_without_copying():
+    lock = threading.Lock()  # cannot be deep-copied
+    check = RNS.compile_schema({"v": ({"a": int, "b": int}, {"a": int})})
+    data = {"v": {"a": "5", "lock": lock}}
+    assert check.errors(data) == {}
+    assert data == {"v": {"a": 5, "lock": lock}}
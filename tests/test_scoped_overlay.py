@@ -0,0 +1,138 @@
+"""Tests for scoped_overlay()."""
+
+from __future__ import annotations
+
+import asyncio
+import pickle
+import threading
+
+import pytest
+
+from recursivenamespace import RNS, SetChainKeyError
+from recursivenamespace.main import recursivenamespace
+
+
+class TestScopedOverlay:
+    def test_basic(self):
+        cfg = RNS({"debug": False, "port": 8000})
+        with cfg._.scoped_overlay({"debug": True}) as ref:
+            assert ref is cfg
+            assert cfg.debug is True
+            assert cfg["debug"] is True
+            assert cfg._.val_get("debug") is True
+            assert cfg.port == 8000
+        assert cfg.debug is False
+
+    def test_base_tree_is_not_written(self):
+        cfg = RNS({"a": 1})
+        with cfg._.scoped_overlay({"a": 2, "extra": 3}):
+            assert cfg.__dict__["a"] == 1
+            assert cfg._.to_dict() == {"a": 1}
+            assert "extra" in cfg
+            assert cfg._.get_or_else("extra") == 3
+        assert "extra" not in cfg
+
+    def test_chain_keys(self):
+        cfg = RNS({"db": {"pool": {"size": 5}, "host": "a"}})
+        with cfg._.scoped_overlay({"db.pool.size": 50, "db.host": "b"}):
+            assert cfg.db.pool.size == 50
+            assert cfg._.val_get("db.pool.size") == 50
+            assert cfg.db.host == "b"
+        assert cfg.db.pool.size == 5
+
+    def test_nested_scopes(self):
+        cfg = RNS({"x": 1, "y": 1})
+        with cfg._.scoped_overlay({"x": 10}):
+            with cfg._.scoped_overlay({"y": 20}):
+                assert (cfg.x, cfg.y) == (10, 20)
+            assert (cfg.x, cfg.y) == (10, 1)
+            with cfg._.scoped_overlay({"x": 100}):
+                assert cfg.x == 100
+            assert cfg.x == 10
+        assert (cfg.x, cfg.y) == (1, 1)
+
+    def test_key_normalization_and_errors(self):
+        cfg = RNS({"my_key": 1, "leaf": "s", "arr": [1]})
+        with cfg._.scoped_overlay({"my-key": 2}):
+            assert cfg.my_key == 2
+        with pytest.raises(SetChainKeyError):
+            cfg._.scoped_overlay({"leaf.x": 1}).__enter__()
+        with pytest.raises(KeyError, match="array"):
+            cfg._.scoped_overlay({"arr[].0": 1}).__enter__()
+        with pytest.raises(KeyError, match="protected"):
+            cfg._.scoped_overlay({"_key_": 1}).__enter__()
+
+    def test_threads_are_isolated(self):
+        cfg = RNS({"user": "base"})
+        barrier = threading.Barrier(8)
+        seen = {}
+
+        def worker(i):
+            with cfg._.scoped_overlay({"user": f"u{i}"}):
+                barrier.wait()
+                seen[i] = cfg.user
+                barrier.wait()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert seen == {i: f"u{i}" for i in range(8)}
+        assert cfg.user == "base"
+
+    def test_asyncio_tasks_are_isolated(self):
+        cfg = RNS({"db": {"host": "base"}})
+
+        async def handler(i):
+            with cfg._.scoped_overlay({"db.host": f"h{i}"}):
+                await asyncio.sleep(0)
+                return cfg._.val_get("db.host")
+
+        async def main():
+            return await asyncio.gather(*(handler(i) for i in range(20)))
+
+        assert asyncio.run(main()) == [f"h{i}" for i in range(20)]
+        assert cfg.db.host == "base"
+
+    def test_scoped_nodes_still_pickle_and_copy_as_rns(self):
+        cfg = RNS({"a": 1})
+        with cfg._.scoped_overlay({"a": 2}):
+            pass
+        loaded = pickle.loads(pickle.dumps(cfg))
+        assert type(loaded) is recursivenamespace
+        assert loaded == cfg
+        assert isinstance(cfg._.deepcopy(), recursivenamespace)
+
+    def test_class_restored_when_last_block_exits(self):
+        cfg = RNS({"a": 1, "db": {"host": "x"}})
+        outer = cfg._.scoped_overlay({"a": 2, "db.host": "y"})
+        outer.__enter__()
+        with cfg._.scoped_overlay({"a": 3}):
+            assert type(cfg) is not recursivenamespace
+        assert type(cfg) is not recursivenamespace and cfg.a == 2
+        outer.__exit__(None, None, None)
+        assert type(cfg) is recursivenamespace
+        assert type(cfg.db) is recursivenamespace
+        assert cfg.a == 1 and cfg.db.host == "x"
+
+    def test_spawned_task_sees_overrides_while_block_is_open(self):
+        cfg = RNS({"a": 1})
+
+        async def child(opened, closed):
+            seen = [cfg.a]
+            opened.set()
+            await closed.wait()
+            return [*seen, cfg.a]
+
+        async def main():
+            opened, closed = asyncio.Event(), asyncio.Event()
+            with cfg._.scoped_overlay({"a": 2}):
+                assert type(cfg) is not recursivenamespace
+                assert isinstance(cfg, recursivenamespace)
+                task = asyncio.ensure_future(child(opened, closed))
+                await opened.wait()
+            closed.set()
+            return await task
+
+        assert asyncio.run(main()) == [2, 1]
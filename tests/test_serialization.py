@@ -4,13 +4,20 @@ Tests for JSON and TOML serialization functionality.
 
 from __future__ import annotations
 
+import copyreg
+import datetime
+import gc
+import io
 import json
+import pickle
 import pytest
+import weakref
 from pathlib import Path
 from recursivenamespace import (
     RNS,
     SerializationError,
 )
+from recursivenamespace.main import _StaticImpl, recursivenamespace
 
 # Test fixtures directory
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -147,6 +154,55 @@ def test_from_json_non_dict():
         RNS.from_json("[1, 2, 3]")
 
 
+def _node_state(value):
+    """Every attribute of every node, for exact construction parity."""
+    if isinstance(value, RNS):
+        return {k: _node_state(v) for k, v in vars(value).items()}
+    if isinstance(value, list):
+        return [_node_state(v) for v in value]
+    return value
+
+
+def test_from_json_single_pass_matches_constructor():
+    """from_json builds nodes in the decoder; result equals RNS(dict)."""
+    text = json.dumps(
+        {
+            "a-b": {"c d": [1, {"e.f": {"g": 1}}, [{"h": None}]]},
+            "empty": {},
+            "dup": 1,
+        }
+    )
+    loaded = RNS.from_json(text)
+    assert _node_state(loaded) == _node_state(RNS(json.loads(text)))
+    assert loaded["a_b"].get_key() == "a_b"
+
+
+def test_from_json_protected_and_shadowing_keys():
+    """Key protection and shadow warnings apply on the decode path."""
+    with pytest.raises(SerializationError, match="protected"):
+        RNS.from_json('{"a": {"_key_": 1}}')
+    with pytest.warns(FutureWarning):
+        loaded = RNS.from_json('{"items": [1]}')
+    assert loaded["items"] == [1]
+
+
+def test_from_json_dunder_keys():
+    """Dunder keys take the checked path, as in RNS(dict)."""
+    for text in ('{"__class__": 1}', '{"a": {"__dict__": {"x": 1}}}'):
+        with pytest.raises(SerializationError):
+            RNS.from_json(text)
+    loaded = RNS.from_json('{"a": {"__module__": 1}}')
+    assert loaded.a["__module__"] == 1
+    assert loaded._.deepcopy() == loaded
+
+
+def test_from_json_decoded_nodes_stay_independent():
+    """Removing a protected key on one node does not affect others."""
+    loaded = RNS.from_json('{"a": {}, "b": {}}')
+    loaded.a._remove_protected_key_("_key_")
+    assert "_key_" in loaded.b._protected__keys_
+
+
 def test_json_round_trip():
     """Test JSON round-trip (dict -> RNS -> JSON -> RNS -> dict)."""
     original = {
@@ -159,6 +215,42 @@ def test_json_round_trip():
     assert result == original
 
 
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"indent": None}, {"indent": 4, "sort_keys": True}],
+)
+def test_dump_json_matches_to_json(options):
+    """dump_json writes exactly what to_json returns, in chunks."""
+    rns = RNS({"a": 1, "b": {"c": [1, (2, 3), {"d": "é"}]}, "e": [[]]})
+    buf = io.StringIO()
+    rns._.dump_json(buf, chunk_size=4, **options)
+    assert buf.getvalue() == rns._.to_json(**options)
+
+
+def test_dump_json_binary_and_chunked_writes():
+    """Binary targets get UTF-8; writes come in chunk_size pieces."""
+    rns = RNS({f"key{i}": {"value": i} for i in range(100)})
+    buf = io.BytesIO()
+    rns._.dump_json(buf, ensure_ascii=False)
+    assert buf.getvalue().decode("utf-8") == rns._.to_json(ensure_ascii=False)
+
+    writes = []
+
+    class Target:
+        def write(self, text):
+            writes.append(text)
+
+    rns._.dump_json(Target(), chunk_size=256)
+    assert len(writes) > 1
+    assert all(len(w) < 512 for w in writes)
+
+
+def test_dump_json_unserializable():
+    """Values json cannot encode raise SerializationError."""
+    with pytest.raises(SerializationError):
+        RNS({"a": object()})._.dump_json(io.StringIO())
+
+
 def test_save_json(tmp_path):
     """Test saving JSON to file."""
     rns = RNS({"test": "data", "number": 42})
@@ -172,6 +264,25 @@ def test_save_json(tmp_path):
     assert data["number"] == 42
 
 
+def test_save_json_stream_writes_the_same(tmp_path, monkeypatch):
+    """save_json only streams through dump_json when asked to."""
+    rns = RNS({"a": {"b": [1, "é"]}, "c": None})
+    calls = []
+    original = _StaticImpl.dump_json
+    monkeypatch.setattr(
+        _StaticImpl,
+        "dump_json",
+        staticmethod(lambda *a, **k: calls.append(1) or original(*a, **k)),
+    )
+    rns._.save_json(tmp_path / "fast.json", sort_keys=True)
+    assert calls == []
+    rns._.save_json(tmp_path / "stream.json", sort_keys=True, stream=True)
+    assert calls == [1]
+    fast = (tmp_path / "fast.json").read_text(encoding="utf-8")
+    assert fast == (tmp_path / "stream.json").read_text(encoding="utf-8")
+    assert fast == rns._.to_json(sort_keys=True)
+
+
 def test_save_json_creates_dirs(tmp_path):
     """Test save_json creates parent directories."""
     rns = RNS({"key": "value"})
@@ -339,6 +450,93 @@ def test_toml_file_round_trip(tmp_path):
     assert rns2.features == ["auth", "api"]
 
 
+def test_toml_round_trip_arrays_of_tables_and_datetimes():
+    """Arrays of tables, inline tables, quoted keys and date-times."""
+    original = {
+        "when": datetime.datetime(
+            2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+        ),
+        "day": datetime.date(2024, 1, 2),
+        "servers": [
+            {"name": "a", "meta": {"rack": 1}, "ports": [{"p": 80}, 443]},
+            {"name": "b", "sub": [{"deep": True}]},
+        ],
+        "a": {"b": {"c": {"d": 1}}, "x y": {"z.w": 'line\n"q"'}},
+        "empty": {},
+        "grid": [[1, 2], []],
+    }
+    toml_str = RNS(original, use_raw_key=True).to_toml()
+    assert "[[servers]]" in toml_str
+    assert '[a."x y"]' in toml_str
+    assert RNS.from_toml(toml_str, use_raw_key=True).to_dict() == original
+
+
+def test_dump_toml_matches_to_toml_and_streams(tmp_path):
+    """dump_toml writes to_toml's text in chunk_size pieces."""
+    rns = RNS({"t": {f"k{i}": {"v": i, "l": [{"x": i}]} for i in range(50)}})
+    writes = []
+
+    class Target:
+        def write(self, text):
+            writes.append(text)
+
+    rns._.dump_toml(Target(), chunk_size=64)
+    assert len(writes) > 1
+    assert "".join(writes) == rns.to_toml()
+
+    buf = io.BytesIO()
+    RNS({"é": "ü"})._.dump_toml(buf)
+    assert buf.getvalue().decode("utf-8") == '"é" = "ü"\n'
+
+
+def test_to_toml_circular_reference():
+    rns = RNS({"a": {}})
+    rns.a.me = rns
+    with pytest.raises(SerializationError, match="Circular"):
+        rns.to_toml()
+
+
+# Pickle
+
+
+def test_pickle_round_trip_preserves_every_node():
+    rns = RNS(
+        {"a-b": {"c": [1, {"d": 2}]}, "s": {1, 2}},
+        use_raw_key=True,
+        accepted_iter_types=[set],
+    )
+    loaded = pickle.loads(pickle.dumps(rns))
+    assert _node_state(loaded) == _node_state(rns)
+
+
+def test_pickle_stores_only_user_data():
+    rns = RNS({"a": {"b": 1}})
+    payload = pickle.dumps(rns)
+    assert b"_protected__keys_" not in payload
+    assert b"val_get" not in payload
+    assert len(payload) < 300
+    assert b"_new_node_" not in payload
+
+
+def test_pickle_does_not_keep_node_classes_alive():
+    cls = type("Temp", (recursivenamespace,), {"__slots__": ()})
+    assert cls({"a": 1}).__reduce__()[0] is copyreg.__newobj__
+    ref = weakref.ref(cls)
+    del cls
+    gc.collect()
+    assert ref() is None
+
+
+def test_pickle_removed_protected_key_and_cycles():
+    rns = RNS({"a": {}})
+    rns.a._remove_protected_key_("_key_")
+    rns.a.me = rns
+    loaded = pickle.loads(pickle.dumps(rns))
+    assert "_key_" not in loaded.a._protected__keys_
+    assert "_key_" in loaded._protected__keys_
+    assert loaded.a.me is loaded
+
+
 # Edge Cases and Error Handling
 
 
@@ -0,0 +1,152 @@
+"""Tests for save_snapshot / open_snapshot."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from recursivenamespace import RNS, GetChainKeyError, SerializationError
+from recursivenamespace.snapshot import SnapshotNode
+
+
+@pytest.fixture
+def tree():
+    cfg = RNS(
+        {
+            "name": "svc",
+            "port": 8080,
+            "ratio": 0.25,
+            "huge": 2**80,
+            "negative_huge": -(2**70),
+            "flags": {"on": True, "off": False, "unset": None},
+            "blob": b"\x00\xff",
+            "servers": [{"host": "a", "tags": ("x", "y")}, [1, [2]], {3}],
+            "empty": {},
+            "unicode-key": "é 😀",
+        }
+    )
+    cfg["plain"] = {"k": [1, {"j": 2}]}
+    return cfg
+
+
+def test_round_trip_matches_to_dict(tree, tmp_path):
+    path = tmp_path / "sub" / "cfg.snap"
+    tree._.save_snapshot(path)
+    with RNS.open_snapshot(path) as snap:
+        assert snap.to_dict() == tree._.to_dict()
+        rebuilt = snap.to_rns()
+    assert isinstance(rebuilt, RNS)
+    assert rebuilt._.to_dict() == tree._.to_dict()
+
+
+def test_lazy_access(tree, tmp_path):
+    path = tmp_path / "cfg.snap"
+    tree._.save_snapshot(path)
+    with RNS.open_snapshot(path) as snap:
+        assert snap._index is None  # nothing decoded yet
+        servers = snap.servers
+        assert isinstance(servers[0], SnapshotNode)
+        assert servers[0]._index is None
+        assert servers[0].host == "a"
+        assert snap.val_get("servers[].0.tags") == ("x", "y")
+        assert snap.val_get("flags.unset") is None
+        assert snap["unicode_key"] == "é 😀"
+        assert "port" in snap and "missing" not in snap
+        assert len(snap) == len(tree)
+        assert snap.keys() == tree._.keys()
+        with pytest.raises(AttributeError):
+            _ = snap.missing
+        with pytest.raises(KeyError):
+            snap.val_get("flags.nope")
+
+
+def test_val_get_last_index_and_errors(tree, tmp_path):
+    path = tmp_path / "cfg.snap"
+    tree._.save_snapshot(path)
+    with RNS.open_snapshot(path) as snap:
+        assert snap.val_get("plain.k[].#.j") == 2
+        assert snap.val_get("servers[].#") == {3}
+        for key in ("servers[].x", "servers[].9", "port.x", "nope.a"):
+            with pytest.raises(GetChainKeyError):
+                snap.val_get(key)
+
+
+def test_keys_are_normalized_like_a_node(tree, tmp_path):
+    path = tmp_path / "cfg.snap"
+    tree._.save_snapshot(path)
+    with RNS.open_snapshot(path) as snap:
+        assert snap["unicode-key"] == tree["unicode-key"]
+        assert snap.val_get("unicode-key") == tree._.val_get("unicode-key")
+        assert "unicode key" in snap
+
+
+def test_deep_to_dict(tmp_path):
+    cfg = node = RNS()
+    nested: list = []
+    for _ in range(3 * sys.getrecursionlimit()):
+        node["c"] = RNS()
+        node = node.c
+        nested = [nested]
+    node["l"] = nested
+    cfg._.save_snapshot(tmp_path / "deep.snap")
+    with RNS.open_snapshot(tmp_path / "deep.snap") as snap:
+        data = snap.to_dict()
+    depth = 0
+    while "c" in data:
+        data = data["c"]
+        depth += 1
+    assert depth == 3 * sys.getrecursionlimit()
+    assert len(data["l"]) == 1
+
+
+def test_raw_keys_survive(tmp_path):
+    cfg = RNS({"a-b": {"c.d": 1}}, use_raw_key=True)
+    path = tmp_path / "raw.snap"
+    cfg._.save_snapshot(path)
+    with RNS.open_snapshot(path) as snap:
+        assert snap["a-b"]["c.d"] == 1
+        assert snap.to_rns() == cfg
+
+
+def test_unsupported_value(tmp_path):
+    with pytest.raises(SerializationError):
+        RNS({"x": object()})._.save_snapshot(tmp_path / "bad.snap")
+
+
+def test_circular_reference(tmp_path):
+    cfg = RNS({"a": {"l": []}})
+    cfg.a.l.append(cfg.a.l)
+    with pytest.raises(SerializationError, match="Circular"):
+        cfg._.save_snapshot(tmp_path / "list.snap")
+    cfg.a["l"] = []
+    cfg.a["me"] = cfg
+    with pytest.raises(SerializationError, match="Circular"):
+        cfg._.save_snapshot(tmp_path / "node.snap")
+    shared = [1, {"x": 2}]
+    cfg = RNS({"a": shared, "b": {"c": shared}})
+    cfg._.save_snapshot(tmp_path / "shared.snap")
+    with RNS.open_snapshot(tmp_path / "shared.snap") as snap:
+        assert snap.to_dict() == cfg._.to_dict()
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / "cfg.json"
+    path.write_text('{"a": 1, "padding": "................"}')
+    with pytest.raises(SerializationError):
+        RNS.open_snapshot(path)
+    empty = tmp_path / "empty.snap"
+    empty.write_bytes(b"")
+    with pytest.raises(SerializationError):
+        RNS.open_snapshot(empty)
+
+
+def test_large_node_lookup_uses_index(tmp_path):
+    cfg = RNS({f"k{i:03d}": {"i": i} for i in range(200)})
+    path = tmp_path / "wide.snap"
+    cfg._.save_snapshot(path)
+    with RNS.open_snapshot(path) as snap:
+        assert snap.k137.i == 137
+        assert "k199" in snap and "k200" not in snap
+        assert snap._index is None  # found by binary search
+        assert snap.keys() == cfg._.keys()  # insertion order kept
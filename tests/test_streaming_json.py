@@ -0,0 +1,166 @@
+"""Tests for load_json_stream."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from recursivenamespace import RNS, SerializationError
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SAMPLE_JSON = FIXTURES_DIR / "sample_config.json"
+
+DOC = {
+    "service-name": "api",
+    "ints": [0, -1, 10**30],
+    "floats": [2.5, -3e2, 1e-7, 1e5],
+    "flags": {"on": True, "off": False, "none": None},
+    "text": 'esc \\ " \n é \U0001f600',
+    "nested": [[], {}, [{"a b": [1, {"c": "d"}]}]],
+    "empty": {},
+    "long": "x" * 5000,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 4096])
+def test_matches_from_json_text_and_binary(chunk_size):
+    text = json.dumps(DOC, ensure_ascii=False, indent=2)
+    expected = RNS.from_json(text)
+    from_text = RNS.load_json_stream(io.StringIO(text), chunk_size)
+    from_bytes = RNS.load_json_stream(
+        io.BytesIO(text.encode("utf-8")), chunk_size
+    )
+    assert from_text == expected
+    assert from_bytes == expected
+
+
+def test_path_matches_load_json():
+    assert RNS.load_json_stream(SAMPLE_JSON) == RNS.load_json(SAMPLE_JSON)
+    assert RNS.load_json_stream(str(SAMPLE_JSON), chunk_size=5) == (
+        RNS.load_json(SAMPLE_JSON)
+    )
+
+
+def test_key_options_match_load_json():
+    text = '{"a-b": [{"c-d": 1}], "e-f": {"g-h": 2}}'
+    for use_raw_key in (False, True):
+        streamed = RNS.load_json_stream(
+            io.StringIO(text), use_raw_key=use_raw_key
+        )
+        assert streamed == RNS.from_json(text, use_raw_key=use_raw_key)
+
+
+def test_nesting_deeper_than_recursion_limit():
+    depth = 5000
+    text = '{"a": ' * depth + "1" + "}" * depth
+    node = RNS.load_json_stream(io.StringIO(text))
+    for _ in range(depth):
+        node = node["a"]
+    assert node == 1
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "[1, 2]",
+        '{"a": 1',
+        '{"a": 1} x',
+        '{"a" 1}',
+        '{"a": tru}',
+        '{"a": "open',
+        "{a: 1}",
+        '{"a": 1,}',
+        '{"a": 1.}',
+        '{"a": [1 2]}',
+    ],
+)
+def test_invalid_json_raises(text):
+    with pytest.raises(SerializationError):
+        RNS.load_json_stream(io.StringIO(text), chunk_size=2)
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        RNS.load_json_stream(io.StringIO("{}"), chunk_size=0)
+
+
+def test_missing_file():
+    with pytest.raises(FileNotFoundError):
+        RNS.load_json_stream("/nonexistent/config.json")
+
+
+SELECT_DOC = {
+    "meta": {"request_id": "r1", "junk": [1, {"x": 'a"]}'}]},
+    "data": {
+        "users": [{"id": 1, "name": "a"}, {"id": 2}, {"name": "c"}],
+        "other": "z",
+    },
+    "service-name": {"port": 80},
+    "text": "{[",
+}
+
+
+class TestSelect:
+    def load(self, select, chunk_size=4096, **kwargs):
+        text = json.dumps(SELECT_DOC)
+        return RNS.load_json_stream(
+            io.StringIO(text), chunk_size, select=select, **kwargs
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+    def test_projects_selected_paths(self, chunk_size):
+        cfg = self.load(["meta.request_id", "data.users[].*.id"], chunk_size)
+        assert cfg._.to_dict() == {
+            "meta": {"request_id": "r1"},
+            "data": {"users": [{"id": 1}, {"id": 2}]},
+        }
+
+    def test_load_json_select(self, tmp_path):
+        path = tmp_path / "doc.json"
+        path.write_text(json.dumps(SELECT_DOC))
+        cfg = RNS.load_json(path, select=["data.users[].1"])
+        assert cfg._.to_dict() == {"data": {"users": [{"id": 2}]}}
+
+    def test_whole_subtree_and_overlapping_paths(self):
+        cfg = self.load(["meta", "meta.request_id", "text"])
+        assert cfg._.to_dict() == {
+            "meta": SELECT_DOC["meta"],
+            "text": "{[",
+        }
+
+    def test_wildcard_key(self):
+        cfg = self.load(["*.port", "*.request_id"])
+        assert cfg._.to_dict() == {
+            "meta": {"request_id": "r1"},
+            "service_name": {"port": 80},
+        }
+
+    def test_keys_match_after_normalization(self):
+        assert self.load(["service_name.port"]).service_name.port == 80
+        raw = self.load(["service-name"], use_raw_key=True)
+        assert raw["service-name"].port == 80
+
+    def test_select_keys_resolve_like_val_get(self):
+        full = RNS(SELECT_DOC)
+        for key in ("service-name.port", "service name.port"):
+            cfg = self.load([key])
+            assert cfg._.val_get(key) == full._.val_get(key) == 80
+        text = json.dumps({"a-b": {"c": 1, "d": 2}})
+        cfg = RNS.load_json_stream(io.StringIO(text), select=["a-b.c"])
+        assert cfg._.to_dict() == {"a_b": {"c": 1}}
+        assert cfg._.val_get("a-b.c") == RNS.from_json(text)._.val_get("a-b.c")
+        records = RNS.iter_jsonl(io.StringIO(text), select=["a-b.c"])
+        assert [r._.to_dict() for r in records] == [{"a_b": {"c": 1}}]
+
+    def test_missing_paths_are_left_out(self):
+        assert self.load(["nothing", "text.below", "data.none"]) == RNS()
+
+    def test_skipped_subtree_must_be_closed(self):
+        with pytest.raises(SerializationError):
+            RNS.load_json_stream(
+                io.StringIO('{"a": 1, "b": {"c": [1, 2}'), select=["a"]
+            )
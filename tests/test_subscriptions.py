@@ -0,0 +1,168 @@
+"""Tests for subscribe() / unsubscribe() / batch()."""
+
+from __future__ import annotations
+
+from recursivenamespace import RNS
+from recursivenamespace.events import MutationHub, SubscriptionTrie
+
+
+def _recorder():
+    calls = []
+
+    def callback(mutations):
+        calls.append([m.path for m in mutations])
+
+    return calls, callback
+
+
+class TestSubscribe:
+    def test_exact_path(self):
+        cfg = RNS({"db": {"pool": {"size": 5}}})
+        calls, cb = _recorder()
+        cfg._.subscribe("db.pool.size", cb)
+        cfg._.val_set("db.pool.size", 10)
+        cfg._.val_set("db.host", "x")
+        assert calls == [["db.pool.size"]]
+
+    def test_wildcard_segment(self):
+        cfg = RNS({"db": {"pool": {"size": 5, "timeout": 1}}})
+        calls, cb = _recorder()
+        cfg._.subscribe("db.pool.*", cb)
+        cfg.db.pool["size"] = 6
+        cfg._.val_set("db.pool.timeout", 2)
+        assert calls == [["db.pool.size"], ["db.pool.timeout"]]
+
+    def test_wildcard_in_middle(self):
+        cfg = RNS({"servers": [{"host": "a"}, {"host": "b"}]})
+        calls, cb = _recorder()
+        cfg._.subscribe("servers[].*.host", cb)
+        cfg._.val_set("servers[].1.host", "c")
+        assert calls == [["servers[].1.host"]]
+
+    def test_write_below_subscription_notifies(self):
+        cfg = RNS({"db": {"pool": {"size": 5}}})
+        calls, cb = _recorder()
+        cfg._.subscribe("db", cb)
+        cfg._.val_set("db.pool.size", 10)
+        assert calls == [["db.pool.size"]]
+
+    def test_ancestor_replacement_notifies(self):
+        cfg = RNS({"db": {"pool": {"size": 5}}})
+        calls, cb = _recorder()
+        cfg._.subscribe("db.pool.*", cb)
+        cfg["db"] = {"pool": {"size": 1}}
+        assert calls == [["db"]]
+
+    def test_auto_vivify_is_one_notification(self):
+        cfg = RNS({})
+        calls, cb = _recorder()
+        cfg._.subscribe("", cb)
+        cfg._.subscribe("db.pool.size", cb)
+        cfg._.val_set("db.pool.size", 10)
+        assert calls == [["db"]]
+
+    def test_pop_notifies(self):
+        cfg = RNS({"db": {"host": "x"}})
+        calls, cb = _recorder()
+        cfg._.subscribe("db.host", cb)
+        cfg.db._.pop("host")
+        assert calls == [["db.host"]]
+
+    def test_subscribe_on_subtree_is_relative(self):
+        cfg = RNS({"db": {"pool": {"size": 5}}})
+        cfg._.track_changes()
+        calls, cb = _recorder()
+        cfg.db._.subscribe("pool.size", cb)
+        cfg._.val_set("db.pool.size", 7)
+        assert calls == [["db.pool.size"]]
+
+    def test_callback_under_two_patterns_called_once(self):
+        cfg = RNS({"db": {"host": "x"}})
+        calls, cb = _recorder()
+        cfg._.subscribe("db", cb)
+        cfg._.subscribe("db.*", cb)
+        cfg.db["host"] = "y"
+        assert calls == [["db.host"]]
+
+    def test_unsubscribe(self):
+        cfg = RNS({"a": 1})
+        calls, cb = _recorder()
+        cfg._.subscribe("a", cb)
+        cfg._.unsubscribe("a", cb)
+        cfg["a"] = 2
+        assert calls == []
+        # Last subscription gone: the tree is no longer observed.
+        assert cfg._binding_ is None
+
+    def test_self_referencing_tree(self):
+        cfg = RNS({"a": {}})
+        cfg.a["me"] = cfg
+        calls, cb = _recorder()
+        cfg._.subscribe("a.*", cb)
+        cfg.a.me.a["x"] = 1
+        cfg["b"] = RNS({"up": cfg})
+        cfg.b.up["c"] = 2
+        assert calls == [["a.x"]]
+        assert cfg.b._binding_.path == "b"
+
+
+class TestBatch:
+    def test_batch_coalesces(self):
+        cfg = RNS({"db": {"host": "x", "port": 1}})
+        calls, cb = _recorder()
+        cfg._.subscribe("db.*", cb)
+        with cfg._.batch():
+            cfg._.val_set("db.host", "y")
+            cfg._.val_set("db.port", 2)
+            assert calls == []
+        assert calls == [["db.host", "db.port"]]
+
+    def test_nested_batches_flush_once(self):
+        cfg = RNS({"a": 1, "b": 2})
+        calls, cb = _recorder()
+        cfg._.subscribe("*", cb)
+        with cfg._.batch():
+            cfg["a"] = 10
+            with cfg._.batch():
+                cfg["b"] = 20
+            assert calls == []
+        assert calls == [["a", "b"]]
+
+    def test_update_is_one_notification(self):
+        cfg = RNS({"a": 1, "b": 2})
+        calls, cb = _recorder()
+        cfg._.subscribe("*", cb)
+        cfg._.update({"a": 10, "b": 20})
+        assert calls == [["a", "b"]]
+
+    def test_overlay_apply_and_restore(self):
+        cfg = RNS({"debug": False})
+        calls, cb = _recorder()
+        cfg._.subscribe("debug", cb)
+        with cfg._.overlay({"debug": True, "tmp": 1}):
+            assert calls == [["debug"]]
+        assert calls == [["debug"], ["debug"]]
+
+    def test_batch_on_unobserved_tree_is_noop(self):
+        cfg = RNS({"a": 1})
+        with cfg._.batch():
+            cfg["a"] = 2
+        assert cfg.a == 2
+
+
+class TestSubscriptionTrie:
+    def test_match_cost_ignores_unrelated_patterns(self):
+        trie = SubscriptionTrie(MutationHub())
+        _, cb = _recorder()
+        for i in range(1000):
+            trie.subscribe(f"svc{i}.value", cb)
+        trie.subscribe("db.pool.*", cb)
+        assert trie.match("db.pool.size") == [cb]
+        assert trie.match("other") == []
+
+    def test_unsubscribe_prunes(self):
+        trie = SubscriptionTrie(MutationHub())
+        _, cb = _recorder()
+        trie.subscribe("a.b.c", cb)
+        trie.unsubscribe("a.b.c", cb)
+        assert not trie
@@ -0,0 +1,136 @@
+"""Tests for transaction()."""
+
+from __future__ import annotations
+
+import pytest
+
+from recursivenamespace import RNS, SetChainKeyError
+
+
+class TestTransaction:
+    def test_commit_applies_writes(self):
+        cfg = RNS({"a": 1, "db": {"host": "x"}})
+        with cfg._.transaction() as tx:
+            assert tx is cfg
+            cfg._.val_set("a", 2)
+            cfg._.val_set("db.host", "y")
+            assert cfg.a == 2
+        assert cfg._.to_dict() == {"a": 2, "db": {"host": "y"}}
+
+    def test_failed_val_set_rolls_back_everything(self):
+        cfg = RNS({"a": 1, "name": "str-leaf", "ports": [1]})
+        before = cfg._.to_dict()
+        with pytest.raises(SetChainKeyError), cfg._.transaction():
+            cfg._.val_set("a", 2)
+            cfg._.val_set("new.deep.key", 3)
+            cfg._.val_set("ports[].#", 2)
+            cfg._.val_set("name.sub", 4)
+        assert cfg._.to_dict() == before
+
+    def test_user_exception_rolls_back_pop_and_del(self):
+        cfg = RNS({"a": 1, "b": 2, "c": {"d": 3}})
+        before = cfg._.to_dict()
+        with pytest.raises(RuntimeError), cfg._.transaction():
+            cfg._.pop("a")
+            del cfg["b"]
+            cfg.c["d"] = 4
+            raise RuntimeError("abort")
+        assert cfg._.to_dict() == before
+
+    def test_unobserved_tree_is_released(self):
+        cfg = RNS({"a": {"b": 1}})
+        with cfg._.transaction():
+            cfg.a["b"] = 2
+        assert cfg._binding_ is None
+        assert cfg.a._binding_ is None
+
+    def test_subscribers_notified_once_per_commit(self):
+        cfg = RNS({"a": 1, "b": 2})
+        calls = []
+        cfg._.subscribe("*", lambda ms: calls.append([m.path for m in ms]))
+        with cfg._.transaction():
+            cfg["a"] = 10
+            cfg["b"] = 20
+            assert calls == []
+        assert calls == [["a", "b"]]
+
+    def test_observers_see_nothing_on_rollback(self):
+        cfg = RNS({"a": 1})
+        cfg._.track_changes()
+        calls = []
+        cfg._.subscribe("a", calls.append)
+        with pytest.raises(ValueError), cfg._.transaction():
+            cfg["a"] = 2
+            raise ValueError
+        assert calls == []
+        assert cfg._.changes() == []
+
+    def test_commit_is_one_history_step(self):
+        cfg = RNS({"a": 1, "b": 2})
+        h = cfg._.history()
+        with cfg._.transaction():
+            cfg["a"] = 10
+            cfg["b"] = 20
+        h.undo()
+        assert cfg._.to_dict() == {"a": 1, "b": 2}
+
+    def test_nested_transaction_is_a_savepoint(self):
+        cfg = RNS({"a": 1, "b": 2})
+        with cfg._.transaction():
+            cfg["a"] = 10
+            with pytest.raises(KeyError), cfg._.transaction():
+                cfg["b"] = 20
+                raise KeyError("inner")
+            assert cfg.b == 2
+        assert cfg._.to_dict() == {"a": 10, "b": 2}
+
+    def test_outer_failure_undoes_committed_inner(self):
+        cfg = RNS({"a": 1})
+        with pytest.raises(RuntimeError), cfg._.transaction():
+            with cfg._.transaction():
+                cfg["a"] = 2
+            raise RuntimeError
+        assert cfg.a == 1
+
+    def test_rollback_restores_replaced_subtree_identity(self):
+        cfg = RNS({"db": {"host": "x"}})
+        db = cfg.db
+        with pytest.raises(RuntimeError), cfg._.transaction():
+            cfg["db"] = RNS({"host": "y"})
+            raise RuntimeError
+        assert cfg.db is db
+
+    def test_rollback_undoes_plain_attribute_writes(self):
+        cfg = RNS({"a": {"b": 1}, "hosts": ["x"]})
+        before = cfg._.to_dict()
+        with pytest.raises(RuntimeError), cfg._.transaction() as t:
+            t.a.b = 99
+            t.c = RNS({"d": 1})
+            del t.a.b
+            cfg._.val_set("hosts[].#", "y")
+            cfg._.val_set("a.e", 2)
+            raise RuntimeError
+        assert cfg._.to_dict() == before
+        assert cfg.a._binding_ is None
+
+    def test_rollback_and_commit_log_only_the_writes(self):
+        cfg = RNS({"a": {"b": 1}, "hosts": ["x"]})
+        cfg._.track_changes()
+        with pytest.raises(RuntimeError), cfg._.transaction() as t:
+            t.a.b = 2
+            t.hosts.append("y")  # in-place list method: not logged
+            raise RuntimeError
+        assert cfg.a.b == 1 and cfg.hosts == ["x", "y"]
+        with cfg._.transaction() as t:
+            t.a.b = 3
+            t.a.c = 4
+        assert cfg._.changes() == ["a.b", "a.c"]
+
+    def test_self_referencing_tree(self):
+        cfg = RNS({"a": {}})
+        cfg.a["me"] = cfg
+        with pytest.raises(RuntimeError), cfg._.transaction():
+            cfg.a.me.a.x = 1
+            raise RuntimeError
+        assert "x" not in cfg.a and cfg.a.me is cfg
+        assert cfg._binding_ is None and cfg.a._binding_ is None
@@ -0,0 +1,88 @@
+"""Tests for RNS.watch / FileWatcher."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+
+import pytest
+
+from recursivenamespace import RNS, FileWatcher
+
+
+def write(path, text):
+    path.write_text(text)
+    # Make the change visible even on coarse mtime filesystems.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_poll_applies_diff_in_place(tmp_path):
+    path = tmp_path / "cfg.toml"
+    write(path, '[db]\nhost = "a"\n[cache]\nttl = 5\n[old]\nx = 1\n')
+    changes = []
+    watcher = RNS.watch(path, interval=None, on_change=changes.append)
+    tree = watcher.tree
+    db, cache = tree.db, tree.cache
+    assert watcher.poll() == []
+
+    write(path, '[db]\nhost = "b"\n[cache]\nttl = 5\n[[servers]]\nn = 1\n')
+    changed = watcher.poll()
+    assert sorted(changed) == ["db.host", "old", "servers"]
+    assert changes == [changed]
+    assert watcher.tree is tree and tree.db is db and tree.cache is cache
+    assert tree.to_dict() == {
+        "db": {"host": "b"},
+        "cache": {"ttl": 5},
+        "servers": [{"n": 1}],
+    }
+
+
+def test_subscribers_and_journal_see_the_reload(tmp_path):
+    path = tmp_path / "cfg.json"
+    write(path, json.dumps({"db": {"host": "a", "port": 1}}))
+    watcher = RNS.watch(path, interval=None)
+    calls = []
+    watcher.tree._.subscribe("db.*", calls.append)
+    write(path, json.dumps({"db": {"host": "b", "port": 2}}))
+    watcher.poll()
+    assert len(calls) == 1
+    assert [m.path for m in calls[0]] == ["db.host", "db.port"]
+
+
+def test_bad_file_keeps_last_good_tree(tmp_path, caplog):
+    path = tmp_path / "cfg.json"
+    write(path, '{"a": 1}')
+    watcher = RNS.watch(path, interval=None)
+    write(path, '{"a": ')
+    assert watcher.poll() == []
+    assert watcher.error is not None and "failed" in caplog.text
+    assert watcher.tree.a == 1
+    path.unlink()
+    assert watcher.poll() == []
+    write(path, '{"a": 2}')
+    assert watcher.poll() == ["a"]
+    assert watcher.error is None
+
+
+def test_background_polling(tmp_path):
+    path = tmp_path / "cfg.json"
+    write(path, '{"a": 1}')
+    seen = threading.Event()
+    with RNS.watch(path, interval=0.01, on_change=lambda _: seen.set()) as w:
+        assert isinstance(w, FileWatcher) and w.running
+        write(path, '{"a": 2}')
+        assert seen.wait(5)
+        with w.read() as tree:
+            assert tree.a == 2
+    assert not w.running
+
+
+def test_invalid_interval(tmp_path):
+    path = tmp_path / "cfg.json"
+    write(path, "{}")
+    with pytest.raises(ValueError):
+        RNS.watch(path, interval=0)
+    with pytest.raises(FileNotFoundError):
+        RNS.watch(tmp_path / "missing.json", interval=None)